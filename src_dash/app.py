@@ -1,18 +1,34 @@
 """DS18B20 Arduino 연계 실시간 Dash 웹 애플리케이션 - 리팩토링 버전"""
 
+# 시작 시간 측정 (가장 먼저 import, core/startup_profile.py)
+from core.startup_profile import startup  # isort: skip
+
 import dash
 
 # Core 모듈들
 from core import (
     build_validation_layout,
     cleanup_arduino_resources,
+    collector_address,
     configure_console_encoding,
+    configure_logging,
+    create_delta_function,
+    create_fleet,
+    create_layout_cache,
     create_main_layout,
+    create_range_query_function,
+    create_simulator,
     create_snapshot_function,
+    debug_audits_enabled,
     debug_callback_registration,
     initialize_arduino,
+    initialize_collector_client,
+    instrument_callbacks,
+    mode_scope_audit,
     post_registration_audit,
     print_startup_info,
+    register_metrics_route,
+    register_render_report_route,
     register_shared_callbacks,
 )
 from core.ui_modes import UIMode
@@ -22,20 +38,32 @@ from day_sections.day_callbacks import register_day_callbacks
 # 레이아웃 모듈들
 from day_sections.day_layout import create_layout_v1
 
+startup.mark("imports")
+
 # 앱 초기화
 app = dash.Dash(__name__, suppress_callback_exceptions=True)
+startup.mark("dash app")
 
-# 콘솔 인코딩 설정
+# 콘솔 인코딩 설정 + 로깅 (비동기 출력, 레벨: DASHBOARD_LOG_LEVEL / DASHBOARD_LOG_LEVELS)
 configure_console_encoding()
+configure_logging()
 
-# Arduino 초기화
-arduino_config = initialize_arduino()
+# Arduino 초기화 (DASHBOARD_COLLECTOR 가 있으면 별도 수집기 프로세스의 얇은 클라이언트 사용)
+with startup.phase("arduino"):
+    COLLECTOR_ADDRESS = collector_address()
+    arduino_config = (
+        initialize_collector_client(COLLECTOR_ADDRESS) if COLLECTOR_ADDRESS else initialize_arduino()
+    )
 arduino = arduino_config["arduino"]
 ARDUINO_CONNECTED = arduino_config["connected"]
 INITIAL_PORT_OPTIONS = arduino_config["initial_port_options"]
 selected_port = arduino_config["selected_port"]
 INITIAL_PORT_VALUE = arduino_config["initial_port_value"]
 
+# 추가 보드 (DASHBOARD_FLEET_PORTS 가 있을 때만, 단일 I/O 스레드로 수집 → /metrics 보드별 지표)
+with startup.phase("fleet"):
+    fleet = create_fleet()
+
 # 상수 정의
 COLOR_SEQ = [
     "#2C7BE5",
@@ -49,14 +77,40 @@ COLOR_SEQ = [
 ]
 TH_DEFAULT = 55.0
 TL_DEFAULT = -25.0
+# 그래프 포인트 수가 이 값을 넘으면 WebGL(scattergl) 로 렌더링 (None: 항상 SVG)
+WEBGL_POINT_THRESHOLD = 2000
 
 # 데이터 스냅샷 함수 생성
 arduino_connected_ref = {"connected": ARDUINO_CONNECTED}
-_snapshot = create_snapshot_function(arduino, arduino_connected_ref)
+# 미연결 시 데이터 소스 (센서 수/시드: DASHBOARD_SIM_SENSORS / DASHBOARD_SIM_SEED)
+simulator = create_simulator()
+_snapshot = create_snapshot_function(arduino, arduino_connected_ref, simulator)
+_range_query = create_range_query_function(arduino, arduino_connected_ref, _snapshot, simulator)
+_delta = create_delta_function(arduino, arduino_connected_ref, _snapshot, simulator)
+
+
+# 모드별 정적 레이아웃 트리는 한 번만 생성 (포트 옵션은 각 모드의 포트 새로고침 콜백이 채움)
+def _build_night_layout():
+    from night_sections.night_layout import create_layout_v2
+
+    return create_layout_v2(
+        INITIAL_PORT_OPTIONS, selected_port, INITIAL_PORT_VALUE, th_default=TH_DEFAULT, tl_default=TL_DEFAULT
+    )
+
+
+mode_layouts = create_layout_cache(
+    {
+        UIMode.DAY: lambda: create_layout_v1(INITIAL_PORT_OPTIONS, selected_port, INITIAL_PORT_VALUE),
+        UIMode.NIGHT: _build_night_layout,
+    }
+)
 
 # 앱 레이아웃 설정
-app.layout = create_main_layout(INITIAL_PORT_OPTIONS, selected_port, INITIAL_PORT_VALUE, create_layout_v1)
+app.layout = create_main_layout(
+    INITIAL_PORT_OPTIONS, selected_port, INITIAL_PORT_VALUE, lambda *_ports: mode_layouts(UIMode.DAY)
+)
 app.validation_layout = build_validation_layout()
+startup.mark("layout")
 
 # 간단한 버튼 클릭 테스트 콜백 (비활성화 - 충돌 방지)
 # @app.callback(
@@ -95,7 +149,7 @@ app.validation_layout = build_validation_layout()
 #         return f"❓ 알 수 없는 버튼: {button_id}"
 
 
-# 메인 레이아웃 전환 콜백 (디버그 강화)
+# 메인 레이아웃 전환 콜백
 @app.callback(
     [
         Output("main-content", "children"),
@@ -108,139 +162,55 @@ app.validation_layout = build_validation_layout()
     prevent_initial_call=False,
 )
 def update_main_layout(n1, n2, current_version):
-    print(f"\n{'='*50}")  # 유지: 표현식 포함
-    print("🔍 [LAYOUT_CALLBACK] 레이아웃 전환 콜백 호출됨")
-    print(f"🔍 [LAYOUT_CALLBACK] btn-ver-1 클릭 수: {n1 or 0}")
-    print(f"🔍 [LAYOUT_CALLBACK] btn-ver-2 클릭 수: {n2 or 0}")
-    print(f"🔍 [LAYOUT_CALLBACK] 현재 버전: {current_version}")
-
     ctx = dash.callback_context
-    print(f"🔍 [LAYOUT_CALLBACK] 콜백 컨텍스트: {ctx.triggered}")
-
-    # 트리거된 버튼 확인
-    if not ctx.triggered:
-        button_id = "initial"
-        print("🔍 [LAYOUT_CALLBACK] 초기 로드 - 기본값 사용")
-    else:
-        trigger_info = ctx.triggered[0]
-        button_id = trigger_info["prop_id"].split(".")[0]
-        trigger_value = trigger_info["value"]
-        print(f"🔍 [LAYOUT_CALLBACK] 트리거된 버튼: {button_id}, 값: {trigger_value}")
+    button_id = ctx.triggered[0]["prop_id"].split(".")[0] if ctx.triggered else "initial"
+    print(f"🔍 [LAYOUT_CALLBACK] {button_id} (Day {n1 or 0} / Night {n2 or 0}, 현재 {current_version})")
 
     try:
         # Night 모드 버튼 클릭 처리
         if button_id == "btn-ver-2" and n2 and n2 > 0:
-            print("🌙🌙🌙 [NIGHT_MODE] Night mode 버튼 클릭 감지!")
-            print(f"🌙 [NIGHT_MODE] 클릭 수: {n2}")
-            print("🌙 [NIGHT_MODE] v2 레이아웃 전환 시작...")
-
-            # create_layout_v2 함수 존재 확인
-            try:
-                print("🔍 [NIGHT_MODE] night_sections.night_layout에서 create_layout_v2 import 시도...")
-                from night_sections.night_layout import create_layout_v2
-
-                print("✅ [NIGHT_MODE] create_layout_v2 함수 import 성공!")
-            except ImportError as ie1:
-                print(f"⚠️ [NIGHT_MODE] 첫 번째 import 실패: {ie1}")
-                try:
-                    print("🔍 [NIGHT_MODE] night_layout에서 create_layout_v2 import 시도...")
-                    from .night_sections.night_layout import create_layout_v2
-
-                    print("✅ [NIGHT_MODE] create_layout_v2 함수 import 성공 (대체 경로)!")
-                except ImportError:
-                    print("\n" + "=" * 50)
-                    print("🔍 [LAYOUT_CALLBACK] 레이아웃 전환 콜백 호출됨")
-                    print(f"🔍 [LAYOUT_CALLBACK] btn-ver-1 클릭 수: {n1 if n1 is not None else 0}")
-                    print(f"🔍 [LAYOUT_CALLBACK] btn-ver-2 클릭 수: {n2 if n2 is not None else 0}")
-                    print(f"🔍 [LAYOUT_CALLBACK] 현재 버전: {current_version}")
-                layout_v1 = create_layout_v1(INITIAL_PORT_OPTIONS, selected_port, INITIAL_PORT_VALUE)
-                return layout_v1, UIMode.DAY.value
-
-            # 현재 포트 옵션을 실시간으로 가져오기
-            print("🔍 [NIGHT_MODE] 포트 옵션 가져오는 중...")
             try:
-                from core.arduino_manager import get_current_port_options
-
-                current_port_options, current_default = get_current_port_options()
-                print(f"✅ [NIGHT_MODE] 포트 옵션: {len(current_port_options)}개, 기본값: {current_default}")
-            except Exception as pe:
-                print(f"⚠️ [NIGHT_MODE] 포트 옵션 가져오기 실패: {pe}")
-                current_port_options, current_default = (
-                    INITIAL_PORT_OPTIONS,
-                    selected_port,
-                )
-
-            # v2 레이아웃 생성
-            print("🔍 [NIGHT_MODE] v2 레이아웃 생성 중...")
-            try:
-                layout_v2 = create_layout_v2(
-                    current_port_options,
-                    selected_port or current_default,
-                    current_default,
-                    app,
-                    arduino,
-                    ARDUINO_CONNECTED,
-                    COLOR_SEQ,
-                    TH_DEFAULT,
-                    TL_DEFAULT,
-                    _snapshot,
-                )
-                print("✅✅✅ [NIGHT_MODE] v2 레이아웃 생성 완료!")
-                print("🌙 [NIGHT_MODE] Night 모드로 전환됩니다!")
-                print(f"{'='*50}\n")
-                return (
-                    layout_v2,
-                    UIMode.NIGHT.value,
-                    "🌙 Night 모드 활성화",
-                    f"🌙 Night 버튼이 클릭되었습니다! (클릭 수: {n2})",
-                )
+                layout_v2 = mode_layouts(UIMode.NIGHT, serialized=True)
             except Exception as le:
                 print(f"❌ [NIGHT_MODE] v2 레이아웃 생성 실패: {le}")
                 import traceback
 
                 traceback.print_exc()
                 # 레이아웃 생성 실패 시 Day 모드로 fallback
-                layout_v1 = create_layout_v1(INITIAL_PORT_OPTIONS, selected_port, INITIAL_PORT_VALUE)
                 return (
-                    layout_v1,
+                    mode_layouts(UIMode.DAY, serialized=True),
                     UIMode.DAY.value,
                     "☀️ Day 모드 (오류로 인한 복원)",
                     "❌ Night 모드 오류 발생",
                 )
+            return (
+                layout_v2,
+                UIMode.NIGHT.value,
+                "🌙 Night 모드 활성화",
+                f"🌙 Night 버튼이 클릭되었습니다! (클릭 수: {n2})",
+            )
 
         # Day 모드 버튼 클릭 또는 기본값 처리
-        else:
-            if button_id == "btn-ver-1" and n1 and n1 > 0:
-                print("☀️ [DAY_MODE] Day mode 버튼 클릭 감지!")
-                print(f"☀️ [DAY_MODE] 클릭 수: {n1}")
-            else:
-                print("☀️ [DAY_MODE] 기본 v1 레이아웃 로드")
-
-            print("☀️ [DAY_MODE] v1 레이아웃 생성 중...")
-            layout_v1 = create_layout_v1(INITIAL_PORT_OPTIONS, selected_port, INITIAL_PORT_VALUE)
-            print("✅ [DAY_MODE] v1 레이아웃 생성 완료!")
-            print(f"{'='*50}\n")
-            if button_id == "btn-ver-1" and n1 and n1 > 0:
-                return (
-                    layout_v1,
-                    UIMode.DAY.value,
-                    "☀️ Day 모드 활성화",
-                    f"☀️ Day 버튼이 클릭되었습니다! (클릭 수: {n1})",
-                )
-            else:
-                return (
-                    layout_v1,
-                    UIMode.DAY.value,
-                    "☀️ Day 모드 (기본)",  # plain string
-                    "애플리케이션 시작",  # plain string
-                )
+        layout_v1 = mode_layouts(UIMode.DAY, serialized=True)
+        if button_id == "btn-ver-1" and n1 and n1 > 0:
+            return (
+                layout_v1,
+                UIMode.DAY.value,
+                "☀️ Day 모드 활성화",
+                f"☀️ Day 버튼이 클릭되었습니다! (클릭 수: {n1})",
+            )
+        return (
+            layout_v1,
+            UIMode.DAY.value,
+            "☀️ Day 모드 (기본)",  # plain string
+            "애플리케이션 시작",  # plain string
+        )
 
     except Exception as e:
         print(f"❌ [ERROR] 레이아웃 전환 중 오류: {e}")
         import traceback
 
         traceback.print_exc()
-        print(f"{'='*50}\n")
         # 오류 발생 시 기본 레이아웃 반환
     return (
         create_layout_v1(INITIAL_PORT_OPTIONS, selected_port, INITIAL_PORT_VALUE),
@@ -278,7 +248,9 @@ def update_main_layout(n1, n2, current_version):
 # 클라이언트 사이드 디버깅은 JavaScript 파일에서 처리
 
 # 콜백 등록
-register_shared_callbacks(app, _snapshot, COLOR_SEQ, TH_DEFAULT, TL_DEFAULT)
+register_shared_callbacks(
+    app, _snapshot, COLOR_SEQ, TH_DEFAULT, TL_DEFAULT, _range_query, _delta, WEBGL_POINT_THRESHOLD
+)
 register_day_callbacks(app, arduino, arduino_connected_ref, COLOR_SEQ, TH_DEFAULT, TL_DEFAULT, _snapshot)
 
 # Night 콜백도 앱 시작 시 미리 등록
@@ -293,6 +265,8 @@ try:
         TH_DEFAULT,
         TL_DEFAULT,
         _snapshot,
+        _delta,
+        WEBGL_POINT_THRESHOLD,
     )
     print("✅ Night 콜백 사전 등록 완료")
 except Exception as e:
@@ -300,10 +274,31 @@ except Exception as e:
 
 # 포트 갱신 콜백은 day_callbacks.py에서 처리
 
-# 디버그 정보 출력
-debug_callback_registration(app)
-post_registration_audit(app)
-
+# 모든 서버 콜백 지연시간/호출 수/응답 크기 계측 + 시리얼 수집 지표 → /metrics (Prometheus 텍스트, 로컬 전용)
+callback_metrics = instrument_callbacks(app)
+metric_collectors = [arduino.ingest_metric_lines, arduino.tracer.metric_lines]
+if fleet is not None:
+    metric_collectors.append(fleet.metric_lines)
+register_metrics_route(app, callback_metrics, *metric_collectors)
+# 브라우저 렌더링 완료 보고 (assets/latency_probe.js → 종단 간 지연시간)
+register_render_report_route(app, arduino.tracer)
+startup.mark("callbacks")
+
+# 디버그 점검은 DASHBOARD_DEBUG_AUDIT=1 일 때만 (콜백 목록 출력 + 모드 범위 점검)
+if debug_audits_enabled():
+    with startup.phase("audits"):
+        debug_callback_registration(app)
+        post_registration_audit(app)
+
+        # 모드별 콜백 범위 점검 (다른 모드 전용 tick 콜백이 트리거되면 경고)
+        try:
+            mode_scope_audit(app, {mode: mode_layouts(mode) for mode in UIMode})
+        except Exception as e:
+            print(f"⚠️ 모드 범위 점검 실패: {e}")
+
+startup.finish()
+
+# 개발 실행 (debug). 운영 실행은 src_dash/wsgi.py (waitress/gunicorn, debug 끔, 압축)
 if __name__ == "__main__":
     try:
         print_startup_info(ARDUINO_CONNECTED)
@@ -315,4 +310,6 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"\n❌ 애플리케이션 오류: {e}")
     finally:
+        if fleet is not None:
+            fleet.stop()
         cleanup_arduino_resources(arduino)
@@ -0,0 +1,47 @@
+// 종단 간 지연시간 측정 보고 (core/latency_trace.py)
+// sensor_buffer.merge 가 병합한 cursor 를 기억했다가, 그 뒤 첫 그래프 렌더링이 화면에 반영되면
+// (render_timing.js 의 다음 animation frame) 서버에 {epoch, seq} 를 sendBeacon 으로 보냅니다.
+// 도착 시각은 서버 시계로 기록되므로 브라우저 시계와 무관합니다.
+//
+// 브라우저 콘솔: latencyProbe.stats()   보고 횟수 / 마지막 보고 cursor
+
+(function () {
+    const REPORT_URL = '/trace/render';
+    let pending = null;
+    let reported = null;
+    let reports = 0;
+
+    function send(cursor) {
+        const body = JSON.stringify(cursor);
+        if (navigator.sendBeacon) {
+            navigator.sendBeacon(REPORT_URL, new Blob([body], { type: 'application/json' }));
+        } else {
+            fetch(REPORT_URL, { method: 'POST', body: body, keepalive: true, headers: { 'Content-Type': 'application/json' } });
+        }
+        reports++;
+    }
+
+    (window.renderListeners = window.renderListeners || []).push(function () {
+        if (pending === null) {
+            return;
+        }
+        reported = pending;
+        pending = null;
+        send(reported);
+    });
+
+    window.latencyProbe = {
+        merged: function (epoch, seq) {
+            if (epoch === undefined || seq === undefined || seq === null) {
+                return;
+            }
+            if (reported && reported.epoch === epoch && reported.seq >= seq) {
+                return;
+            }
+            pending = { epoch: epoch, seq: seq };
+        },
+        stats: function () {
+            return { reports: reports, last: reported, pending: pending };
+        },
+    };
+})();
@@ -0,0 +1,85 @@
+// 적응형 새로고침 주기 (interval-component.interval)
+// - 기본 주기: 현재 값이 들어오는 센서 중 가장 짧은 측정 주기 (sensor-intervals-store, 없으면 1초)
+// - 새 데이터 없이 IDLE_AFTER_MS 이상 지나면 유휴 시간의 절반까지 점점 늘림 (최대 IDLE_MAX_MS)
+// - 탭이 숨겨지면 HIDDEN_MS 로 늦추고, 다시 보이면 즉시 기본 주기로 복귀
+// - 버퍼에 새 포인트가 들어오면 즉시 기본 주기로 복귀
+
+(function () {
+    const DEFAULT_SENSOR_MS = 1000;
+    const MIN_PERIOD_MS = 1000;
+    const MAX_BASE_MS = 60000;
+    const IDLE_AFTER_MS = 30000;
+    const IDLE_MAX_MS = 60000;
+    const HIDDEN_MS = 120000;
+    const INTERVAL_ID = 'interval-component';
+
+    let newestSeen = null;
+    let lastDataAt = Date.now();
+    let basePeriod = MIN_PERIOD_MS;
+
+    function prevent() {
+        throw window.dash_clientside.PreventUpdate;
+    }
+
+    function newestTimestamp(buffer) {
+        let newest = null;
+        Object.values((buffer && buffer.series) || {}).forEach((points) => {
+            const t = points.t;
+            if (t.length && (newest === null || t[t.length - 1] > newest)) {
+                newest = t[t.length - 1];
+            }
+        });
+        return newest;
+    }
+
+    // 온도 값이 있는 센서들의 측정 주기 중 최솟값
+    function fastestInterval(intervals, readings) {
+        const active = (readings || []).filter((r) => r[1] !== null && r[1] !== undefined).map((r) => String(r[0]));
+        const ids = active.length ? active : Object.keys(intervals || {});
+        if (!ids.length) {
+            return DEFAULT_SENSOR_MS;
+        }
+        return Math.min(...ids.map((sid) => Number((intervals || {})[sid]) || DEFAULT_SENSOR_MS));
+    }
+
+    function period(now) {
+        if (document.hidden) {
+            return HIDDEN_MS;
+        }
+        const idleFor = now - lastDataAt;
+        if (idleFor < IDLE_AFTER_MS) {
+            return basePeriod;
+        }
+        return Math.round(Math.min(Math.max(basePeriod, idleFor / 2), Math.max(basePeriod, IDLE_MAX_MS)));
+    }
+
+    document.addEventListener('visibilitychange', () => {
+        if (!window.dash_clientside || !window.dash_clientside.set_props) {
+            return;
+        }
+        if (!document.hidden) {
+            lastDataAt = Date.now();
+        }
+        window.dash_clientside.set_props(INTERVAL_ID, { interval: period(Date.now()) });
+    });
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        refresh_rate: {
+            // 버퍼 갱신/측정 주기 변경 시 다음 interval 주기 계산 (변화 없으면 갱신 안 함)
+            adapt: function (buffer, intervals, readings, current) {
+                const now = Date.now();
+                const newest = newestTimestamp(buffer);
+                if (newest !== null && newest !== newestSeen) {
+                    newestSeen = newest;
+                    lastDataAt = now;
+                }
+                basePeriod = Math.min(Math.max(fastestInterval(intervals, readings), MIN_PERIOD_MS), MAX_BASE_MS);
+                const next = period(now);
+                if (next === current) {
+                    prevent();
+                }
+                return next;
+            },
+        },
+    });
+})();
@@ -0,0 +1,116 @@
+// 그래프 렌더링 시간 측정 훅
+// 각 dcc.Graph 의 plotly_beforeplot → plotly_afterplot (plot) 및 다음 animation frame 까지 (frame) 시간을
+// 그래프/trace 종류(scatter, scattergl)별로 기록합니다. SVG ↔ WebGL 전환 효과 확인용.
+//
+// 브라우저 콘솔:
+//   renderTimings.summary()   그래프/trace 종류별 중앙값 표
+//   renderTimings.clear()     기록 초기화
+//   localStorage.renderTimingLog = '1'   매 렌더링마다 콘솔 출력
+//
+// 다른 스크립트는 window.renderListeners 에 함수(graphId, sample)를 넣어 렌더링 완료를 받을 수 있습니다
+// (assets/latency_probe.js).
+
+(function () {
+    const MAX_SAMPLES = 100;
+    const samples = {};
+
+    function median(values) {
+        if (!values.length) {
+            return null;
+        }
+        const sorted = values.slice().sort((a, b) => a - b);
+        const mid = Math.floor(sorted.length / 2);
+        return sorted.length % 2 ? sorted[mid] : (sorted[mid - 1] + sorted[mid]) / 2;
+    }
+
+    function describe(gd) {
+        const data = gd.data || [];
+        const types = new Set(data.map((trace) => trace.type || 'scatter'));
+        const points = data.reduce((sum, trace) => sum + ((trace.x && trace.x.length) || 0), 0);
+        return { type: Array.from(types).sort().join('+') || 'empty', points: points };
+    }
+
+    function record(graphId, sample) {
+        const list = samples[graphId] || (samples[graphId] = []);
+        list.push(sample);
+        if (list.length > MAX_SAMPLES) {
+            list.shift();
+        }
+        if (window.localStorage && window.localStorage.renderTimingLog === '1') {
+            console.log(
+                `[RENDER] ${graphId} ${sample.type} ${sample.points}pt plot=${sample.plot.toFixed(1)}ms frame=${sample.frame.toFixed(1)}ms`
+            );
+        }
+        (window.renderListeners || []).forEach((listener) => listener(graphId, sample));
+    }
+
+    function hook(gd) {
+        if (gd.__renderTimingHooked || typeof gd.on !== 'function') {
+            return;
+        }
+        gd.__renderTimingHooked = true;
+        const graphId = (gd.parentElement && gd.parentElement.id) || gd.id || 'graph';
+        let started = null;
+        // 핸들러가 false 를 반환하면 Plotly 가 렌더링을 취소하므로 반환값 없음
+        gd.on('plotly_beforeplot', () => {
+            started = performance.now();
+        });
+        gd.on('plotly_afterplot', () => {
+            if (started === null) {
+                return;
+            }
+            const begin = started;
+            const plotted = performance.now();
+            started = null;
+            const info = describe(gd);
+            requestAnimationFrame(() => {
+                record(graphId, {
+                    type: info.type,
+                    points: info.points,
+                    plot: plotted - begin,
+                    frame: performance.now() - begin,
+                });
+            });
+        });
+    }
+
+    let scheduled = false;
+    function scan() {
+        scheduled = false;
+        document.querySelectorAll('.js-plotly-plot').forEach(hook);
+    }
+
+    new MutationObserver(() => {
+        if (!scheduled) {
+            scheduled = true;
+            requestAnimationFrame(scan);
+        }
+    }).observe(document.documentElement, { childList: true, subtree: true });
+
+    window.renderTimings = {
+        samples: samples,
+        summary: function () {
+            const rows = [];
+            Object.keys(samples).forEach((graphId) => {
+                const byType = {};
+                samples[graphId].forEach((s) => (byType[s.type] = byType[s.type] || []).push(s));
+                Object.keys(byType).forEach((type) => {
+                    const list = byType[type];
+                    rows.push({
+                        graph: graphId,
+                        type: type,
+                        count: list.length,
+                        points: median(list.map((s) => s.points)),
+                        plot_ms: Number(median(list.map((s) => s.plot)).toFixed(2)),
+                        frame_ms: Number(median(list.map((s) => s.frame)).toFixed(2)),
+                    });
+                });
+            });
+            console.table(rows);
+            return rows;
+        },
+        clear: function () {
+            Object.keys(samples).forEach((graphId) => delete samples[graphId]);
+        },
+    };
+})();
@@ -0,0 +1,260 @@
+// 브라우저 센서 버퍼 + clientside 그래프 렌더링
+// 서버는 sensor-delta-store 에 마지막 cursor 이후 신규 포인트만 보내고 (core/client_sync.py),
+// 여기서 sensor-data-store 의 센서별 버퍼에 병합한 뒤 그래프를 다시 그립니다.
+
+(function () {
+    const SENSOR_COUNT = 8;
+    const NIGHT = 'v2';
+
+    function prevent() {
+        throw window.dash_clientside.PreventUpdate;
+    }
+
+    // epoch ms (서버 로컬 시각을 UTC 로 인코딩) → Plotly 날짜 문자열
+    function toDateStrings(ms) {
+        return ms.map((t) => new Date(t).toISOString().slice(0, 23).replace('T', ' '));
+    }
+
+    function withTitle(layout, text, extra) {
+        return Object.assign({}, layout, extra || {}, { title: { text: text } });
+    }
+
+    function lineTrace(points, name, color) {
+        const trace = { type: 'scatter', mode: 'lines', x: toDateStrings(points.t), y: points.v };
+        if (name !== undefined) {
+            trace.name = name;
+        }
+        if (color) {
+            trace.line = { color: color, width: 2 };
+        }
+        return trace;
+    }
+
+    // figure 포인트 수가 webgl_points 를 넘으면 scattergl 로 전환 (core/figure_templates.webgl_traces 와 동일 규칙)
+    function glTraces(traces, layouts) {
+        const limit = layouts.webgl_points;
+        if (limit === null || limit === undefined) {
+            return traces;
+        }
+        const total = traces.reduce((sum, trace) => sum + trace.x.length, 0);
+        if (total <= limit) {
+            return traces;
+        }
+        return traces.map((trace) => (trace.type === 'scatter' ? Object.assign({}, trace, { type: 'scattergl' }) : trace));
+    }
+
+    function sensorColor(layouts, sid) {
+        const colors = layouts.colors || [];
+        return colors.length ? colors[(sid - 1) % colors.length] : undefined;
+    }
+
+    // threshold-store ({"3": {"TL": .., "TH": ..}}) 에 센서별 값이 있으면 기본 TH/TL 대신 사용
+    function sensorThresholds(layouts, thresholds, sid) {
+        const custom = thresholds && thresholds[String(sid)];
+        return custom ? { th: custom.TH, tl: custom.TL } : { th: layouts.th, tl: layouts.tl };
+    }
+
+    // 레이아웃 shapes[first], shapes[first + 1] 이 TH, TL 선
+    function withThresholdShapes(layout, first, limits) {
+        const shapes = layout.shapes.slice();
+        [limits.th, limits.tl].forEach((y, offset) => {
+            shapes[first + offset] = Object.assign({}, shapes[first + offset], { y0: y, y1: y });
+        });
+        return Object.assign({}, layout, { shapes: shapes });
+    }
+
+    function sortedIds(series) {
+        return Object.keys(series)
+            .filter((k) => series[k].t.length)
+            .map(Number)
+            .sort((a, b) => a - b);
+    }
+
+    // 센서별 보관 정책: 최근 window 초 (최소 min_points, 최대 max_points 개)
+    function trim(points, cutoff, minPoints, maxPoints) {
+        let first = 0;
+        while (first < points.t.length && points.t[first] < cutoff) {
+            first++;
+        }
+        first = Math.min(first, Math.max(0, points.t.length - minPoints));
+        first = Math.max(first, points.t.length - maxPoints);
+        if (first <= 0) {
+            return points;
+        }
+        return { t: points.t.slice(first), v: points.v.slice(first) };
+    }
+
+    function isZoomed(relayout) {
+        if (!relayout || relayout['xaxis.autorange']) {
+            return false;
+        }
+        return (
+            ('xaxis.range[0]' in relayout && 'xaxis.range[1]' in relayout) ||
+            Array.isArray(relayout['xaxis.range'])
+        );
+    }
+
+    function yRange(values, th, tl) {
+        let vmin = Infinity;
+        let vmax = -Infinity;
+        values.forEach((v) => {
+            if (v !== null && v !== undefined) {
+                vmin = Math.min(vmin, v);
+                vmax = Math.max(vmax, v);
+            }
+        });
+        if (vmin === Infinity) {
+            return null;
+        }
+        vmin = Math.min(vmin, tl);
+        vmax = Math.max(vmax, th);
+        if (vmin === vmax) {
+            vmin -= 0.5;
+            vmax += 0.5;
+        }
+        const pad = (vmax - vmin) * 0.1;
+        return [vmin - pad, vmax + pad];
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        sensor_buffer: {
+            // delta 를 버퍼에 병합하고 cursor 를 갱신합니다.
+            merge: function (delta, buffer) {
+                if (!delta) {
+                    prevent();
+                }
+                const reset = delta.reset || !buffer || buffer.epoch !== delta.epoch;
+                const series = reset ? {} : Object.assign({}, buffer.series);
+                let newest = -Infinity;
+                Object.keys(delta.series || {}).forEach((sid) => {
+                    const [t, v] = delta.series[sid];
+                    const old = series[sid] || { t: [], v: [] };
+                    // 겹친 tick 으로 같은 포인트가 다시 오면 건너뜀 (센서별 시각 증가)
+                    const last = old.t.length ? old.t[old.t.length - 1] : -Infinity;
+                    let start = 0;
+                    while (start < t.length && t[start] <= last) {
+                        start++;
+                    }
+                    series[sid] = { t: old.t.concat(t.slice(start)), v: old.v.concat(v.slice(start)) };
+                });
+                Object.keys(series).forEach((sid) => {
+                    const t = series[sid].t;
+                    if (t.length) {
+                        newest = Math.max(newest, t[t.length - 1]);
+                    }
+                });
+                const cutoff = newest - delta.window * 1000;
+                Object.keys(series).forEach((sid) => {
+                    series[sid] = trim(series[sid], cutoff, delta.min_points, delta.max_points);
+                });
+                const next = {
+                    epoch: delta.epoch,
+                    cursor: delta.cursor,
+                    layouts: delta.layouts || (buffer && buffer.layouts) || null,
+                    series: series,
+                };
+                if (window.latencyProbe) {
+                    // 다음 렌더링 완료 시 이 cursor 까지 그려졌다고 서버에 보고 (assets/latency_probe.js)
+                    window.latencyProbe.merged(delta.epoch, delta.cursor);
+                }
+                return [next, { epoch: delta.epoch, seq: delta.cursor }];
+            },
+
+            // Day 모드 전체 그래프 + 센서 상세 그래프
+            day_graphs: function (buffer, detailSensorId, thresholds) {
+                if (!buffer || !buffer.layouts) {
+                    prevent();
+                }
+                const layouts = buffer.layouts;
+                const ids = sortedIds(buffer.series);
+                const mainFig = ids.length
+                    ? {
+                          data: glTraces(
+                              ids.map((sid) => lineTrace(buffer.series[sid], String(sid))),
+                              layouts
+                          ),
+                          layout: withTitle(layouts.main, '실시간 온도 모니터링 (최근 5분)'),
+                      }
+                    : { data: [], layout: withTitle(layouts.main, '데이터 없음') };
+
+                const detailId = parseInt(detailSensorId, 10) || 1;
+                const one = buffer.series[detailId];
+                const detailLayout = withThresholdShapes(layouts.detail, 0, sensorThresholds(layouts, thresholds, detailId));
+                let detailFig;
+                if (one && one.t.length) {
+                    detailFig = {
+                        data: glTraces([lineTrace(one, `센서 ${detailId}`)], layouts),
+                        layout: withTitle(detailLayout, `센서 ${detailId} 상세 그래프`),
+                    };
+                } else if (ids.length) {
+                    detailFig = { data: [], layout: withTitle(detailLayout, `센서 ${detailId} 데이터 없음`) };
+                } else {
+                    detailFig = { data: [], layout: withTitle(detailLayout, '상세 데이터 없음') };
+                }
+                return [mainFig, detailFig];
+            },
+
+            // Night 모드 센서별 미니 그래프 8개
+            mini_graphs: function (buffer, thresholds) {
+                if (!buffer || !buffer.layouts) {
+                    prevent();
+                }
+                const layouts = buffer.layouts;
+                const empty = { data: [], layout: layouts.mini_empty };
+                const figures = [];
+                for (let sid = 1; sid <= SENSOR_COUNT; sid++) {
+                    const points = buffer.series[sid];
+                    if (!points || !points.t.length) {
+                        figures.push(empty);
+                        continue;
+                    }
+                    const limits = sensorThresholds(layouts, thresholds, sid);
+                    const range = yRange(points.v, limits.th, limits.tl);
+                    // mini 레이아웃 shapes: [0선, TH, TL]
+                    let layout = thresholds && thresholds[String(sid)] ? withThresholdShapes(layouts.mini, 1, limits) : layouts.mini;
+                    if (range) {
+                        layout = Object.assign({}, layout, { yaxis: Object.assign({}, layout.yaxis, { range: range }) });
+                    }
+                    const trace = lineTrace(points, undefined, sensorColor(layouts, sid));
+                    figures.push({ data: glTraces([trace], layouts), layout: layout });
+                }
+                return figures;
+            },
+
+            // 임계값 변경 시 상세 그래프 TH/TL 선 y 좌표만 Patch (figure 전체를 다시 만들지 않음)
+            threshold_patch: function (thresholds, detailSensorId, figure) {
+                const detailId = parseInt(detailSensorId, 10) || 1;
+                const custom = thresholds && thresholds[String(detailId)];
+                if (!custom || !figure || !figure.layout || !(figure.layout.shapes || []).length) {
+                    prevent();
+                }
+                const patch = new window.dash_clientside.Patch();
+                [custom.TH, custom.TL].forEach((y, index) => {
+                    patch.assign(['layout', 'shapes', index, 'y0'], y).assign(['layout', 'shapes', index, 'y1'], y);
+                });
+                return patch.build();
+            },
+
+            // 종합 그래프 라이브 구간 (줌/팬 중에는 서버 구간 조회 결과 유지)
+            combined: function (buffer, selected, relayout, uiVersion) {
+                if (!buffer || !buffer.layouts || isZoomed(relayout)) {
+                    prevent();
+                }
+                const layouts = buffer.layouts;
+                const layout = uiVersion === NIGHT ? layouts.combined_night : layouts.combined_day;
+                if (!selected || !selected.length) {
+                    return { data: [], layout: withTitle(layout, '전체 센서 실시간 온도 (센서 선택 없음)') };
+                }
+                const ids = sortedIds(buffer.series);
+                if (!ids.length) {
+                    return { data: [], layout: withTitle(layout, '전체 센서 실시간 온도 (데이터 없음)') };
+                }
+                const wanted = new Set(selected.map(Number));
+                const traces = ids
+                    .filter((sid) => wanted.has(sid))
+                    .map((sid) => lineTrace(buffer.series[sid], `센서 ${sid}`, sensorColor(layouts, sid)));
+                return { data: glTraces(traces, layouts), layout: withTitle(layout, '전체 센서 실시간 온도') };
+            },
+        },
+    });
+})();
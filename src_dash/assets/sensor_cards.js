@@ -0,0 +1,101 @@
+// 센서 카드 clientside 렌더링
+// 서버는 live-readings-store 에 [[센서ID, 온도, 상태, ROM 주소], ...] 배열만 보내고
+// 온도/상태/주소 문자열 포맷은 브라우저에서 모드별로 처리합니다.
+
+(function () {
+    const SENSOR_COUNT = 8;
+    const EMPTY_TEMP = '--°C';
+    const EMPTY_ADDRESS = '----:----:----:----';
+    const DAY = 'v1';
+    const NIGHT = 'v2';
+
+    // 모드별 상태 라벨
+    const STATUS_LABELS = {
+        [DAY]: { ok: '🟢 정상', simulated: '🟡 시뮬레이션', other: (s) => `⚠️ ${s}`, missing: '🔴 연결 없음' },
+        [NIGHT]: { ok: '정상', simulated: '시뮬레이션', other: () => '연결 없음', missing: '연결 없음' },
+    };
+
+    function normalizeMode(value) {
+        if (value === NIGHT || value === 'night' || value === 'Night' || value === 'NIGHT') {
+            return NIGHT;
+        }
+        return DAY;
+    }
+
+    function formatTemperature(reading) {
+        if (!reading || reading[1] === null || reading[1] === undefined) {
+            return EMPTY_TEMP;
+        }
+        return `${Number(reading[1]).toFixed(1)}°C`;
+    }
+
+    function formatStatus(reading, mode) {
+        const labels = STATUS_LABELS[mode];
+        if (!reading) {
+            return labels.missing;
+        }
+        const status = reading[2] || '';
+        if (status === 'ok') {
+            return labels.ok;
+        }
+        if (status === 'simulated') {
+            return labels.simulated;
+        }
+        return labels.other(status);
+    }
+
+    function formatAddress(sensorId, reading) {
+        if (!reading) {
+            return EMPTY_ADDRESS;
+        }
+        let address = reading[3] || '';
+        if (!address && reading[2] === 'simulated') {
+            // 시뮬레이션 모드용 더미 주소
+            const id = String(sensorId).padStart(2, '0');
+            address = `28FF${id}1E${id}16${id}3C`;
+        }
+        if (!address) {
+            return EMPTY_ADDRESS;
+        }
+        return `${address.slice(0, 4)}:${address.slice(4, 8)}:${address.slice(8, 12)}:${address.slice(12, 16)}`;
+    }
+
+    // 센서 카드 24개 출력 (온도 8 + 상태 8 + 주소 8)
+    function cardOutputs(readings, mode) {
+        const bySensor = {};
+        (readings || []).forEach((r) => {
+            bySensor[r[0]] = r;
+        });
+        const temps = [];
+        const statuses = [];
+        const addresses = [];
+        for (let sid = 1; sid <= SENSOR_COUNT; sid++) {
+            const reading = bySensor[sid];
+            temps.push(formatTemperature(reading));
+            statuses.push(formatStatus(reading, mode));
+            addresses.push(formatAddress(sid, reading));
+        }
+        return { temps, statuses, addresses };
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        sensor_cards: {
+            // Day 모드: 온도/상태/주소 24개
+            day: function (readings, uiVersion) {
+                if (normalizeMode(uiVersion) !== DAY || !readings) {
+                    throw window.dash_clientside.PreventUpdate;
+                }
+                const out = cardOutputs(readings, DAY);
+                return out.temps.concat(out.statuses, out.addresses);
+            },
+            // Night 모드: 온도/상태/주소 24개 + 우측 패널 현재 온도 8개
+            night: function (readings, uiVersion) {
+                if (normalizeMode(uiVersion) !== NIGHT || !readings) {
+                    throw window.dash_clientside.PreventUpdate;
+                }
+                const out = cardOutputs(readings, NIGHT);
+                return out.temps.concat(out.statuses, out.addresses, out.temps);
+            },
+        },
+    });
+})();
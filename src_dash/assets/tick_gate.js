@@ -0,0 +1,103 @@
+// 실시간 tick gate (브라우저 탭 = 세션 단위)
+// interval-component 가 1초마다 울려도, 이전 tick 의 서버 응답 → 버퍼 병합(sensor-cursor-store)이
+// 끝나기 전이면 새 tick 을 보내지 않고 건너뜁니다. 느린 기기에서 요청이 줄줄이 쌓여 화면이 점점
+// 뒤처지는 대신, 다음 통과 tick 의 delta 가 cursor 이후 데이터를 모두 가져와 항상 최신 상태를 그립니다.
+//
+// 서버 오류나 PreventUpdate(204)로 delta 가 오지 않으면 병합 완료(done)도 오지 않으므로, 디스패처 요청의
+// 응답을 보고 바로 해제합니다 (failed). 응답 자체가 유실되면 interval 2회분이 지난 뒤 포기합니다 (abandoned).
+//
+// 브라우저 콘솔: tickGate.stats()  → {issued, skipped, completed, failed, abandoned, last_ms, max_ms}
+
+(function () {
+    // 응답이 유실된 tick 은 interval 의 이 배수만큼 지나면 포기하고 다음 tick 을 보냄
+    const STALE_INTERVALS = 2;
+    const DEFAULT_INTERVAL_MS = 1000;
+    // 디스패처 요청 식별 (출력에 sensor-delta-store 가 있는 _dash-update-component 요청)
+    const UPDATE_PATH = '_dash-update-component';
+    const DELTA_OUTPUT = 'sensor-delta-store.data';
+
+    let inflight = null;
+    const stats = { issued: 0, skipped: 0, completed: 0, failed: 0, abandoned: 0, last_ms: null, max_ms: 0 };
+
+    function prevent() {
+        throw window.dash_clientside.PreventUpdate;
+    }
+
+    function release(tick) {
+        if (inflight === tick) {
+            inflight = null;
+            stats.failed++;
+        }
+    }
+
+    function isDispatch(resource, init) {
+        const url = typeof resource === 'string' ? resource : resource && resource.url;
+        return (
+            typeof url === 'string' &&
+            url.indexOf(UPDATE_PATH) !== -1 &&
+            init &&
+            typeof init.body === 'string' &&
+            init.body.indexOf(DELTA_OUTPUT) !== -1
+        );
+    }
+
+    // 렌더러의 콜백 요청을 감싸 200 이 아닌 응답(오류 / 204 PreventUpdate)과 네트워크 오류에서 해제
+    const originalFetch = window.fetch.bind(window);
+    window.fetch = function (resource, init) {
+        const response = originalFetch(resource, init);
+        if (inflight && isDispatch(resource, init)) {
+            const tick = inflight;
+            response.then(
+                function (res) {
+                    if (res.status !== 200) {
+                        release(tick);
+                    }
+                },
+                function () {
+                    release(tick);
+                }
+            );
+        }
+        return response;
+    };
+
+    window.tickGate = {
+        stats: function () {
+            return Object.assign({ inflight: inflight !== null }, stats);
+        },
+    };
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        tick_gate: {
+            // interval → [day-tick-store, night-tick-store] (처리 중인 tick 이 있으면 건너뜀)
+            // 현재 모드 레이아웃에 없는 저장소 출력은 렌더러가 버리므로 그 모드의 tick 콜백만 실행됨
+            gate: function (n, interval) {
+                const now = performance.now();
+                if (inflight) {
+                    if (now - inflight.started < STALE_INTERVALS * (interval || DEFAULT_INTERVAL_MS)) {
+                        stats.skipped++;
+                        prevent();
+                    }
+                    stats.abandoned++;
+                }
+                inflight = { n: n, started: now };
+                stats.issued++;
+                const tick = { n: n, skipped: stats.skipped, last_ms: stats.last_ms };
+                return [tick, tick];
+            },
+
+            // 버퍼 병합 완료 → 처리 중 tick 해제 및 지연시간 기록 (tick-stats-store)
+            done: function () {
+                if (!inflight) {
+                    prevent();
+                }
+                const elapsed = performance.now() - inflight.started;
+                inflight = null;
+                stats.completed++;
+                stats.last_ms = Math.round(elapsed);
+                stats.max_ms = Math.max(stats.max_ms, stats.last_ms);
+                return Object.assign({}, stats);
+            },
+        },
+    });
+})();
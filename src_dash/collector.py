@@ -0,0 +1,84 @@
+"""DS18B20 독립 수집기 프로세스
+
+시리얼 포트/수집/이력을 소유하고 로컬 소켓으로 대시보드에 제공합니다 (core/collector_service.py).
+대시보드를 DASHBOARD_COLLECTOR 와 함께 실행하면 얇은 클라이언트로 동작하며, 웹 프로세스를
+재시작해도 수집은 끊기지 않습니다.
+
+    python -m src_dash.collector                      # 포트 자동 감지, 기본 소켓
+    python -m src_dash.collector --port /dev/ttyACM0 --address /tmp/ds18b20.sock
+    python -m src_dash.collector --shm                # 센서 배열을 공유 메모리 링으로도 게시
+    DASHBOARD_COLLECTOR=1 python src_dash/app.py     # 기본 소켓의 수집기 사용
+"""
+
+import argparse
+import os
+import signal
+import sys
+import threading
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from core.arduino_manager import (  # noqa: E402
+    cleanup_arduino_resources,
+    initialize_arduino,
+    try_arduino_connection,
+)
+from core.collector_service import CollectorServer, collector_address  # noqa: E402
+from core.serial_json_communication import ArduinoSerial  # noqa: E402
+from core.utils import configure_console_encoding  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="DS18B20 독립 수집기")
+    parser.add_argument("--port", help="시리얼 포트 (기본: 자동 감지)")
+    parser.add_argument(
+        "--address", help="소켓 경로 또는 host:port (기본: DASHBOARD_COLLECTOR / 임시 디렉터리)"
+    )
+    parser.add_argument(
+        "--shm",
+        nargs="?",
+        const="",
+        metavar="NAME",
+        help="센서 배열을 공유 메모리 링으로 게시 (웹 워커가 잠금/소켓 없이 읽음, 이름 생략 시 자동)",
+    )
+    args = parser.parse_args(argv)
+    configure_console_encoding()
+
+    if args.port:
+        arduino = ArduinoSerial(port=args.port)
+        try_arduino_connection(arduino)
+    else:
+        arduino = initialize_arduino()["arduino"]
+
+    if args.shm is not None:
+        print(f"🧠 공유 메모리 링 게시: {arduino.enable_shared_ring(args.shm or None)}")
+
+    try:
+        server = CollectorServer(arduino, args.address or collector_address())
+    except (RuntimeError, OSError, ValueError) as e:
+        print(f"❌ 수집기 시작 실패: {e}")
+        arduino.close_shared_ring()
+        cleanup_arduino_resources(arduino)
+        return 1
+
+    def stop(_signum, _frame):
+        # serve_forever 를 실행 중인 스레드에서 shutdown() 을 직접 부르면 교착되므로 별도 스레드
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGINT, stop)
+    if hasattr(signal, "SIGTERM"):
+        signal.signal(signal.SIGTERM, stop)
+    print(f"📡 수집기 실행 중: {server.address} (Ctrl+C 로 종료)")
+    try:
+        server.serve_forever()
+    finally:
+        arduino.close_shared_ring()
+        cleanup_arduino_resources(arduino)
+    print("🛑 수집기 종료")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,30 @@
 """Core 모듈 - 앱의 핵심 기능들"""
 
+# 시작 시간 측정은 다른 core 모듈 import 보다 먼저 시작
+from .startup_profile import startup  # isort: skip
+
 from .app_layout import build_validation_layout, create_main_layout
-from .arduino_manager import cleanup_arduino_resources, initialize_arduino
-from .data_manager import create_snapshot_function
+from .arduino_manager import cleanup_arduino_resources, initialize_arduino, initialize_collector_client
+from .callback_metrics import CallbackMetrics, instrument_callbacks, register_metrics_route
+from .collector_service import collector_address
+from .data_manager import (
+    create_delta_function,
+    create_range_query_function,
+    create_series_function,
+    create_snapshot_function,
+)
+from .fleet_manager import FleetManager, create_fleet
+from .latency_trace import LatencyTracer, register_render_report_route
+from .layout_cache import create_layout_cache
+from .log_config import configure_logging
 from .shared_callbacks import register_shared_callbacks
+from .shm_ring import ShmRingReader, ShmRingWriter
+from .simulation import SensorSimulator, create_simulator
 from .utils import (
     configure_console_encoding,
+    debug_audits_enabled,
     debug_callback_registration,
+    mode_scope_audit,
     post_registration_audit,
     print_startup_info,
 )
@@ -14,12 +32,33 @@ from .utils import (
 __all__ = [
     "initialize_arduino",
     "cleanup_arduino_resources",
+    "initialize_collector_client",
+    "collector_address",
     "create_snapshot_function",
+    "create_range_query_function",
+    "create_series_function",
+    "create_delta_function",
+    "create_layout_cache",
+    "configure_logging",
+    "CallbackMetrics",
+    "instrument_callbacks",
+    "register_metrics_route",
+    "FleetManager",
+    "create_fleet",
+    "LatencyTracer",
+    "register_render_report_route",
+    "ShmRingWriter",
+    "ShmRingReader",
+    "SensorSimulator",
+    "create_simulator",
     "register_shared_callbacks",
     "create_main_layout",
     "build_validation_layout",
     "configure_console_encoding",
+    "debug_audits_enabled",
     "debug_callback_registration",
+    "mode_scope_audit",
     "post_registration_audit",
     "print_startup_info",
+    "startup",
 ]
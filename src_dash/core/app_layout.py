@@ -100,7 +100,14 @@ def create_main_layout(initial_port_options, selected_port, initial_port_value,
             ),
             # Common components that should always be present
             dcc.Interval(id="interval-component", interval=1000, n_intervals=0),
+            # tick gate 통계 (통과한 tick 은 모드 레이아웃 안의 day-/night-tick-store 에 기록)
+            dcc.Store(id="tick-stats-store"),
+            # 브라우저 센서 버퍼 / 서버 delta / 마지막 수신 cursor (core/client_sync.py)
             dcc.Store(id="sensor-data-store"),
+            dcc.Store(id="sensor-delta-store"),
+            dcc.Store(id="sensor-cursor-store"),
+            # 센서 카드 최신값 배열 (clientside 콜백이 카드로 렌더링)
+            dcc.Store(id="live-readings-store"),
             dcc.Store(id="threshold-store", data={}),
             dcc.Store(id="last-command-result"),
             dcc.Store(id="port-options-cache"),
@@ -121,6 +128,9 @@ def build_validation_layout():
             html.Div(id="main-content"),
             dcc.Store(id="ui-version-store"),
             dcc.Interval(id="interval-component"),
+            dcc.Store(id="day-tick-store"),
+            dcc.Store(id="night-tick-store"),
+            dcc.Store(id="tick-stats-store"),
             html.Div(id="connection-status"),
             dcc.Graph(id="temp-graph"),
             html.Div(id="system-log"),
@@ -146,6 +156,10 @@ def build_validation_layout():
             dcc.Input(id="input-th"),
             dcc.Input(id="input-interval"),
             dcc.Store(id="threshold-store"),
+            dcc.Store(id="live-readings-store"),
+            dcc.Store(id="sensor-data-store"),
+            dcc.Store(id="sensor-delta-store"),
+            dcc.Store(id="sensor-cursor-store"),
             dcc.Store(id="last-command-result"),
             dcc.Store(id="sensor-intervals-store"),
             dcc.Store(id="interval-modal-target-sensor"),
@@ -112,9 +112,38 @@ def initialize_arduino():
     }
 
 
+def initialize_collector_client(address):
+    """수집기 프로세스(python -m src_dash.collector) 클라이언트를 arduino 대신 준비합니다.
+
+    반환 형식은 initialize_arduino() 와 같습니다. 수집기가 아직 없어도 앱은 시작하며
+    (시뮬레이션 데이터), 이후 요청 때 다시 연결합니다.
+    """
+    from .collector_client import CollectorClient
+
+    initial_port_options, initial_port_value = get_initial_port_options()
+    client = CollectorClient(address)
+    connected = client.is_healthy()
+    if client.is_connected or connected:
+        print(f"✅ 수집기 연결: {client.address} (포트 {client.port})")
+    else:
+        print(f"⚠️ 수집기 응답 없음 또는 Arduino 미연결: {client.address} - 시뮬레이션 데이터로 시작")
+    return {
+        "arduino": client,
+        "connected": connected,
+        "initial_port_options": initial_port_options,
+        "selected_port": client.port,
+        "initial_port_value": client.port or initial_port_value,
+    }
+
+
 def cleanup_arduino_resources(arduino):
     """Arduino 리소스를 정리합니다."""
     print("🔧 Arduino 리소스 정리 중...")
+    if getattr(arduino, "remote", False):
+        # 수집기 클라이언트: 연결만 닫고 수집기의 시리얼 수집은 계속
+        arduino.close()
+        print("✅ 수집기 연결 종료 (수집은 계속)")
+        return
     try:
         if arduino and hasattr(arduino, "is_connected") and arduino.is_connected:
             arduino.disconnect()
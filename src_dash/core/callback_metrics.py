@@ -0,0 +1,186 @@
+"""Dash 콜백 지연시간/호출 수/응답 크기 계측 + `/metrics` 엔드포인트
+
+`instrument_callbacks(app)` 는 등록이 끝난 app.callback_map 의 서버 콜백마다 Dash 가 만든 실행 래퍼
+(`add_context`, 직렬화된 JSON 응답 문자열을 반환)를 한 번 더 감싸서 다음을 기록합니다.
+
+- 처리 시간 히스토그램 (직렬화 포함) / 콜백 스레드 CPU 시간 합계
+- 결과별 호출 수: ok / prevented (PreventUpdate) / error
+- 응답 본문 크기 히스토그램
+
+`register_metrics_route(app, metrics, *collectors)` 는 Flask 서버에 Prometheus 텍스트 형식(0.0.4)의
+`/metrics` 경로를 추가합니다. collectors 는 추가 지표 줄 목록을 반환하는 함수입니다.
+기본적으로 로컬(loopback) 요청에만 응답하며, DASHBOARD_METRICS_REMOTE=1 이면 원격 수집도 허용합니다.
+
+clientside 콜백(미니 그래프/센서 카드 등)은 서버 비용이 없으므로 대상이 아닙니다
+(브라우저 렌더링 시간은 assets/render_timing.js).
+"""
+
+import functools
+import inspect
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List
+
+from dash.exceptions import PreventUpdate
+
+from .metrics_format import Histogram, format_labels, format_value
+
+METRICS_PATH = "/metrics"
+METRICS_REMOTE_ENV = "DASHBOARD_METRICS_REMOTE"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 히스토그램 구간 상한 (초 / 바이트)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+OUTCOMES = ("ok", "prevented", "error")
+
+_LOOPBACK = ("127.0.0.1", "::1", "localhost")
+
+
+class _CallbackStats:
+    __slots__ = ("latency", "payload", "cpu_seconds", "outcomes")
+
+    def __init__(self):
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.payload = Histogram(BYTES_BUCKETS)
+        self.cpu_seconds = 0.0
+        self.outcomes = dict.fromkeys(OUTCOMES, 0)
+
+
+class CallbackMetrics:
+    """콜백 이름별 지표 저장소 (스레드 안전)"""
+
+    def __init__(self):
+        self._stats: Dict[str, _CallbackStats] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, seconds: float, cpu_seconds: float, outcome: str, nbytes: int = 0) -> None:
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = _CallbackStats()
+            stats.latency.observe(seconds)
+            stats.cpu_seconds += cpu_seconds
+            stats.outcomes[outcome] += 1
+            if outcome == "ok":
+                stats.payload.observe(nbytes)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """콜백별 요약 {이름: {calls, errors, prevented, seconds, cpu_seconds, bytes}}"""
+        with self._lock:
+            return {
+                name: {
+                    "calls": s.latency.count,
+                    "errors": s.outcomes["error"],
+                    "prevented": s.outcomes["prevented"],
+                    "seconds": s.latency.total,
+                    "cpu_seconds": s.cpu_seconds,
+                    "bytes": s.payload.total,
+                }
+                for name, s in self._stats.items()
+            }
+
+    def lines(self) -> List[str]:
+        """Prometheus 텍스트 형식 지표 줄"""
+        with self._lock:
+            items = sorted(self._stats.items())
+            out = [
+                "# HELP dashboard_callback_duration_seconds Dash 콜백 서버 처리 시간 (응답 직렬화 포함)",
+                "# TYPE dashboard_callback_duration_seconds histogram",
+            ]
+            for name, s in items:
+                out.extend(s.latency.lines("dashboard_callback_duration_seconds", {"callback": name}))
+            out += [
+                "# HELP dashboard_callback_cpu_seconds_total Dash 콜백 스레드 CPU 시간",
+                "# TYPE dashboard_callback_cpu_seconds_total counter",
+            ]
+            for name, s in items:
+                labels = format_labels({"callback": name})
+                out.append(f"dashboard_callback_cpu_seconds_total{labels} {format_value(s.cpu_seconds)}")
+            out += [
+                "# HELP dashboard_callback_calls_total Dash 콜백 호출 수 (결과별)",
+                "# TYPE dashboard_callback_calls_total counter",
+            ]
+            for name, s in items:
+                for outcome, n in s.outcomes.items():
+                    labels = format_labels({"callback": name, "outcome": outcome})
+                    out.append(f"dashboard_callback_calls_total{labels} {n}")
+            out += [
+                "# HELP dashboard_callback_response_bytes Dash 콜백 응답 본문 크기",
+                "# TYPE dashboard_callback_response_bytes histogram",
+            ]
+            for name, s in items:
+                out.extend(s.payload.lines("dashboard_callback_response_bytes", {"callback": name}))
+        return out
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+def _instrument(func: Callable, name: str, metrics: CallbackMetrics) -> Callable:
+    @functools.wraps(func)
+    def timed(*args, **kwargs):
+        start, cpu_start = time.perf_counter(), time.thread_time()
+        outcome, nbytes = "error", 0
+        try:
+            response = func(*args, **kwargs)
+            outcome = "ok"
+            if isinstance(response, (str, bytes)):
+                nbytes = len(response.encode("utf-8")) if isinstance(response, str) else len(response)
+            return response
+        except PreventUpdate:
+            outcome = "prevented"
+            raise
+        finally:
+            metrics.observe(
+                name, time.perf_counter() - start, time.thread_time() - cpu_start, outcome, nbytes
+            )
+
+    # 벤치마크 등은 __wrapped__ 로 원래 콜백 함수를 직접 호출함
+    timed.__wrapped__ = getattr(func, "__wrapped__", func)
+    timed._dashboard_metrics = True
+    return timed
+
+
+def instrument_callbacks(app, metrics: CallbackMetrics = None) -> CallbackMetrics:
+    """등록된 모든 서버 콜백에 계측 래퍼를 씌웁니다 (이미 씌운 콜백은 건너뜀).
+
+    모든 콜백 등록이 끝난 뒤 한 번 호출합니다.
+    """
+    metrics = metrics or CallbackMetrics()
+    for cb in app.callback_map.values():
+        func = cb.get("callback")
+        if func is None or getattr(func, "_dashboard_metrics", False):
+            continue  # clientside 콜백 / 이미 계측됨
+        if inspect.iscoroutinefunction(func):
+            continue  # async 콜백 없음 (필요 시 별도 래퍼)
+        cb["callback"] = _instrument(func, func.__name__, metrics)
+    return metrics
+
+
+def _remote_allowed() -> bool:
+    return os.environ.get(METRICS_REMOTE_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def render_metrics(metrics: CallbackMetrics, collectors: Iterable[Callable[[], List[str]]] = ()) -> str:
+    lines = metrics.lines()
+    for collect in collectors:
+        lines.extend(collect())
+    return "\n".join(lines) + "\n"
+
+
+def register_metrics_route(
+    app, metrics: CallbackMetrics, *collectors: Callable[[], List[str]], path=METRICS_PATH
+):
+    """Flask 서버에 Prometheus 수집용 경로를 추가합니다."""
+    from flask import Response, request
+
+    def metrics_view():
+        if not _remote_allowed() and request.remote_addr not in _LOOPBACK:
+            return Response("forbidden\n", status=403, mimetype="text/plain")
+        return Response(render_metrics(metrics, collectors), headers={"Content-Type": CONTENT_TYPE})
+
+    app.server.add_url_rule(path, endpoint="dashboard_metrics", view_func=metrics_view)
+    return metrics_view
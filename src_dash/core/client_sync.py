@@ -0,0 +1,105 @@
+"""브라우저 센서 버퍼 delta 동기화 모듈
+
+브라우저는 `sensor-data-store` 에 센서별 최근 구간 버퍼를 유지하고, 마지막으로 받은 순번을
+`sensor-cursor-store` 에 `{"epoch", "seq"}` 로 보관합니다. 서버는 매 tick 그 cursor 이후의
+신규 포인트만 `sensor-delta-store` 로 보내므로, tick 당 서버 작업량은 창 크기가 아니라
+신규 포인트 수에 비례합니다. 그래프는 assets/sensor_buffer.js 의 clientside 콜백이 다시 그립니다.
+
+payload 형식::
+
+    {"epoch": str, "cursor": int, "reset": bool, "window": 초, "min_points": int, "max_points": int,
+     "series": {"1": [[epoch_ms, ...], [온도 | null, ...]], ...},
+     "layouts": {...}}   # reset 일 때만 (figure 골격 + 색상 + WebGL 전환 기준)
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .figure_templates import (
+    WEBGL_POINT_THRESHOLD,
+    combined_graph_layout,
+    detail_graph_layout,
+    empty_mini_graph_layout,
+    main_graph_layout,
+    mini_graph_layout,
+)
+from .sensor_store import SensorArrays, records_to_arrays
+
+# 브라우저 버퍼 보관 정책 (서버 스냅샷 창과 동일)
+CLIENT_WINDOW_SECONDS = 300
+CLIENT_MIN_POINTS_PER_SENSOR = 2
+CLIENT_MAX_POINTS_PER_SENSOR = 1000
+
+# data_manager.create_delta_function 반환값: (epoch, 최신 순번, 전체 재전송 여부, 센서별 배열)
+SensorDelta = Tuple[str, int, bool, SensorArrays]
+
+
+def snapshot_delta(snapshot: Sequence[Any]) -> SensorDelta:
+    """cursor 없이 스냅샷 구간 전체를 재전송하는 delta (시뮬레이션/하위 호환 경로)"""
+    return "snapshot", 0, True, records_to_arrays(snapshot[3])
+
+
+def parse_cursor(data: Optional[Mapping[str, Any]]) -> Tuple[Optional[str], Optional[int]]:
+    """`sensor-cursor-store` 값을 (epoch, seq) 로 변환 (없거나 잘못되면 (None, None))"""
+    if not isinstance(data, Mapping):
+        return None, None
+    try:
+        return str(data["epoch"]), int(data["seq"])
+    except (KeyError, TypeError, ValueError):
+        return None, None
+
+
+@lru_cache(maxsize=None)
+def _figure_skeletons(
+    th: float, tl: float, color_seq: Tuple[str, ...], webgl_threshold: Optional[int]
+) -> Dict[str, Any]:
+    return {
+        "main": main_graph_layout(th, tl),
+        "detail": detail_graph_layout(th, tl),
+        "combined_day": combined_graph_layout(False),
+        "combined_night": combined_graph_layout(True),
+        "mini": mini_graph_layout(th, tl),
+        "mini_empty": empty_mini_graph_layout(),
+        "th": th,
+        "tl": tl,
+        "colors": list(color_seq),
+        "webgl_points": webgl_threshold,
+    }
+
+
+def figure_skeletons(
+    th: float, tl: float, color_seq: Sequence[str], webgl_threshold: Optional[int] = WEBGL_POINT_THRESHOLD
+) -> Dict[str, Any]:
+    """clientside 렌더링용 figure 레이아웃 골격 (reset 때만 전송, webgl_points 는 scattergl 전환 기준)"""
+    return _figure_skeletons(float(th), float(tl), tuple(color_seq), webgl_threshold)
+
+
+def encode_series(arrays: SensorArrays) -> Dict[str, Any]:
+    """센서별 배열을 JSON 친화 형식으로 변환 (시각은 epoch ms, NaN 은 null)"""
+    encoded = {}
+    for sid, (ts, vals) in arrays.items():
+        if not len(ts):
+            continue
+        ms = np.asarray(ts, dtype="datetime64[ms]").astype(np.int64).tolist()
+        ys = [None if v != v else round(v, 3) for v in np.asarray(vals, dtype=np.float64).tolist()]
+        encoded[str(sid)] = [ms, ys]
+    return encoded
+
+
+def delta_payload(delta: SensorDelta, skeletons: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+    """delta 조회 결과를 `sensor-delta-store` payload 로 만듭니다."""
+    epoch, cursor, reset, arrays = delta
+    payload: Dict[str, Any] = {
+        "epoch": epoch,
+        "cursor": cursor,
+        "reset": reset,
+        "window": CLIENT_WINDOW_SECONDS,
+        "min_points": CLIENT_MIN_POINTS_PER_SENSOR,
+        "max_points": CLIENT_MAX_POINTS_PER_SENSOR,
+        "series": encode_series(arrays),
+    }
+    if skeletons is not None:
+        payload["layouts"] = skeletons
+    return payload
@@ -0,0 +1,320 @@
+"""수집기 프로세스 얇은 클라이언트 (대시보드 쪽)
+
+CollectorClient 는 대시보드 콜백이 쓰는 ArduinoSerial 의 조회/제어 API(is_healthy, get_sensor_delta,
+get_current_temperatures, connect, send_text_command, tracer ...)를 같은 이름으로 제공하고, 실제 처리는
+core/collector_service.CollectorServer 에 요청합니다. app.py 는 DASHBOARD_COLLECTOR 가 설정되면
+ArduinoSerial 대신 이 클라이언트를 `arduino` 로 사용합니다.
+
+수집기에 연결할 수 없으면 조회는 빈 결과/연결 끊김 상태를 돌려주고(대시보드는 시뮬레이션 데이터로 전환),
+RECONNECT_SECONDS 마다 다시 연결을 시도합니다. 요청은 연결 하나를 잠금으로 직렬화합니다
+(로컬 소켓 왕복은 요청당 수십~수백 µs).
+
+수집기가 공유 메모리 링(`collector --shm`)을 게시하면 get_sensor_arrays / get_sensor_delta 는 소켓 대신
+core/shm_ring.ShmRingReader 로 직접 읽습니다 (워커 수와 무관하게 잠금/복사 없음).
+"""
+
+import itertools
+import logging
+import socket
+import threading
+import time
+
+from .collector_protocol import (
+    ERROR,
+    EVENT,
+    REPLY,
+    REQUEST,
+    ProtocolError,
+    encode_frame,
+    parse_address,
+    read_frame,
+)
+from .collector_service import DEFAULT_ADDRESS, read_token, token_path
+from .shm_ring import ShmRingReader
+
+REQUEST_TIMEOUT_SECONDS = 10.0
+RECONNECT_SECONDS = 2.0
+# is_healthy / is_connected / port 조회 캐시 (tick 당 여러 번 호출됨)
+STATUS_CACHE_SECONDS = 0.5
+
+logger = logging.getLogger(__name__)
+
+
+class CollectorUnavailable(Exception):
+    """수집기 연결 실패 / 요청 실패"""
+
+
+def _open(address, timeout, token_file=None):
+    """수집기 연결 (TCP 는 토큰 파일의 토큰으로 인증까지 마침, 실패는 OSError)"""
+    target = parse_address(address)
+    if isinstance(target, tuple):
+        token = read_token(token_file or token_path())
+        sock = socket.create_connection(target, timeout=timeout)
+        try:
+            sock.sendall(encode_frame(REQUEST, {"id": 0, "op": "auth", "args": {"token": token}}))
+            with sock.makefile("rb") as rfile:
+                kind, _message = read_frame(rfile)
+        except (OSError, ProtocolError) as e:
+            sock.close()
+            raise ConnectionError(f"수집기 인증 실패: {e}") from e
+        if kind != REPLY:
+            sock.close()
+            raise PermissionError("수집기 인증 실패 (토큰 불일치)")
+    else:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        sock.connect(target)
+    return sock
+
+
+class _RemoteTracer:
+    """ArduinoSerial.tracer 대용 (렌더링 보고 전달 + /metrics 지연시간 지표)"""
+
+    def __init__(self, client):
+        self._client = client
+
+    def rendered(self, epoch, upto):
+        return self._client._call("rendered", 0, epoch=epoch, seq=upto)
+
+    def metric_lines(self):
+        return []  # 수집기 "metrics" 응답(ingest_metric_lines)에 함께 포함됨
+
+    def summary(self):
+        return self._client.get_latency_summary()
+
+
+class CollectorClient:
+    """ArduinoSerial 대신 쓰는 수집기 프로세스 클라이언트"""
+
+    remote = True
+
+    def __init__(self, address=None, timeout=REQUEST_TIMEOUT_SECONDS, token_file=None):
+        self.address = address or DEFAULT_ADDRESS
+        self.timeout = timeout
+        # TCP 주소일 때 인증 토큰 파일 (기본: DASHBOARD_COLLECTOR_TOKEN_FILE / 홈 디렉터리)
+        self.token_file = token_file
+        self.tracer = _RemoteTracer(self)
+        self._sock = None
+        self._rfile = None
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._retry_at = 0.0
+        self._status = None
+        self._status_at = 0.0
+        self._port = None
+        self._ring = None
+
+    # ---- 요청 ---------------------------------------------------------------
+
+    def _ensure(self):
+        if self._sock is not None:
+            return
+        if time.monotonic() < self._retry_at:
+            raise CollectorUnavailable(f"수집기 재연결 대기: {self.address}")
+        try:
+            self._sock = _open(self.address, self.timeout, self.token_file)
+        except OSError as e:
+            self._retry_at = time.monotonic() + RECONNECT_SECONDS
+            raise CollectorUnavailable(f"수집기 연결 실패: {self.address}: {e}") from e
+        self._rfile = self._sock.makefile("rb")
+        logger.info(f"🔗 수집기 연결: {self.address}")
+
+    def _drop(self):
+        for closeable in (self._rfile, self._sock):
+            try:
+                if closeable is not None:
+                    closeable.close()
+            except OSError:
+                pass
+        self._sock = self._rfile = None
+        self._status = None
+
+    def request(self, op, **args):
+        """요청 1건 → 결과 (연결/프로토콜 오류는 CollectorUnavailable, 수집기 처리 오류는 RuntimeError)"""
+        with self._lock:
+            self._ensure()
+            request_id = next(self._ids)
+            try:
+                self._sock.sendall(encode_frame(REQUEST, {"id": request_id, "op": op, "args": args}))
+                kind, message = read_frame(self._rfile)
+            except (OSError, ProtocolError) as e:
+                self._drop()
+                self._retry_at = time.monotonic() + RECONNECT_SECONDS
+                raise CollectorUnavailable(f"수집기 요청 실패 ({op}): {e}") from e
+        if kind == ERROR:
+            raise RuntimeError(message.get("error"))
+        if kind != REPLY or message.get("id") != request_id:
+            with self._lock:
+                self._drop()
+            raise CollectorUnavailable(f"수집기 응답 순서 오류 ({op})")
+        return message.get("result")
+
+    def _call(self, op, default, **args):
+        try:
+            return self.request(op, **args)
+        except (CollectorUnavailable, RuntimeError) as e:
+            logger.debug(f"수집기 요청 실패 ({op}): {e}")
+            return default
+
+    def close(self):
+        """연결만 닫습니다 (수집기와 시리얼 수집은 계속 실행)."""
+        with self._lock:
+            self._drop()
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
+
+    def ping(self):
+        return self.request("ping")
+
+    # ---- 연결 상태 (ArduinoSerial 호환) ---------------------------------------
+
+    def _cached_status(self):
+        now = time.monotonic()
+        if self._status is None or now - self._status_at > STATUS_CACHE_SECONDS:
+            status = self._call("status", None)
+            self._status = status or {
+                "port": self._port,
+                "is_connected": False,
+                "is_healthy": False,
+                "stats": {},
+            }
+            self._status_at = now
+            if status and self._port is None:
+                self._port = status.get("port")
+        return self._status
+
+    @property
+    def port(self):
+        return self._port if self._port is not None else self._cached_status().get("port")
+
+    @port.setter
+    def port(self, value):
+        self._port = value
+
+    @property
+    def is_connected(self):
+        return bool(self._cached_status().get("is_connected"))
+
+    def is_healthy(self):
+        return bool(self._cached_status().get("is_healthy"))
+
+    def get_connection_stats(self):
+        stats = dict(self._cached_status().get("stats") or {})
+        stats.setdefault("is_connected", False)
+        stats.setdefault("is_healthy", False)
+        stats["collector"] = self.address
+        return stats
+
+    # ---- 제어 ---------------------------------------------------------------
+
+    def connect(self):
+        """수집기가 self.port 로 다시 연결하고 읽기를 시작합니다."""
+        self._status = None
+        return bool(self._call("connect", False, port=self._port))
+
+    def start_reading(self):
+        return self.is_connected  # connect 요청이 읽기 시작까지 수행
+
+    def disconnect(self):
+        self._status = None
+        self._call("disconnect", None)
+
+    def send_command(self, command_dict):
+        return bool(self._call("command", False, command=command_dict))
+
+    def send_text_command(self, line):
+        return bool(self._call("text", False, line=line))
+
+    # ---- 조회 ---------------------------------------------------------------
+
+    def _shared_ring(self):
+        """수집기가 알린 공유 메모리 링 (없거나 붙을 수 없으면 None → 소켓 조회)"""
+        name = self._cached_status().get("shm")
+        ring = self._ring
+        if ring is not None and ring.name == name:
+            return ring
+        if ring is not None:
+            ring.close()
+        self._ring = None
+        if name:
+            try:
+                self._ring = ShmRingReader(name)
+                logger.info(f"🧠 공유 메모리 링 사용: {name}")
+            except (OSError, ValueError) as e:
+                logger.warning(f"공유 메모리 링 연결 실패 ({name}): {e}")
+        return self._ring
+
+    def get_current_temperatures(self):
+        return self._call("latest", {})
+
+    def get_sensor_window(self, seconds=300, min_points_per_sensor=0):
+        return self._call("window", [], seconds=seconds, min_points=min_points_per_sensor)
+
+    def get_sensor_arrays(self, seconds=300, min_points_per_sensor=0):
+        ring = self._shared_ring()
+        if ring is not None:
+            try:
+                return ring.arrays(seconds, min_points_per_sensor)[1]
+            except TimeoutError as e:
+                logger.warning(f"공유 메모리 링 읽기 실패, 소켓으로 조회: {e}")
+        arrays = self._call("arrays", {}, seconds=seconds, min_points=min_points_per_sensor)
+        return {sid: tuple(pair) for sid, pair in arrays.items()}
+
+    def get_sensor_delta(self, epoch=None, since=None, seconds=300, min_points_per_sensor=0):
+        ring = self._shared_ring()
+        if ring is not None:
+            try:
+                return ring.delta(epoch, since, seconds, min_points_per_sensor)
+            except TimeoutError as e:
+                logger.warning(f"공유 메모리 링 읽기 실패, 소켓으로 조회: {e}")
+        result = self._call(
+            "delta", None, epoch=epoch, since=since, seconds=seconds, min_points=min_points_per_sensor
+        )
+        if result is None:
+            return epoch, since or 0, False, {}
+        new_epoch, seq, reset, arrays = result
+        return new_epoch, seq, reset, {sid: tuple(pair) for sid, pair in arrays.items()}
+
+    def query_sensor_range(self, start, end, sensor_ids, width_px=None):
+        args = {"start": start, "end": end, "sensor_ids": list(sensor_ids)}
+        if width_px is not None:
+            args["width_px"] = width_px
+        return {sid: tuple(pair) for sid, pair in self._call("range", {}, **args).items()}
+
+    def get_system_messages(self, count=10):
+        return self._call("messages", [], count=count)
+
+    def get_latency_summary(self):
+        return self._call("latency", {})
+
+    def ingest_metric_lines(self):
+        """/metrics collector: 수집기의 수집 지표 + 종단 간 지연시간 지표"""
+        return self._call("metrics", [])
+
+    # ---- 이벤트 구독 ----------------------------------------------------------
+
+    def events(self, interval=None, seconds=300):
+        """구독 전용 연결로 이벤트 dict 를 계속 yield ({"event": "readings" | "status", ...}).
+
+        연결이 끊기면 CollectorUnavailable 을 발생시킵니다.
+        """
+        args = {"seconds": seconds}
+        if interval is not None:
+            args["interval"] = interval
+        try:
+            sock = _open(self.address, None, self.token_file)
+        except OSError as e:
+            raise CollectorUnavailable(f"수집기 연결 실패: {self.address}: {e}") from e
+        rfile = sock.makefile("rb")
+        try:
+            sock.sendall(encode_frame(REQUEST, {"id": 0, "op": "subscribe", "args": args}))
+            while True:
+                kind, message = read_frame(rfile)
+                if kind == EVENT:
+                    yield message
+        except (OSError, ProtocolError) as e:
+            raise CollectorUnavailable(f"수집기 구독 종료: {e}") from e
+        finally:
+            rfile.close()
+            sock.close()
@@ -0,0 +1,111 @@
+"""수집기(collector) 프로세스 ↔ 대시보드 로컬 통신 프레임 형식
+
+프레임: 헤더(FRAME: 본문 길이 u32, 종류 u8, JSON 길이 u32) + JSON + 바이너리 블롭
+
+- JSON 은 메시지 구조, 블롭은 NumPy 배열 원본 바이트 (센서 배열을 숫자 목록 JSON 으로 만들지 않음)
+- JSON 이 표현하지 못하는 값은 태그 객체로 보냅니다.
+    {"__a": [dtype, offset, nbytes]}  NumPy 배열 (블롭 구간)
+    {"__t": "2024-01-01T00:00:00.123456"}  datetime
+    {"__m": [[key, value], ...]}  문자열이 아닌 키를 가진 dict (센서 ID 정수 키 유지)
+- tuple 은 list 로, Mapping(수집 레코드)은 dict 로, 문자열 Enum 은 값 문자열로 바뀝니다.
+
+pickle 을 쓰지 않으므로 같은 호스트의 다른 프로세스가 보낸 프레임이 코드를 실행할 수 없습니다.
+"""
+
+import json
+import struct
+from collections.abc import Mapping
+from datetime import datetime
+
+import numpy as np
+
+FRAME = struct.Struct("!IBI")
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+REQUEST = 1
+REPLY = 2
+ERROR = 3
+EVENT = 4
+
+
+class ProtocolError(Exception):
+    """잘못된 프레임 / 연결 종료"""
+
+
+def _pack(obj, blobs, offset):
+    if isinstance(obj, np.ndarray):
+        data = np.ascontiguousarray(obj).tobytes()
+        tag = {"__a": [obj.dtype.str, offset[0], len(data)]}
+        blobs.append(data)
+        offset[0] += len(data)
+        return tag
+    if isinstance(obj, datetime):
+        return {"__t": obj.isoformat()}
+    if isinstance(obj, (str, int, float, bool)) or obj is None:
+        return obj
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, Mapping):
+        if all(isinstance(k, str) for k in obj):
+            return {k: _pack(v, blobs, offset) for k, v in obj.items()}
+        return {"__m": [[_pack(k, blobs, offset), _pack(v, blobs, offset)] for k, v in obj.items()]}
+    if isinstance(obj, (list, tuple)):
+        return [_pack(v, blobs, offset) for v in obj]
+    raise TypeError(f"전송할 수 없는 값: {type(obj).__name__}")
+
+
+def _unpack(obj, blob):
+    if isinstance(obj, list):
+        return [_unpack(v, blob) for v in obj]
+    if not isinstance(obj, dict):
+        return obj
+    if len(obj) == 1:
+        if "__a" in obj:
+            dtype, start, nbytes = obj["__a"]
+            return np.frombuffer(blob[start : start + nbytes], dtype=np.dtype(dtype)).copy()
+        if "__t" in obj:
+            return datetime.fromisoformat(obj["__t"])
+        if "__m" in obj:
+            return {_hashable(_unpack(k, blob)): _unpack(v, blob) for k, v in obj["__m"]}
+    return {k: _unpack(v, blob) for k, v in obj.items()}
+
+
+def _hashable(key):
+    return tuple(key) if isinstance(key, list) else key
+
+
+def encode_frame(kind: int, message) -> bytes:
+    blobs = []
+    head = json.dumps(_pack(message, blobs, [0]), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    body_len = len(head) + sum(len(b) for b in blobs)
+    if body_len > MAX_FRAME_BYTES:
+        raise ProtocolError(f"프레임이 너무 큼: {body_len} 바이트")
+    return b"".join([FRAME.pack(body_len, kind, len(head)), head, *blobs])
+
+
+def _read_exact(stream, n: int) -> bytes:
+    data = stream.read(n)
+    if data is None or len(data) < n:
+        raise ProtocolError("연결 종료")
+    return data
+
+
+def read_frame(stream):
+    """stream(소켓 makefile("rb")) 에서 프레임 1개 → (종류, 메시지)"""
+    body_len, kind, head_len = FRAME.unpack(_read_exact(stream, FRAME.size))
+    if body_len > MAX_FRAME_BYTES or head_len > body_len:
+        raise ProtocolError(f"잘못된 프레임 길이: {body_len}/{head_len}")
+    body = _read_exact(stream, body_len)
+    try:
+        message = json.loads(body[:head_len].decode("utf-8"))
+    except ValueError as e:
+        raise ProtocolError(f"잘못된 프레임 JSON: {e}") from e
+    return kind, _unpack(message, memoryview(body)[head_len:])
+
+
+def parse_address(address: str):
+    """ "host:port" → (host, port) TCP 주소, 그 외 → Unix 소켓 경로"""
+    host, sep, port = address.rpartition(":")
+    if sep and port.isdigit() and "/" not in address and "\\" not in address:
+        return host or "127.0.0.1", int(port)
+    return address
@@ -0,0 +1,299 @@
+"""독립 수집기(collector) 프로세스 서버
+
+시리얼 포트/수집/이력(ArduinoSerial)을 웹 프로세스 밖에서 소유하고, 로컬 소켓으로 조회/제어 요청과
+이벤트 구독을 제공합니다 (프레임 형식: core/collector_protocol.py). 웹 프로세스가 느린 콜백이나
+재시작으로 멈춰도 수집은 계속됩니다. 대시보드 쪽은 core/collector_client.CollectorClient 를
+ArduinoSerial 대신 사용합니다.
+
+주소는 Unix 도메인 소켓 경로(기본, 소유자만 접근 0600)이며, AF_UNIX 가 없는 환경(Windows)에서는
+"127.0.0.1:포트" TCP 로 대신합니다. 실행: `python -m src_dash.collector`
+
+TCP 는 같은 호스트의 다른 사용자도 접속할 수 있으므로
+
+- 루프백 주소(127.0.0.1, ::1, localhost)에만 바인드하고,
+- 시작할 때 소유자 전용 토큰 파일(DASHBOARD_COLLECTOR_TOKEN_FILE, 기본 ~/.ds18b20-collector-token)에
+  새 토큰을 쓰며, 연결마다 첫 요청 "auth" 로 그 토큰을 확인한 뒤에만 요청을 처리합니다.
+"""
+
+import hmac
+import ipaddress
+import logging
+import os
+import secrets
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+
+from .collector_protocol import (
+    ERROR,
+    EVENT,
+    REPLY,
+    REQUEST,
+    ProtocolError,
+    encode_frame,
+    parse_address,
+    read_frame,
+)
+
+COLLECTOR_ENV = "DASHBOARD_COLLECTOR"
+HAS_UNIX_SOCKET = hasattr(socket, "AF_UNIX")
+DEFAULT_ADDRESS = (
+    os.path.join(tempfile.gettempdir(), "ds18b20-collector.sock") if HAS_UNIX_SOCKET else "127.0.0.1:8766"
+)
+SUBSCRIBE_INTERVAL_SECONDS = 0.2
+TOKEN_ENV = "DASHBOARD_COLLECTOR_TOKEN_FILE"
+DEFAULT_TOKEN_FILE = os.path.join(os.path.expanduser("~"), ".ds18b20-collector-token")
+# Unix 소켓 생성 시 umask (bind 순간부터 소유자만 읽기/쓰기 = 0600)
+SOCKET_UMASK = 0o177
+
+logger = logging.getLogger(__name__)
+
+
+def collector_address():
+    """DASHBOARD_COLLECTOR 값 → 주소 (없으면 None = 수집기 미사용, "1" 이면 기본 주소)"""
+    value = os.environ.get(COLLECTOR_ENV, "").strip()
+    if not value or value.lower() in ("0", "false", "no", "off"):
+        return None
+    return DEFAULT_ADDRESS if value.lower() in ("1", "true", "yes", "on") else value
+
+
+def token_path():
+    """TCP 인증 토큰 파일 경로 (DASHBOARD_COLLECTOR_TOKEN_FILE, 없으면 홈 디렉터리)"""
+    return os.environ.get(TOKEN_ENV, "").strip() or DEFAULT_TOKEN_FILE
+
+
+def write_token(path) -> str:
+    """새 토큰을 소유자 전용(0600) 파일로 쓰고 반환"""
+    token = secrets.token_hex(32)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(token)
+    os.replace(tmp, path)
+    return token
+
+
+def read_token(path) -> str:
+    """토큰 파일 읽기 (POSIX 에서 다른 사용자 소유이거나 그룹/기타 권한이 있으면 PermissionError)"""
+    st = os.stat(path)
+    if os.name == "posix" and (st.st_uid != os.getuid() or st.st_mode & 0o077):
+        raise PermissionError(f"토큰 파일은 소유자 전용(0600)이어야 합니다: {path}")
+    with open(path) as f:
+        return f.read().strip()
+
+
+def is_loopback(host) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def authenticate(self, token) -> bool:
+        """첫 프레임이 올바른 토큰의 "auth" 요청이면 True (아니면 오류 응답 후 연결 종료)"""
+        try:
+            kind, message = read_frame(self.rfile)
+        except (ProtocolError, OSError):
+            return False
+        ok = (
+            kind == REQUEST
+            and isinstance(message, dict)
+            and message.get("op") == "auth"
+            and hmac.compare_digest(str((message.get("args") or {}).get("token", "")), token)
+        )
+        request_id = message.get("id") if isinstance(message, dict) else None
+        try:
+            if ok:
+                self.wfile.write(encode_frame(REPLY, {"id": request_id, "result": True}))
+            else:
+                self.wfile.write(encode_frame(ERROR, {"id": request_id, "error": "수집기 인증 실패"}))
+        except OSError:
+            return False
+        return ok
+
+    def handle(self):
+        service = self.server.service
+        if service.token is not None and not self.authenticate(service.token):
+            return
+        while not service.stopping.is_set():
+            try:
+                kind, message = read_frame(self.rfile)
+            except (ProtocolError, OSError):
+                return
+            if kind != REQUEST or not isinstance(message, dict):
+                return
+            try:
+                if message.get("op") == "subscribe":
+                    service.stream_events(self.wfile, message.get("args") or {})
+                    return
+                self.wfile.write(service.dispatch(message))
+            except OSError:
+                return
+
+
+class _UnixServer(
+    socketserver.ThreadingMixIn, getattr(socketserver, "UnixStreamServer", socketserver.TCPServer)
+):
+    daemon_threads = True
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class CollectorServer:
+    """ArduinoSerial 을 소유하고 로컬 소켓 요청을 처리하는 수집기 서버"""
+
+    def __init__(self, arduino, address=None, token_file=None):
+        self.arduino = arduino
+        self.address = address or DEFAULT_ADDRESS
+        self.started = time.time()
+        self.stopping = threading.Event()
+        self._connect_lock = threading.Lock()
+        self._thread = None
+        self.token = None
+        self.token_file = None
+        target = parse_address(self.address)
+        if isinstance(target, tuple):
+            if not is_loopback(target[0]):
+                raise ValueError(f"수집기 TCP 주소는 루프백만 허용합니다: {self.address}")
+            self._server = _TCPServer(target, _Handler)
+            self.token_file = token_file or token_path()
+            self.token = write_token(self.token_file)
+        else:
+            self._remove_stale_socket(target)
+            old_umask = os.umask(SOCKET_UMASK)
+            try:
+                self._server = _UnixServer(target, _Handler)
+            finally:
+                os.umask(old_umask)
+        self._server.service = self
+        a = arduino
+        self.ops = {
+            "ping": lambda: {"pid": os.getpid(), "uptime_seconds": time.time() - self.started},
+            "status": self.status,
+            "latest": a.get_current_temperatures,
+            "window": lambda seconds=300, min_points=0: a.get_sensor_window(seconds, min_points),
+            "arrays": lambda seconds=300, min_points=0: a.get_sensor_arrays(seconds, min_points),
+            "delta": lambda epoch=None, since=None, seconds=300, min_points=0: a.get_sensor_delta(
+                epoch, since, seconds, min_points
+            ),
+            "range": lambda start, end, sensor_ids, width_px=None: (
+                a.query_sensor_range(start, end, sensor_ids)
+                if width_px is None
+                else a.query_sensor_range(start, end, sensor_ids, width_px)
+            ),
+            "messages": lambda count=10: a.get_system_messages(count),
+            "connect": self.connect,
+            "disconnect": a.disconnect,
+            "command": lambda command: a.send_command(command),
+            "text": lambda line: a.send_text_command(line),
+            "metrics": lambda: a.ingest_metric_lines() + a.tracer.metric_lines(),
+            "latency": a.get_latency_summary,
+            "rendered": lambda epoch, seq: a.tracer.rendered(epoch, seq),
+        }
+
+    @staticmethod
+    def _remove_stale_socket(path):
+        if not os.path.exists(path):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except OSError:
+            os.unlink(path)  # 이전 수집기가 남긴 소켓 파일
+            return
+        finally:
+            probe.close()
+        raise RuntimeError(f"수집기가 이미 실행 중입니다: {path}")
+
+    # ---- 요청 처리 ----------------------------------------------------------
+
+    def status(self):
+        a = self.arduino
+        return {
+            "port": a.port,
+            "is_connected": a.is_connected,
+            "is_healthy": a.is_healthy(),
+            "stats": a.get_connection_stats(),
+            # 공유 메모리 링 이름 (있으면 같은 호스트의 클라이언트가 배열 조회를 소켓 없이 직접 읽음)
+            "shm": getattr(getattr(a, "publisher", None), "name", None),
+        }
+
+    def connect(self, port=None):
+        """포트(기본: 현재 포트)로 다시 연결하고 읽기 시작"""
+        a = self.arduino
+        with self._connect_lock:
+            if a.is_connected:
+                a.disconnect()
+            if port:
+                a.port = port
+            return bool(a.connect() and a.start_reading())
+
+    def dispatch(self, message) -> bytes:
+        request_id = message.get("id")
+        op = self.ops.get(message.get("op"))
+        if op is None:
+            return encode_frame(ERROR, {"id": request_id, "error": f"알 수 없는 요청: {message.get('op')}"})
+        try:
+            result = op(**(message.get("args") or {}))
+            return encode_frame(REPLY, {"id": request_id, "result": result})
+        except Exception as e:  # 요청 오류는 연결을 끊지 않고 오류 프레임으로 응답
+            logger.warning(f"수집기 요청 실패 ({message.get('op')}): {e}")
+            return encode_frame(ERROR, {"id": request_id, "error": str(e)})
+
+    def stream_events(self, wfile, args) -> None:
+        """구독: 새 측정값(readings) / 연결 상태(status) 이벤트를 interval 마다 전송 (연결이 끊기면 종료)"""
+        interval = float(args.get("interval", SUBSCRIBE_INTERVAL_SECONDS))
+        seconds = args.get("seconds", 300)
+        epoch = since = None
+        last_status = None
+        a = self.arduino
+        while not self.stopping.is_set():
+            new_epoch, seq, reset, series = a.get_sensor_delta(epoch, since, seconds, mark_served=False)
+            if reset or series:
+                wfile.write(
+                    encode_frame(
+                        EVENT,
+                        {
+                            "event": "readings",
+                            "epoch": new_epoch,
+                            "cursor": seq,
+                            "reset": reset,
+                            "series": series,
+                        },
+                    )
+                )
+            epoch, since = new_epoch, seq
+            status = {"is_connected": a.is_connected, "is_healthy": a.is_healthy()}
+            if status != last_status:
+                wfile.write(encode_frame(EVENT, {"event": "status", **status}))
+                last_status = status
+            self.stopping.wait(interval)
+
+    # ---- 실행 ---------------------------------------------------------------
+
+    def serve_forever(self) -> None:
+        logger.info(f"📡 수집기 대기: {self.address}")
+        self._server.serve_forever(poll_interval=0.2)
+
+    def start(self) -> None:
+        """백그라운드 스레드에서 서비스 시작 (테스트/내장용)"""
+        self._thread = threading.Thread(target=self.serve_forever, name="collector", daemon=True)
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        self.stopping.set()
+        self._server.shutdown()
+        self._server.server_close()
+        target = parse_address(self.address)
+        if not isinstance(target, tuple) and os.path.exists(target):
+            os.unlink(target)
+        if self.token_file is not None and os.path.exists(self.token_file):
+            os.unlink(self.token_file)
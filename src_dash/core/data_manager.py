@@ -1,14 +1,21 @@
 """데이터 스냅샷 및 시뮬레이션 관리 모듈"""
 
 import datetime
-import random
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
-# Number of latest sensor data records to retrieve
-SNAPSHOT_SIZE = 50
+from .client_sync import SensorDelta, parse_cursor, snapshot_delta
+from .range_query import DEFAULT_PLOT_WIDTH_PX, RangeQueryEngine, SeriesMap
+from .sensor_store import SensorArrays, records_to_arrays
+from .simulation import SensorSimulator
 
+# 스냅샷 시간 창(초) 및 센서별 최소 포인트 수 (측정 주기가 긴 센서 보호)
+SNAPSHOT_WINDOW_SECONDS = 300
+SNAPSHOT_MIN_POINTS_PER_SENSOR = 2
 
-def create_snapshot_function(arduino: Any, arduino_connected_ref: Dict[str, bool]) -> Callable[
+
+def create_snapshot_function(
+    arduino: Any, arduino_connected_ref: Dict[str, bool], simulator: Optional[SensorSimulator] = None
+) -> Callable[
     [],
     Tuple[
         str,
@@ -19,6 +26,11 @@ def create_snapshot_function(arduino: Any, arduino_connected_ref: Dict[str, bool
     ],
 ]:
     """스냅샷 함수를 생성합니다.
+
+    연결이 끊긴 동안에는 simulator(core.simulation.SensorSimulator, 없으면 기본 설정으로 생성)를
+    현재 시각까지 진행시켜 그 수집 저장소에서 조회합니다.
+    with_history=False 로 호출하면 연결 상태에서 그래프용 레코드(latest_data) 조회를 생략합니다
+    (그래프는 series 함수의 센서별 배열을 사용하는 디스패처 콜백용).
     Returns:
         Callable that returns a tuple of (
             connection_status: str,
@@ -28,8 +40,10 @@ def create_snapshot_function(arduino: Any, arduino_connected_ref: Dict[str, bool
             system_messages: List[Dict[str, Any]]
         )
     """
+    if simulator is None:
+        simulator = SensorSimulator()
 
-    def snapshot() -> Tuple[
+    def snapshot(with_history: bool = True) -> Tuple[
         str,
         Dict[str, Any],
         Dict[int, Dict[str, Any]],
@@ -61,7 +75,13 @@ def create_snapshot_function(arduino: Any, arduino_connected_ref: Dict[str, bool
                 "color": "green",
             }
             current_temps = arduino.get_current_temperatures()
-            latest_data = arduino.get_latest_sensor_data(count=SNAPSHOT_SIZE)
+            latest_data = (
+                arduino.get_sensor_window(
+                    seconds=SNAPSHOT_WINDOW_SECONDS, min_points_per_sensor=SNAPSHOT_MIN_POINTS_PER_SENSOR
+                )
+                if with_history
+                else []
+            )
             system_messages = arduino.get_system_messages(count=10)
             print(f"🔍 실제 데이터 사용: 현재온도={len(current_temps)}개, 최신데이터={len(latest_data)}개")
         else:
@@ -74,32 +94,15 @@ def create_snapshot_function(arduino: Any, arduino_connected_ref: Dict[str, bool
                 "borderRadius": "5px",
                 "color": "red",
             }
-            current_temps = {
-                i: {
-                    "temperature": round(20 + random.uniform(-5, 15), 1),
-                    "status": "simulated",
-                    "address": f"28FF{i:02d}1E{i:02d}16{i:02d}3C",  # 시뮬레이션용 더미 주소
-                }
-                for i in range(1, 5)
-            }
-            times = [datetime.datetime.now() - datetime.timedelta(seconds=i) for i in range(30, 0, -1)]
-            latest_data = []
-            for t in times:
-                for sid in range(1, 5):
-                    latest_data.append(
-                        {
-                            "timestamp": t,
-                            "sensor_id": sid,
-                            "temperature": 20 + random.uniform(-5, 15),
-                        }
-                    )
-            system_messages = [
-                {
-                    "timestamp": datetime.datetime.now(),
-                    "message": "Simulation mode active",
-                    "level": "warning",
-                }
-            ]
+            current_temps = simulator.get_current_temperatures()
+            latest_data = (
+                simulator.get_sensor_window(
+                    seconds=SNAPSHOT_WINDOW_SECONDS, min_points_per_sensor=SNAPSHOT_MIN_POINTS_PER_SENSOR
+                )
+                if with_history
+                else []
+            )
+            system_messages = simulator.get_system_messages(count=10)
 
         return (
             connection_status,
@@ -110,3 +113,88 @@ def create_snapshot_function(arduino: Any, arduino_connected_ref: Dict[str, bool
         )
 
     return snapshot
+
+
+def create_range_query_function(
+    arduino: Any,
+    arduino_connected_ref: Dict[str, bool],
+    snapshot_func: Callable[..., Any],
+    simulator: Optional[SensorSimulator] = None,
+) -> Callable[[datetime.datetime, datetime.datetime, Iterable[int], int], SeriesMap]:
+    """줌/팬 구간 조회 함수를 생성합니다.
+
+    연결 상태면 Arduino 수집 버퍼(raw + 롤업)에서, 시뮬레이션 모드면 simulator 수집 저장소
+    (없으면 스냅샷 데이터)에서 조회합니다.
+    """
+    sim_engine = RangeQueryEngine()
+
+    def query_range(
+        start: datetime.datetime,
+        end: datetime.datetime,
+        sensor_ids: Iterable[int],
+        width_px: int = DEFAULT_PLOT_WIDTH_PX,
+    ) -> SeriesMap:
+        if arduino_connected_ref.get("connected", False) and arduino.is_healthy():
+            return arduino.query_sensor_range(start, end, sensor_ids, width_px)
+        if simulator is not None:
+            return simulator.query_sensor_range(start, end, sensor_ids, width_px)
+        _, _, _current_temps, latest_data, _msgs = snapshot_func()
+        return sim_engine.query(latest_data, None, start, end, sensor_ids, width_px)
+
+    return query_range
+
+
+def create_series_function(
+    arduino: Any,
+    arduino_connected_ref: Dict[str, bool],
+    snapshot_func: Callable[..., Any],
+    simulator: Optional[SensorSimulator] = None,
+) -> Callable[..., SensorArrays]:
+    """그래프용 센서별 (시각, 온도) NumPy 배열 조회 함수를 생성합니다.
+
+    연결 상태면 수집 저장소의 센서별 배열을 그대로 사용하고 (DataFrame 변환 없음),
+    시뮬레이션 모드면 simulator 저장소의 배열을, simulator 가 없으면 스냅샷 레코드를 센서별로 묶어 반환합니다.
+    이미 가져온 스냅샷을 snapshot 으로 넘기면 시뮬레이션 모드에서 재사용합니다 (tick 당 1회).
+    """
+
+    def series(
+        seconds: float = SNAPSHOT_WINDOW_SECONDS, snapshot: Optional[Tuple[Any, ...]] = None
+    ) -> SensorArrays:
+        if arduino_connected_ref.get("connected", False) and arduino.is_healthy():
+            return arduino.get_sensor_arrays(seconds, SNAPSHOT_MIN_POINTS_PER_SENSOR)
+        if simulator is not None:
+            return simulator.get_sensor_arrays(seconds, SNAPSHOT_MIN_POINTS_PER_SENSOR)
+        _, _, _current_temps, latest_data, _msgs = snapshot if snapshot is not None else snapshot_func()
+        return records_to_arrays(latest_data)
+
+    return series
+
+
+def create_delta_function(
+    arduino: Any,
+    arduino_connected_ref: Dict[str, bool],
+    snapshot_func: Callable[..., Any],
+    simulator: Optional[SensorSimulator] = None,
+) -> Callable[..., SensorDelta]:
+    """브라우저 버퍼 동기화용 delta 조회 함수를 생성합니다.
+
+    연결 상태면 Arduino, 시뮬레이션 모드면 simulator 저장소에서 cursor(`sensor-cursor-store` 값)
+    이후의 신규 포인트만 반환합니다. simulator 가 없으면 매번 스냅샷 구간 전체를 재전송(reset)합니다.
+    연결/시뮬레이션 전환 시에는 저장소 epoch 가 달라 브라우저 버퍼가 전체 재전송으로 초기화됩니다.
+    snapshot 인자는 호환용으로만 받습니다 (디스패처는 with_history=False 스냅샷을 넘기므로 재사용하지 않음).
+    """
+
+    def delta(
+        cursor: Optional[Dict[str, Any]] = None, snapshot: Optional[Tuple[Any, ...]] = None
+    ) -> SensorDelta:
+        if arduino_connected_ref.get("connected", False) and arduino.is_healthy():
+            source = arduino
+        elif simulator is not None:
+            source = simulator
+        else:
+            # 디스패처 스냅샷에는 그래프 구간이 없으므로 구간 포함 스냅샷을 다시 조회
+            return snapshot_delta(snapshot_func())
+        epoch, since = parse_cursor(cursor)
+        return source.get_sensor_delta(epoch, since, SNAPSHOT_WINDOW_SECONDS, SNAPSHOT_MIN_POINTS_PER_SENSOR)
+
+    return delta
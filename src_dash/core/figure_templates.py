@@ -0,0 +1,186 @@
+"""그래프 figure 골격(skeleton) 템플릿 모듈
+
+매 tick 마다 `px.line` / `go.Figure` + `add_hline` / `update_layout` 를 호출하면 Plotly 검증 비용이
+콜백 시간 대부분을 차지합니다. 레이아웃(다크/라이트 템플릿, 임계선 shape, 축 설정)은 처음 한 번만
+plain dict 로 만들어 캐시하고, 갱신 시에는 trace 의 x/y 배열만 채워 dict figure 를 반환합니다.
+
+반환되는 레이아웃 dict 는 여러 응답이 공유하므로 수정하지 말고 `with_layout()` 으로 덮어씁니다.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence
+
+THEME_DARK = "plotly_dark"
+THEME_LIGHT = "plotly_white"
+
+# figure 전체 포인트 수가 이 값을 넘으면 WebGL(scattergl) 로 렌더링합니다.
+# SVG scatter 는 수만 포인트부터 브라우저 렌더링이 병목이 되고, 페이지당 WebGL 컨텍스트 수는
+# 제한되므로(브라우저별 ~16개) 작은 그래프는 SVG 로 둡니다.
+WEBGL_POINT_THRESHOLD = 2000
+
+Figure = Dict[str, Any]
+
+
+@lru_cache(maxsize=None)
+def _template(name: str) -> Dict[str, Any]:
+    """Plotly 기본 템플릿을 plain dict 로 한 번만 변환합니다."""
+    import plotly.io as pio
+
+    return pio.templates[name].to_plotly_json()
+
+
+def hline_shape(y: float, color: str, dash: str = "dash", width: Optional[float] = None) -> Dict[str, Any]:
+    """`fig.add_hline` 과 동일한 가로선 shape"""
+    line: Dict[str, Any] = {"color": color, "dash": dash}
+    if width is not None:
+        line["width"] = width
+    return {"type": "line", "xref": "x domain", "x0": 0, "x1": 1, "yref": "y", "y0": y, "y1": y, "line": line}
+
+
+def hline_annotation(y: float, text: str, position: str = "top left") -> Dict[str, Any]:
+    """`add_hline(annotation_text=..., annotation_position=...)` 과 동일한 라벨"""
+    return {
+        "text": text,
+        "showarrow": False,
+        "xref": "x domain",
+        "x": 0,
+        "xanchor": "left",
+        "yref": "y",
+        "y": y,
+        "yanchor": "bottom" if position.startswith("top") else "top",
+    }
+
+
+def line_trace(
+    x: Any, y: Any, name: Optional[str] = None, color: Optional[str] = None, width: float = 2
+) -> Dict[str, Any]:
+    """선 trace dict (x/y 는 NumPy 배열/리스트 그대로 사용)"""
+    trace: Dict[str, Any] = {"type": "scatter", "mode": "lines", "x": x, "y": y}
+    if name is not None:
+        trace["name"] = name
+    if color is not None:
+        trace["line"] = {"color": color, "width": width}
+    return trace
+
+
+def webgl_traces(traces: Sequence[Dict[str, Any]], threshold: Optional[int] = WEBGL_POINT_THRESHOLD) -> list:
+    """포인트 수가 threshold 를 넘으면 선 trace 를 scattergl 로 바꿉니다 (색상/hover/임계선 shape 동일).
+
+    threshold 가 None 이면 항상 SVG 를 사용합니다. assets/sensor_buffer.js 의 glTraces 와 같은 규칙입니다.
+    """
+    traces = list(traces)
+    if threshold is None or sum(len(t["x"]) for t in traces) <= threshold:
+        return traces
+    return [{**t, "type": "scattergl"} if t.get("type") == "scatter" else t for t in traces]
+
+
+def with_layout(layout: Dict[str, Any], **overrides: Any) -> Dict[str, Any]:
+    """공유 레이아웃을 변경하지 않고 일부 키만 덮어쓴 얕은 복사본을 반환합니다."""
+    merged = dict(layout)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = {**merged[key], **value}
+        else:
+            merged[key] = value
+    return merged
+
+
+def make_figure(layout: Dict[str, Any], traces: Sequence[Dict[str, Any]] = ()) -> Figure:
+    return {"data": list(traces), "layout": layout}
+
+
+@lru_cache(maxsize=None)
+def main_graph_layout(th: float, tl: float) -> Dict[str, Any]:
+    """Day 모드 전체 온도 그래프 (TH/TL 라벨 포함)"""
+    return {
+        "template": _template(THEME_LIGHT),
+        "height": 440,
+        "legend": {"title": {"text": "sensor_id"}},
+        "shapes": [hline_shape(th, "red"), hline_shape(tl, "blue")],
+        "annotations": [hline_annotation(th, "TH", "top left"), hline_annotation(tl, "TL", "bottom left")],
+    }
+
+
+@lru_cache(maxsize=None)
+def detail_graph_layout(th: float, tl: float) -> Dict[str, Any]:
+    """Day 모드 센서 상세 그래프"""
+    return {
+        "template": _template(THEME_LIGHT),
+        "height": 440,
+        "shapes": [hline_shape(th, "red"), hline_shape(tl, "blue")],
+    }
+
+
+@lru_cache(maxsize=None)
+def combined_graph_layout(night: bool) -> Dict[str, Any]:
+    """종합 그래프 (Night: 다크 560px, Day: 라이트 480px)"""
+    if night:
+        return {
+            "template": _template(THEME_DARK),
+            "height": 560,
+            "showlegend": False,
+            "plot_bgcolor": "#000",
+            "paper_bgcolor": "#000",
+            "xaxis": {"tickformat": "%H:%M:%S"},
+        }
+    return {"template": _template(THEME_LIGHT), "height": 480, "showlegend": False}
+
+
+@lru_cache(maxsize=None)
+def mini_graph_layout(th: float, tl: float) -> Dict[str, Any]:
+    """Night 모드 센서별 미니 그래프 (0선 + TH/TL 점선, 시:분:초 축)"""
+    return {
+        "template": _template(THEME_DARK),
+        "margin": {"l": 4, "r": 10, "t": 16, "b": 14},
+        "height": 170,
+        "showlegend": False,
+        "plot_bgcolor": "rgba(0,0,0,0)",
+        "paper_bgcolor": "rgba(0,0,0,0)",
+        "xaxis": {
+            "showgrid": False,
+            "tickfont": {"color": "#aaa"},
+            "nticks": 4,
+            "tickformat": "%H:%M:%S",
+            "ticklabelposition": "outside bottom",
+            "ticklabelstandoff": 10,
+        },
+        "yaxis": {"showgrid": False, "tickfont": {"color": "#aaa"}, "nticks": 3, "showticklabels": False},
+        "shapes": [
+            hline_shape(0, "#ccc", dash="solid", width=1),
+            hline_shape(th, "red"),
+            hline_shape(tl, "blue"),
+        ],
+    }
+
+
+@lru_cache(maxsize=None)
+def placeholder_mini_graph_layout() -> Dict[str, Any]:
+    """Night 레이아웃 생성 시 미니 그래프 자리표시 (축 숨김, 첫 tick 에 교체됨)"""
+    return {
+        "template": _template(THEME_DARK),
+        "plot_bgcolor": "rgba(0,0,0,0)",
+        "paper_bgcolor": "rgba(0,0,0,0)",
+        "margin": {"l": 10, "r": 80, "t": 10, "b": 10},
+        "xaxis": {"showgrid": False, "visible": False},
+        "yaxis": {"showgrid": False, "visible": False},
+        "height": 160,
+        "showlegend": False,
+    }
+
+
+@lru_cache(maxsize=None)
+def empty_mini_graph_layout() -> Dict[str, Any]:
+    """데이터 없음 미니 그래프"""
+    return {
+        "template": _template(THEME_DARK),
+        "margin": {"l": 4, "r": 10, "t": 16, "b": 14},
+        "height": 170,
+        "showlegend": False,
+        "plot_bgcolor": "rgba(0,0,0,0)",
+        "paper_bgcolor": "rgba(0,0,0,0)",
+        "annotations": [{"text": "데이터 없음", "showarrow": False, "font": {"color": "white", "size": 10}}],
+    }
+
+
+def titled(layout: Dict[str, Any], title: str) -> Dict[str, Any]:
+    return with_layout(layout, title={"text": title})
@@ -0,0 +1,323 @@
+"""다중 Arduino 보드 관리 (selectors 기반 단일 I/O 스레드)
+
+보드마다 ArduinoSerial 인스턴스(보드별 수집 저장소/지표/추적기)를 두되 읽기 스레드는 만들지 않고,
+FleetManager 의 I/O 스레드 하나가 모든 포트를 `selectors` 로 다중화해 읽은 바이트를
+`ArduinoSerial.consume()` 에 넘깁니다. 측정값은 보드 인스턴스 저장소에 쌓이므로 보드 식별자(board_id)로
+구분되며, 통합 조회 API 는 {board_id: 보드별 결과} 형태로 돌려줍니다.
+
+- 보드 추가/제거는 실행 중에도 가능합니다 (add_board / remove_board, 내부 socketpair 로 I/O 스레드를 깨움).
+- fileno() 가 없는 포트(Windows COM 포트, 테스트용 가짜 포트)는 select 대상이 아니므로 같은 I/O 스레드에서
+  POLL_INTERVAL_SECONDS 간격으로 in_waiting 을 확인합니다.
+- 읽기 오류가 난 보드는 연결 끊김으로 표시하고 select 대상에서 빼며, 제거/재추가 전까지 목록에 남습니다.
+- 보드별 처리율은 각 보드의 IngestMetrics 로 집계합니다 (get_board_stats / metric_lines).
+
+app.py 는 DASHBOARD_FLEET_PORTS="rack1=/dev/ttyACM0,rack2=/dev/ttyACM1" 가 있을 때 create_fleet() 으로
+보드들을 열고 /metrics 에 보드별 지표를 추가합니다. 현재 대시보드 화면(Day/Night)은 기본 `arduino` 보드만
+표시하며 보드 선택 UI 는 없습니다. 통합 조회 API 와 fleet.board(board_id) 는 스크립트/수집기용이고,
+화면에 연결할 때는 fleet.board(board_id) 를 단일 보드 ArduinoSerial 처럼 콜백에 넘기면 됩니다.
+"""
+
+import logging
+import os
+import selectors
+import socket
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import serial
+
+from .metrics_format import family, format_labels, format_value
+from .serial_json_communication import ArduinoSerial
+
+FLEET_PORTS_ENV = "DASHBOARD_FLEET_PORTS"
+POLL_INTERVAL_SECONDS = 0.01
+RATE_INTERVAL_SECONDS = 5.0
+# select 만 하는 경우에도 처리율 갱신/종료 확인을 위해 깨어나는 최대 간격
+IDLE_WAKE_SECONDS = 1.0
+
+logger = logging.getLogger(__name__)
+
+
+class FleetManager:
+    """N 개 보드 포트를 하나의 I/O 스레드로 읽는 관리자 (스레드 안전)"""
+
+    def __init__(self, poll_interval: float = POLL_INTERVAL_SECONDS):
+        self.poll_interval = poll_interval
+        self._boards: Dict[str, ArduinoSerial] = {}
+        self._selected: Dict[str, int] = {}
+        self._polled: Dict[str, ArduinoSerial] = {}
+        self._pending: List[tuple] = []
+        self._lock = threading.Lock()
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    # ---- 보드 추가/제거 -------------------------------------------------
+
+    def add_board(self, port: str, board_id: Optional[str] = None, connection=None, baudrate: int = 115200):
+        """보드 추가 → ArduinoSerial (connection: 이미 열린 포트 객체, 없으면 port 를 엽니다)
+
+        포트 열기(연결 안정화 대기 포함)는 호출 스레드에서 하고, I/O 스레드에는 등록만 요청합니다.
+        """
+        board_id = board_id or port
+        with self._lock:
+            if board_id in self._boards:
+                raise ValueError(f"이미 등록된 보드: {board_id}")
+        board = ArduinoSerial(port=port, baudrate=baudrate, board_id=board_id)
+        if connection is not None:
+            board.serial_connection = connection
+            board.is_connected = True
+            board.connection_time = datetime.now()
+        elif not board.connect():
+            raise ConnectionError(f"보드 연결 실패: {board_id} ({port})")
+        board.is_running = True
+        with self._lock:
+            if board_id in self._boards:
+                board.disconnect()
+                raise ValueError(f"이미 등록된 보드: {board_id}")
+            self._boards[board_id] = board
+            self._pending.append(("add", board, None))
+        self._wake()
+        board.send_text_command("SCAN_SENSORS")
+        logger.info(f"➕ 보드 추가: {board_id} ({port})")
+        return board
+
+    def remove_board(self, board_id: str) -> bool:
+        """보드 제거 (I/O 스레드가 select 대상에서 빼고 포트를 닫을 때까지 대기). 없는 보드면 False"""
+        done = threading.Event()
+        with self._lock:
+            board = self._boards.pop(board_id, None)
+            if board is None:
+                return False
+            self._pending.append(("remove", board, done))
+        self._wake()
+        if self._thread is None or not self._thread.is_alive() or not done.wait(timeout=2):
+            self._apply_pending()
+        logger.info(f"➖ 보드 제거: {board_id}")
+        return True
+
+    def board(self, board_id: str) -> Optional[ArduinoSerial]:
+        with self._lock:
+            return self._boards.get(board_id)
+
+    def board_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._boards)
+
+    # ---- I/O 스레드 ------------------------------------------------------
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="fleet-io", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """I/O 스레드 종료 + 모든 보드 포트 닫기"""
+        self._running = False
+        self._wake()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+        for board_id in self.board_ids():
+            self.remove_board(board_id)
+        self._apply_pending()
+
+    def _wake(self) -> None:
+        try:
+            self._wake_w.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass  # 이미 깨울 바이트가 쌓여 있음
+
+    def _apply_pending(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for action, board, done in pending:
+            if action == "add":
+                self._attach(board)
+            else:
+                self._detach(board)
+                board.disconnect()
+                done.set()
+
+    def _attach(self, board: ArduinoSerial) -> None:
+        conn = board.serial_connection
+        try:
+            fd = conn.fileno()
+            self._selector.register(fd, selectors.EVENT_READ, board)
+            with self._lock:
+                self._selected[board.board_id] = fd
+        except (AttributeError, OSError, ValueError):
+            self._polled[board.board_id] = board  # select 불가 포트 → 주기적 확인
+
+    def _detach(self, board: ArduinoSerial) -> None:
+        with self._lock:
+            fd = self._selected.pop(board.board_id, None)
+        if fd is not None:
+            try:
+                self._selector.unregister(fd)
+            except (KeyError, ValueError):
+                pass
+        self._polled.pop(board.board_id, None)
+
+    def _read(self, board: ArduinoSerial) -> None:
+        conn = board.serial_connection
+        try:
+            waiting = conn.in_waiting
+            if waiting:
+                data = conn.read(waiting)
+            elif board.board_id in self._selected:
+                # 읽기 가능인데 대기 바이트 0 → 장치 분리(EOF)면 pySerial 이 SerialException 발생
+                data = conn.read(1)
+            else:
+                data = b""
+        except (serial.SerialException, OSError, AttributeError, TypeError) as e:
+            board.ingest.serial_errors += 1
+            board.is_connected = False
+            self._detach(board)
+            logger.error(f"❌ 보드 읽기 오류, 연결 끊김 처리: {board.board_id}: {e}")
+            return
+        if data:
+            start = time.perf_counter()
+            board.consume(data, waiting)
+            board.ingest.loop_iteration.observe(time.perf_counter() - start)
+
+    def _run(self) -> None:
+        logger.info("🔄 보드 I/O 루프 시작")
+        last_rates = time.monotonic()
+        while self._running:
+            self._apply_pending()
+            timeout = self.poll_interval if self._polled else IDLE_WAKE_SECONDS
+            ready = []
+            for key, _events in self._selector.select(timeout):
+                if key.data is None:
+                    try:
+                        self._wake_r.recv(4096)
+                    except (BlockingIOError, OSError):
+                        pass
+                else:
+                    ready.append(key.data)
+            for board in list(self._polled.values()):
+                try:
+                    if board.serial_connection.in_waiting:
+                        ready.append(board)
+                except (serial.SerialException, OSError, AttributeError):
+                    ready.append(board)  # _read 에서 오류 처리
+            for board in ready:
+                self._read(board)
+            now = time.monotonic()
+            if now - last_rates >= RATE_INTERVAL_SECONDS:
+                for board in list(self._boards.values()):
+                    board.ingest.update_rates()
+                last_rates = now
+        logger.info("🔄 보드 I/O 루프 종료")
+
+    # ---- 통합 조회 API -----------------------------------------------------
+
+    def _each(self):
+        with self._lock:
+            return list(self._boards.items())
+
+    def get_current_temperatures(self) -> Dict[str, Dict[int, Dict[str, Any]]]:
+        """{board_id: {sensor_id: {temperature, timestamp, status, address?}}}"""
+        return {bid: board.get_current_temperatures() for bid, board in self._each()}
+
+    def get_sensor_arrays(self, seconds=300, min_points_per_sensor=0):
+        """{board_id: {sensor_id: (timestamps, temperatures)}}"""
+        return {bid: board.get_sensor_arrays(seconds, min_points_per_sensor) for bid, board in self._each()}
+
+    def query_sensor_range(self, start, end, sensors):
+        """sensors: [(board_id, sensor_id), ...] → {(board_id, sensor_id): (timestamps, temperatures)}"""
+        wanted: Dict[str, List[int]] = {}
+        for bid, sid in sensors:
+            wanted.setdefault(bid, []).append(sid)
+        result = {}
+        for bid, sids in wanted.items():
+            board = self.board(bid)
+            if board is None:
+                continue
+            for sid, arrays in board.query_sensor_range(start, end, sids).items():
+                result[(bid, sid)] = arrays
+        return result
+
+    def get_board_stats(self) -> Dict[str, Dict[str, Any]]:
+        """보드별 연결 상태 / 처리율 / 누적 수신 수 / 마지막 수신 후 경과 시간"""
+        with self._lock:
+            boards = list(self._boards.items())
+            selected = set(self._selected)  # I/O 스레드가 추가/제거하므로 잠금 안에서 복사
+        stats = {}
+        for bid, board in boards:
+            m = board.ingest
+            last = board.last_data_time
+            stats[bid] = {
+                "port": board.port,
+                "connected": board.is_connected,
+                "healthy": board.is_healthy(),
+                "selectable": bid in selected,
+                "total_received": board.total_received,
+                "bytes_read": m.bytes_read,
+                "lines_per_second": m.lines_per_second,
+                "bytes_per_second": m.bytes_per_second,
+                "parse_errors": sum(m.parse_errors.values()),
+                "serial_errors": m.serial_errors,
+                "last_data_age_seconds": (datetime.now() - last).total_seconds() if last else None,
+            }
+        return stats
+
+    def metric_lines(self) -> List[str]:
+        """/metrics collector: 보드별 연결/처리율 지표"""
+        stats = self.get_board_stats()
+        out = []
+        for name, kind, help_text, key in (
+            ("dashboard_fleet_board_up", "gauge", "보드 연결 상태 (1=연결)", "connected"),
+            ("dashboard_fleet_lines_total", "counter", "보드별 수신 라인 수", "total_received"),
+            ("dashboard_fleet_bytes_read_total", "counter", "보드별 수신 바이트 수", "bytes_read"),
+            (
+                "dashboard_fleet_lines_per_second",
+                "gauge",
+                "보드별 최근 구간 수신 라인/초",
+                "lines_per_second",
+            ),
+            ("dashboard_fleet_parse_errors_total", "counter", "보드별 파싱 실패 수", "parse_errors"),
+        ):
+            out += family(name, kind, help_text)
+            for bid, s in stats.items():
+                out.append(f"{name}{format_labels({'board': bid})} {format_value(float(s[key]))}")
+        return out
+
+
+def parse_fleet_ports(spec: str) -> Dict[str, str]:
+    """ "rack1=/dev/ttyACM0,COM5" → {board_id: port} (id 가 없으면 포트 이름)"""
+    ports = {}
+    for item in (spec or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        board_id, sep, port = item.partition("=")
+        if not sep:
+            board_id, port = item, item
+        ports[board_id.strip()] = port.strip()
+    return ports
+
+
+def create_fleet() -> Optional[FleetManager]:
+    """DASHBOARD_FLEET_PORTS 의 보드들을 열고 I/O 스레드 시작 (설정이 없으면 None, 연결 실패 보드는 건너뜀)"""
+    ports = parse_fleet_ports(os.environ.get(FLEET_PORTS_ENV, ""))
+    if not ports:
+        return None
+    fleet = FleetManager()
+    fleet.start()
+    for board_id, port in ports.items():
+        try:
+            fleet.add_board(port, board_id)
+        except (ConnectionError, ValueError) as e:
+            print(f"⚠️ {e}")
+    print(f"🧩 보드 {len(fleet.board_ids())}/{len(ports)}개 연결 (단일 I/O 스레드)")
+    return fleet
@@ -0,0 +1,111 @@
+"""시리얼 수집 파이프라인 지표
+
+ArduinoSerial 읽기 루프와 라인 처리기가 기록하는 카운터/게이지입니다. 대시보드가 느릴 때
+수집(적체, 파싱 실패, 잠금 대기, 루프 지연) 쪽 문제인지 렌더링(콜백 지표) 쪽 문제인지 구분하는 데 씁니다.
+
+기록은 읽기 스레드 하나만 수행하므로 잠금 없이 갱신하고, 조회(snapshot/lines)는 다른 스레드에서
+읽기만 합니다 (조회 시점의 값이 한두 건 어긋날 수 있음).
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+from .metrics_format import Histogram, family, format_labels, format_value
+
+# 히스토그램 구간 상한 (초)
+LOCK_WAIT_BUCKETS = (0.00001, 0.0001, 0.001, 0.01, 0.1, 1.0)
+LOOP_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+FORMATS = ("json", "csv")
+
+PREFIX = "dashboard_ingest"
+
+
+class IngestMetrics:
+    """수집 파이프라인 카운터/게이지"""
+
+    def __init__(self):
+        self.started = time.time()
+        self.bytes_read = 0
+        self.lines = 0
+        self.parse_ok = dict.fromkeys(FORMATS, 0)
+        self.parse_errors = dict.fromkeys(FORMATS, 0)
+        self.serial_errors = 0
+        self.system_dropped = 0
+        self.backlog_bytes = 0
+        self.lock_wait = Histogram(LOCK_WAIT_BUCKETS)
+        self.loop_iteration = Histogram(LOOP_BUCKETS)
+        # 직전 update_rates() 이후 구간 처리율
+        self.bytes_per_second = 0.0
+        self.lines_per_second = 0.0
+        self._rate_mark = (time.perf_counter(), 0, 0)
+
+    def record_read(self, nbytes: int, backlog: int) -> None:
+        self.bytes_read += nbytes
+        self.backlog_bytes = backlog
+
+    def record_parse(self, fmt: str, ok: bool) -> None:
+        (self.parse_ok if ok else self.parse_errors)[fmt] += 1
+
+    def update_rates(self) -> None:
+        """직전 호출 이후 구간의 bytes/s, lines/s 갱신 (읽기 루프 상태 출력 주기마다)"""
+        now = time.perf_counter()
+        then, bytes_then, lines_then = self._rate_mark
+        elapsed = now - then
+        if elapsed > 0:
+            self.bytes_per_second = (self.bytes_read - bytes_then) / elapsed
+            self.lines_per_second = (self.lines - lines_then) / elapsed
+        self._rate_mark = (now, self.bytes_read, self.lines)
+
+    def snapshot(self, evicted: int = 0, last_data_age: Optional[float] = None) -> Dict[str, Any]:
+        """get_ingest_metrics() 반환값 (evicted: 저장소 보관 정책/예산으로 제거된 레코드 수)"""
+        return {
+            "uptime_seconds": time.time() - self.started,
+            "bytes_read": self.bytes_read,
+            "lines": self.lines,
+            "bytes_per_second": self.bytes_per_second,
+            "lines_per_second": self.lines_per_second,
+            "parse_ok": dict(self.parse_ok),
+            "parse_errors": dict(self.parse_errors),
+            "serial_errors": self.serial_errors,
+            "records_evicted": evicted,
+            "system_messages_dropped": self.system_dropped,
+            "backlog_bytes": self.backlog_bytes,
+            "lock_wait_seconds": {"count": self.lock_wait.count, "sum": self.lock_wait.total},
+            "loop_iteration_seconds": {"count": self.loop_iteration.count, "sum": self.loop_iteration.total},
+            "last_data_age_seconds": last_data_age,
+        }
+
+
+def ingest_metric_lines(snap: Dict[str, Any], metrics: IngestMetrics) -> List[str]:
+    """snapshot() 결과 → Prometheus 텍스트 형식 지표 줄 (/metrics collector 용)"""
+    p = PREFIX
+    out = family(f"{p}_bytes_read_total", "counter", "시리얼에서 읽은 바이트 수")
+    out.append(f"{p}_bytes_read_total {snap['bytes_read']}")
+    out += family(f"{p}_lines_total", "counter", "줄 단위로 분리된 수신 라인 수")
+    out.append(f"{p}_lines_total {snap['lines']}")
+    out += family(f"{p}_parse_total", "counter", "형식별 라인 파싱 결과")
+    for fmt in FORMATS:
+        for result, counts in (("ok", snap["parse_ok"]), ("error", snap["parse_errors"])):
+            out.append(f"{p}_parse_total{format_labels({'format': fmt, 'result': result})} {counts[fmt]}")
+    out += family(f"{p}_serial_errors_total", "counter", "시리얼 읽기 오류 수")
+    out.append(f"{p}_serial_errors_total {snap['serial_errors']}")
+    out += family(f"{p}_records_dropped_total", "counter", "보관 한도로 밀려난 레코드 수")
+    out.append(f"{p}_records_dropped_total{format_labels({'buffer': 'sensor'})} {snap['records_evicted']}")
+    out.append(
+        f"{p}_records_dropped_total{format_labels({'buffer': 'system'})} {snap['system_messages_dropped']}"
+    )
+    for name, help_text, key in (
+        ("backlog_bytes", "직전 읽기 시 포트 대기 바이트", "backlog_bytes"),
+        ("bytes_per_second", "최근 상태 구간 수신 바이트/초", "bytes_per_second"),
+        ("lines_per_second", "최근 상태 구간 수신 라인/초", "lines_per_second"),
+    ):
+        out += family(f"{p}_{name}", "gauge", help_text)
+        out.append(f"{p}_{name} {format_value(snap[key])}")
+    if snap["last_data_age_seconds"] is not None:
+        out += family(f"{p}_last_data_age_seconds", "gauge", "마지막 수신 후 경과 시간")
+        out.append(f"{p}_last_data_age_seconds {format_value(snap['last_data_age_seconds'])}")
+    out += family(f"{p}_lock_wait_seconds", "histogram", "라인 처리 시 data_lock 대기 시간")
+    out += metrics.lock_wait.lines(f"{p}_lock_wait_seconds", {})
+    out += family(f"{p}_loop_iteration_seconds", "histogram", "데이터를 처리한 읽기 루프 반복 1회 소요 시간")
+    out += metrics.loop_iteration.lines(f"{p}_loop_iteration_seconds", {})
+    return out
@@ -0,0 +1,225 @@
+"""센서 측정값 종단 간 지연시간 추적 (시리얼 수신 → 화면 표시)
+
+수집 저장소 순번(seq)마다 단계별 시각을 기록합니다.
+
+- device   : 펌웨어 millis (JSON "timestamp" / CSV 4번째 필드). 장치 시계와 호스트 시계의 차이는 알 수
+             없으므로 지금까지 관측된 (수신 시각 - millis) 최솟값을 기준 오프셋으로 사용합니다
+             (millis 가 줄어들면 장치 재시작으로 보고 다시 계산).
+- received : 읽기 루프가 바이트를 읽은 시각
+- parsed   : 파싱 후 저장소에 추가된 시각
+- served   : 브라우저 버퍼 delta 로 처음 콜백 응답에 포함된 시각
+- rendered : 브라우저가 해당 cursor 까지 그린 뒤 보낸 보고(assets/latency_probe.js)가 도착한 시각
+             (서버 시계로 기록하므로 브라우저/서버 시계 차이 영향 없음, 보고 전송 시간 포함)
+
+완료된 측정값은 센서별 단계 지연시간으로 집계되어 p50/p95/p99 와 알람 표시 SLA 충족 여부를 제공합니다.
+단계: transport(장치 → 수신, 폴링 대기 포함) / parse / serve(interval 대기 + 콜백) / render / total
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from .metrics_format import family, format_labels, format_value
+
+# 추적 중(아직 그려지지 않은) 측정값 최대 수 / 센서·단계별 보관 샘플 수
+TRACE_CAPACITY = 20000
+SAMPLES_PER_SENSOR = 1000
+# 알람 표시 SLA: 장치 측정 → 화면 표시 (초)
+ALARM_SLA_SECONDS = 3.0
+STAGES = ("transport", "parse", "serve", "render", "total")
+QUANTILES = (50, 95, 99)
+RENDER_REPORT_PATH = "/trace/render"
+
+
+def percentile(values, q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def _stats(values: List[float]) -> Dict[str, Optional[float]]:
+    return {"count": len(values), **{f"p{q}": percentile(values, q) for q in QUANTILES}}
+
+
+class _Trace:
+    __slots__ = ("seq", "sensor_id", "device", "received", "parsed", "served")
+
+    def __init__(self, seq, sensor_id, device, received, parsed):
+        self.seq = seq
+        self.sensor_id = sensor_id
+        self.device = device
+        self.received = received
+        self.parsed = parsed
+        self.served = None
+
+
+class LatencyTracer:
+    """저장소 순번 기준 단계별 시각 기록 + 센서별 지연시간 집계 (스레드 안전)"""
+
+    def __init__(
+        self,
+        capacity: int = TRACE_CAPACITY,
+        samples: int = SAMPLES_PER_SENSOR,
+        sla_seconds: float = ALARM_SLA_SECONDS,
+    ):
+        self.capacity = capacity
+        self.samples = samples
+        self.sla_seconds = sla_seconds
+        self.epoch: Optional[str] = None
+        self.dropped = 0
+        self._unserved: Deque[_Trace] = deque()
+        self._unrendered: Deque[_Trace] = deque()
+        self._stages: Dict[Any, Dict[str, Deque[float]]] = {}
+        self._offset: Optional[float] = None
+        self._last_device: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def parsed(self, epoch: str, seq: int, sensor_id, device_ms: Optional[float], received: float) -> None:
+        """저장소에 추가된 측정값 1건 (received: 바이트 수신 시각, time.time())"""
+        now = time.time()
+        device = None
+        if device_ms is not None:
+            try:
+                device = float(device_ms) / 1000.0
+            except (TypeError, ValueError):
+                device = None
+        with self._lock:
+            if epoch != self.epoch:
+                self._reset(epoch)
+            if device is not None:
+                if self._last_device is not None and device < self._last_device:
+                    self._offset = None  # 장치 재시작 (millis 초기화)
+                self._last_device = device
+                offset = received - device
+                self._offset = offset if self._offset is None else min(self._offset, offset)
+            self._unserved.append(_Trace(seq, sensor_id, device, received, now))
+            while len(self._unserved) + len(self._unrendered) > self.capacity:
+                (self._unrendered or self._unserved).popleft()
+                self.dropped += 1
+
+    def served(self, epoch: str, upto: int) -> None:
+        """순번 upto 까지의 측정값이 콜백 응답에 포함됨"""
+        now = time.time()
+        with self._lock:
+            if epoch != self.epoch:
+                return
+            while self._unserved and self._unserved[0].seq <= upto:
+                trace = self._unserved.popleft()
+                trace.served = now
+                self._unrendered.append(trace)
+
+    def rendered(self, epoch: str, upto: int) -> int:
+        """브라우저가 순번 upto 까지 그렸음 → 완료된 측정값 수 반환
+
+        served 기록 없이 그려진 측정값(공유 메모리 링으로 다른 프로세스가 응답)은
+        serve/render 단계를 빼고 total 만 남깁니다.
+        """
+        now = time.time()
+        done = 0
+        with self._lock:
+            if epoch != self.epoch:
+                return 0
+            while self._unrendered and self._unrendered[0].seq <= upto:
+                self._complete(self._unrendered.popleft(), now)
+                done += 1
+            while self._unserved and self._unserved[0].seq <= upto:
+                self._complete(self._unserved.popleft(), now)
+                done += 1
+        return done
+
+    def _complete(self, trace: _Trace, rendered: float) -> None:
+        origin = trace.received
+        transport = None
+        if trace.device is not None and self._offset is not None:
+            origin = min(trace.received, trace.device + self._offset)
+            transport = trace.received - origin
+        values = {
+            "transport": transport,
+            "parse": trace.parsed - trace.received,
+            "serve": None if trace.served is None else trace.served - trace.parsed,
+            "render": None if trace.served is None else rendered - trace.served,
+            "total": rendered - origin,
+        }
+        stages = self._stages.get(trace.sensor_id)
+        if stages is None:
+            stages = self._stages[trace.sensor_id] = {s: deque(maxlen=self.samples) for s in STAGES}
+        for stage, value in values.items():
+            if value is not None:
+                stages[stage].append(max(0.0, value))
+
+    def _reset(self, epoch: str) -> None:
+        self.epoch = epoch
+        self._unserved.clear()
+        self._unrendered.clear()
+        self._offset = None
+        self._last_device = None
+
+    def summary(self) -> Dict[Any, Dict[str, Dict[str, Optional[float]]]]:
+        """센서별 단계 지연시간 {센서: {단계: {count, p50, p95, p99}}} + "all" / "sla" 항목
+
+        "all": 전체 센서를 합친 단계별 분위수
+        "sla": {"seconds", "p99_total", "ok"} - 전체 센서 total p99 가 SLA 이내인지
+        """
+        with self._lock:
+            stages = {sid: {s: list(v) for s, v in per.items()} for sid, per in self._stages.items()}
+        combined: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+        result: Dict[Any, Any] = {}
+        for sid in sorted(stages, key=str):
+            result[sid] = {stage: _stats(values) for stage, values in stages[sid].items()}
+            for stage, values in stages[sid].items():
+                combined[stage].extend(values)
+        result["all"] = {stage: _stats(values) for stage, values in combined.items()}
+        p99 = result["all"]["total"]["p99"]
+        result["sla"] = {
+            "seconds": self.sla_seconds,
+            "p99_total": p99,
+            "ok": None if p99 is None else p99 <= self.sla_seconds,
+        }
+        return result
+
+    def metric_lines(self) -> List[str]:
+        """/metrics collector: 센서·단계별 지연시간 분위수 (summary 형식)"""
+        summary = self.summary()
+        sla = summary.pop("sla")
+        summary.pop("all")
+        name = "dashboard_e2e_latency_seconds"
+        out = family(name, "summary", "센서 측정값 단계별 지연시간 (장치 → 화면)")
+        for sid, stages in summary.items():
+            for stage, stats in stages.items():
+                if not stats["count"]:
+                    continue
+                for q in QUANTILES:
+                    labels = format_labels({"sensor": sid, "stage": stage, "quantile": q / 100})
+                    out.append(f"{name}{labels} {format_value(stats[f'p{q}'])}")
+                out.append(f"{name}_count{format_labels({'sensor': sid, 'stage': stage})} {stats['count']}")
+        out += family("dashboard_e2e_sla_seconds", "gauge", "알람 표시 SLA (장치 → 화면)")
+        out.append(f"dashboard_e2e_sla_seconds {format_value(sla['seconds'])}")
+        out += family(
+            "dashboard_e2e_traces_dropped_total", "counter", "그려지기 전에 추적 한도로 버려진 측정값 수"
+        )
+        out.append(f"dashboard_e2e_traces_dropped_total {self.dropped}")
+        return out
+
+
+def register_render_report_route(app, tracer: LatencyTracer, path: str = RENDER_REPORT_PATH):
+    """브라우저 렌더링 완료 보고 경로
+
+    POST {"epoch", "seq"}: assets/latency_probe.js 가 sendBeacon 으로 전송
+    """
+    from flask import request
+
+    def render_report():
+        data = request.get_json(force=True, silent=True) or {}
+        try:
+            epoch, seq = str(data["epoch"]), int(data["seq"])
+        except (KeyError, TypeError, ValueError):
+            return "", 400
+        tracer.rendered(epoch, seq)
+        return "", 204
+
+    app.server.add_url_rule(
+        path, endpoint="dashboard_render_report", view_func=render_report, methods=["POST"]
+    )
+    return render_report
@@ -0,0 +1,51 @@
+"""모드별 레이아웃 트리 캐시
+
+Day/Night 레이아웃은 인라인 스타일 dict 가 많은 컴포넌트 수십 개로 이루어져 있어, 모드 전환마다
+새로 만들면 생성/로그 출력/포트 조회 비용이 매번 듭니다. 정적인 트리는 모드별로 한 번만 만들어
+재사용하고, 포트 목록 같은 동적 값은 각 모드의 포트 새로고침 콜백
+(`ui-version-store` 변경 시 즉시 실행)이 별도로 채웁니다.
+
+콜백 응답에는 미리 JSON 직렬화해 둔 plain dict 트리(`serialized=True`)를 사용합니다.
+컴포넌트 트리를 매번 직렬화하는 비용(Night 약 100KB, 십수 ms)이 없어지고, 응답 본문도 항상 같습니다.
+캐시된 트리는 여러 응답이 공유하므로 수정하지 않습니다.
+"""
+
+import json
+import threading
+from typing import Any, Callable, Dict
+
+from .ui_modes import UIMode
+
+
+def create_layout_cache(builders: Dict[UIMode, Callable[[], Any]]):
+    """모드별 레이아웃을 처음 요청될 때 한 번만 만들어 반환하는 함수를 생성합니다.
+
+    builders: {UIMode: 인자 없이 레이아웃을 만드는 함수}
+    """
+    cache: Dict[UIMode, Any] = {}
+    serialized_cache: Dict[UIMode, Any] = {}
+    lock = threading.Lock()
+
+    def layout_for(mode, serialized: bool = False) -> Any:
+        """mode 레이아웃 (serialized=True 면 콜백 응답용 plain dict 트리)"""
+        mode = UIMode.normalize(mode)
+        source = serialized_cache if serialized else cache
+        tree = source.get(mode)
+        if tree is None:
+            with lock:
+                if mode not in cache:
+                    cache[mode] = builders[mode]()
+                if serialized and mode not in serialized_cache:
+                    from plotly.io.json import to_json_plotly
+
+                    serialized_cache[mode] = json.loads(to_json_plotly(cache[mode]))
+                tree = source[mode]
+        return tree
+
+    def clear() -> None:
+        with lock:
+            cache.clear()
+            serialized_cache.clear()
+
+    layout_for.clear = clear
+    return layout_for
@@ -0,0 +1,44 @@
+"""실시간 출력 헬퍼 모듈
+
+interval tick 마다 모드별 디스패처 콜백이 스냅샷 1회로 모든 실시간 출력을 만들 때 사용합니다.
+센서 카드는 최신값 배열 하나(`live-readings-store`)만 내려보내고 브라우저에서 포맷합니다.
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from dash import html
+
+_LEVEL_ICONS = {"info": "ℹ️", "warning": "⚠️", "error": "❌"}
+
+
+def compact_readings(current_temps: Mapping[int, Mapping[str, Any]]) -> List[List[Any]]:
+    """센서 카드용 최신값 배열 `[[센서ID, 온도, 상태, ROM 주소], ...]`
+
+    온도/상태/주소 문자열 포맷(°C, 상태 아이콘, XXXX:XXXX:XXXX:XXXX)은
+    assets/sensor_cards.js 의 clientside 콜백이 모드별로 처리합니다.
+    """
+    readings = []
+    for sid, info in sorted(current_temps.items()):
+        temp = info.get("temperature")
+        readings.append(
+            [
+                sid,
+                None if temp is None else round(temp, 2),
+                str(info.get("status", "")),
+                info.get("address", ""),
+            ]
+        )
+    return readings
+
+
+def log_entries(
+    system_messages: Iterable[Mapping[str, Any]], style: Optional[Dict[str, Any]] = None
+) -> List[html.Div]:
+    """시스템 메시지를 `[시:분:초] 아이콘 메시지` 로그 줄로 변환합니다."""
+    entries = []
+    for msg in system_messages:
+        ts = msg["timestamp"].strftime("%H:%M:%S")
+        icon = _LEVEL_ICONS.get(str(msg["level"]), "📝")
+        text = f"[{ts}] {icon} {msg['message']}"
+        entries.append(html.Div(text, style=style) if style is not None else html.Div(text))
+    return entries
@@ -0,0 +1,147 @@
+"""로깅 설정: 비동기 출력(QueueHandler/QueueListener) + 서브시스템별 레벨 + 핫패스 속도 제한
+
+콘솔 출력(stderr 쓰기/인코딩)은 QueueListener 스레드가 담당하고, 로그를 남기는 스레드(시리얼 읽기 루프,
+Dash 콜백)는 레코드를 큐에 넣기만 합니다.
+
+서브시스템별 레벨은 DASHBOARD_LOG_LEVEL(루트, 기본 INFO)과 DASHBOARD_LOG_LEVELS 로 지정합니다.
+
+    DASHBOARD_LOG_LEVELS="hotpath=DEBUG,serial=WARNING,werkzeug=WARNING"
+
+이름은 SUBSYSTEMS 별칭 또는 logger 이름입니다. 핫패스(`hotpath`: 수신 라인마다 / 레코드마다 남기는 로그)는
+기본적으로 DEBUG 레벨이라 출력되지 않으며, 켜더라도 RateLimitFilter 로 메시지 형식별 초당 건수를 제한합니다
+(생략된 건수는 다음 출력에 "[N건 생략]" 으로 표시). DASHBOARD_LOG_ASYNC=0 이면 큐 없이 직접 출력합니다.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Dict, Optional
+
+LEVEL_ENV = "DASHBOARD_LOG_LEVEL"
+LEVELS_ENV = "DASHBOARD_LOG_LEVELS"
+ASYNC_ENV = "DASHBOARD_LOG_ASYNC"
+LOG_FORMAT = "%(levelname)s:%(name)s:%(message)s"
+
+SERIAL_LOGGER = "core.serial_json_communication"
+HOTPATH_LOGGER = "dashboard.hotpath"
+SUBSYSTEMS = {
+    "serial": SERIAL_LOGGER,
+    "hotpath": HOTPATH_LOGGER,
+    "http": "werkzeug",
+}
+
+# 핫패스 메시지 형식별 초당 출력 건수 / 순간 허용 건수
+HOTPATH_RATE_PER_SECOND = 5.0
+HOTPATH_BURST = 20
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_handler: Optional[logging.Handler] = None
+_lock = threading.Lock()
+
+
+class RateLimitFilter(logging.Filter):
+    """메시지 형식(record.msg)별 토큰 버킷 속도 제한
+
+    `logger.debug("📥 수신: %s", line)` 처럼 인자를 분리해 남겨야 같은 형식으로 묶입니다.
+    """
+
+    def __init__(self, rate: float = HOTPATH_RATE_PER_SECOND, burst: int = HOTPATH_BURST):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.suppressed = 0
+        self._buckets: Dict[object, list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        now = time.monotonic()
+        key = (record.name, record.msg)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [float(self.burst), now, 0]
+            tokens, last, skipped = bucket
+            tokens = min(float(self.burst), tokens + (now - last) * self.rate)
+            if tokens < 1.0:
+                bucket[:] = [tokens, now, skipped + 1]
+                self.suppressed += 1
+                return False
+            bucket[:] = [tokens - 1.0, now, 0]
+        if skipped:
+            record.msg = f"[{skipped}건 생략] {record.msg}"
+        return True
+
+
+def parse_levels(spec: str) -> Dict[str, int]:
+    """ "hotpath=DEBUG,werkzeug=WARNING" → {logger 이름: 레벨} (잘못된 항목은 무시)"""
+    levels = {}
+    for item in (spec or "").split(","):
+        name, sep, level = item.partition("=")
+        name, level = name.strip(), level.strip().upper()
+        if not sep or not name or not isinstance(logging.getLevelName(level), int):
+            continue
+        levels[SUBSYSTEMS.get(name, name)] = logging.getLevelName(level)
+    return levels
+
+
+def _async_enabled() -> bool:
+    return os.environ.get(ASYNC_ENV, "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def configure_logging(
+    level=None, levels: Optional[Dict[str, int]] = None, async_=None, stream=None, force=False
+):
+    """루트 logger 에 출력 핸들러를 설치합니다 (한 번만, 이미 핸들러가 있으면 force 가 아니면 건너뜀).
+
+    level: 루트 레벨 (기본 DASHBOARD_LOG_LEVEL 또는 INFO)
+    levels: {서브시스템 별칭/logger 이름: 레벨} (DASHBOARD_LOG_LEVELS 보다 우선)
+    async_: QueueListener 사용 여부 (기본 DASHBOARD_LOG_ASYNC, 켜짐)
+    """
+    global _listener, _handler
+    with _lock:
+        root = logging.getLogger()
+        if root.handlers and not force:
+            return
+        shutdown_logging()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+
+        output = logging.StreamHandler(stream or sys.stderr)
+        output.setFormatter(logging.Formatter(LOG_FORMAT))
+        if async_ if async_ is not None else _async_enabled():
+            _handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+            _listener = logging.handlers.QueueListener(_handler.queue, output, respect_handler_level=True)
+            _listener.start()
+        else:
+            _handler = output
+        root.addHandler(_handler)
+        root.setLevel(
+            level or parse_levels(f"root={os.environ.get(LEVEL_ENV, '')}").get("root", logging.INFO)
+        )
+
+        hotpath = logging.getLogger(HOTPATH_LOGGER)
+        if not any(isinstance(f, RateLimitFilter) for f in hotpath.filters):
+            hotpath.addFilter(RateLimitFilter())
+        merged = parse_levels(os.environ.get(LEVELS_ENV, ""))
+        merged.update({SUBSYSTEMS.get(k, k): v for k, v in (levels or {}).items()})
+        for name, value in merged.items():
+            logging.getLogger(name).setLevel(value)
+
+
+def shutdown_logging() -> None:
+    """QueueListener 를 멈추고 큐에 남은 로그를 모두 출력합니다."""
+    global _listener, _handler
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    if _handler is not None:
+        logging.getLogger().removeHandler(_handler)
+        _handler = None
+
+
+atexit.register(shutdown_logging)
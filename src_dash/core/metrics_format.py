@@ -0,0 +1,50 @@
+"""Prometheus 텍스트 형식(0.0.4) 지표 출력 헬퍼 (콜백/수집 지표 공용, dash 비의존)"""
+
+from bisect import bisect_left
+from typing import Dict, List, Sequence
+
+
+def escape_label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(labels: Dict[str, object]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{escape_label(v)}"' for k, v in labels.items()) + "}"
+
+
+def format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """누적 구간 카운트 히스토그램 (호출자가 잠금 보장)"""
+
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def lines(self, name: str, labels: Dict[str, object]) -> List[str]:
+        out, cumulative = [], 0
+        for bound, n in zip(self.bounds + (float("inf"),), self.counts):
+            cumulative += n
+            le = "+Inf" if bound == float("inf") else format_value(bound)
+            out.append(f"{name}_bucket{format_labels({**labels, 'le': le})} {cumulative}")
+        out.append(f"{name}_sum{format_labels(labels)} {format_value(self.total)}")
+        out.append(f"{name}_count{format_labels(labels)} {self.count}")
+        return out
+
+
+def family(name: str, kind: str, help_text: str) -> List[str]:
+    """지표 HELP/TYPE 헤더 2줄"""
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
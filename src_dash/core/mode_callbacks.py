@@ -0,0 +1,139 @@
+"""모드 범위(Day/Night) 콜백 레지스트리
+
+Day/Night 레이아웃은 `main-content` 안에서 교체되므로, 한 모드 전용 콜백이 다른 모드에서
+실행되면 버려질 출력을 매 tick 계산하게 됩니다. 여기서 등록한 콜백은
+
+- `ui-version-store` 가 등록 모드와 다르면 서버에서 즉시 PreventUpdate 로 건너뛰고,
+- `audit_mode_layouts()` 로 각 모드 레이아웃에서 실제로 트리거되는 콜백을 점검할 수 있습니다.
+
+Dash 렌더러는 출력 중 하나라도 존재하고 입력이 모두 존재하면 콜백을 실행합니다 (없는 출력만 뺌).
+그래서 공통 저장소(live-readings-store, sensor-delta-store)에 쓰는 모드 전용 tick 콜백은 모드
+레이아웃 안의 tick 저장소(TICK_STORES)를 입력으로 받아야 다른 모드에서 요청 자체가 생기지 않습니다.
+"""
+
+import functools
+import weakref
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from dash import Input, Output, State
+from dash.exceptions import PreventUpdate
+
+from .ui_modes import UIMode
+
+MODE_STORE_ID = "ui-version-store"
+# 모드 레이아웃 안의 tick 저장소: tick gate(assets/tick_gate.js)가 현재 레이아웃에 있는 쪽에만 기록
+TICK_STORES = {UIMode.DAY: "day-tick-store", UIMode.NIGHT: "night-tick-store"}
+# 주기 실행 입력: 원본 interval 과 tick gate 를 거친 모드별 tick 저장소
+TICK_INPUTS = (("interval-component", "n_intervals"),) + tuple((sid, "data") for sid in TICK_STORES.values())
+
+_registries: "weakref.WeakKeyDictionary[Any, ModeCallbackRegistry]" = weakref.WeakKeyDictionary()
+
+
+def _flatten(items: Iterable[Any]) -> List[Any]:
+    flat: List[Any] = []
+    for item in items:
+        if isinstance(item, (list, tuple)):
+            flat.extend(_flatten(item))
+        else:
+            flat.append(item)
+    return flat
+
+
+class ModeCallbackRegistry:
+    """앱 하나에 등록된 모드 범위 콜백 목록"""
+
+    def __init__(self, app):
+        self.app = app
+        # (모드, 함수 이름, 출력 ID 목록, 입력 ID 목록)
+        self.entries: List[Tuple[UIMode, str, List[str], List[Tuple[str, str]]]] = []
+        # 다른 모드라서 건너뛴 호출 수
+        self.skipped = 0
+
+    def callback(self, mode: UIMode, *args: Any, **kwargs: Any) -> Callable[[Callable], Callable]:
+        """`app.callback` 과 같은 인자를 받되, mode 가 아닐 때는 실행하지 않는 데코레이터"""
+        deps = _flatten(args)
+        inputs = [d for d in deps if isinstance(d, Input)]
+        states = [d for d in deps if isinstance(d, State)]
+        outputs = [d for d in deps if isinstance(d, Output)]
+        ordered = inputs + states
+        mode_index = next((i for i, d in enumerate(ordered) if d.component_id == MODE_STORE_ID), None)
+        appended = mode_index is None
+        if appended:
+            args = args + (State(MODE_STORE_ID, "data"),)
+            mode_index = len(ordered)
+
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def gated(*cb_args):
+                if UIMode.normalize(cb_args[mode_index]) != mode:
+                    self.skipped += 1
+                    raise PreventUpdate
+                return func(*cb_args[:-1]) if appended else func(*cb_args)
+
+            self.entries.append(
+                (
+                    mode,
+                    func.__name__,
+                    [str(o.component_id) for o in outputs],
+                    [(str(i.component_id), i.component_property) for i in inputs],
+                )
+            )
+            return self.app.callback(*args, **kwargs)(gated)
+
+        return decorator
+
+    def triggered_in(self, layout_ids: Set[str], tick_only: bool = True) -> List[Tuple[UIMode, str]]:
+        """주어진 레이아웃 ID 집합에서 트리거되는 모드 범위 콜백 목록 (출력 하나 이상 + 입력 전부 존재)"""
+        found = []
+        for mode, name, outputs, inputs in self.entries:
+            if tick_only and not any(tick in inputs for tick in TICK_INPUTS):
+                continue
+            if any(o in layout_ids for o in outputs) and all(i in layout_ids for i, _ in inputs):
+                found.append((mode, name))
+        return found
+
+
+def mode_registry(app) -> ModeCallbackRegistry:
+    """앱별 모드 콜백 레지스트리 (없으면 생성)"""
+    registry = _registries.get(app)
+    if registry is None:
+        registry = _registries[app] = ModeCallbackRegistry(app)
+    return registry
+
+
+def mode_callback(app, mode: UIMode, *args: Any, **kwargs: Any) -> Callable[[Callable], Callable]:
+    """모드 범위 콜백 등록 (`@mode_callback(app, UIMode.NIGHT, Output(...), Input(...))`)"""
+    return mode_registry(app).callback(mode, *args, **kwargs)
+
+
+def layout_component_ids(component: Any) -> Set[str]:
+    """컴포넌트 트리에 존재하는 모든 문자열 ID"""
+    ids: Set[str] = set()
+    stack = [component]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (list, tuple)):
+            stack.extend(node)
+            continue
+        if not hasattr(node, "to_plotly_json"):
+            continue
+        cid = getattr(node, "id", None)
+        if isinstance(cid, str):
+            ids.add(cid)
+        stack.append(getattr(node, "children", None))
+    return ids
+
+
+def audit_mode_layouts(app, layouts: Dict[UIMode, Any], base_ids: Optional[Set[str]] = None) -> List[str]:
+    """각 모드 레이아웃에서 다른 모드 전용 tick 콜백이 트리거되는지 점검합니다.
+
+    Returns: 문제 설명 목록 (비어 있으면 정상)
+    """
+    registry = mode_registry(app)
+    issues = []
+    for active, layout in layouts.items():
+        ids = layout_component_ids(layout) | (base_ids or set())
+        for mode, name in registry.triggered_in(ids):
+            if mode != active:
+                issues.append(f"{active.name} 레이아웃에서 {mode.name} 전용 콜백 {name} 이(가) 트리거됨")
+    return issues
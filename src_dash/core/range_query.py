@@ -0,0 +1,268 @@
+"""종합 그래프 줌/팬 대응 구간 조회 모듈
+
+`combined-graph` 의 relayoutData 로 표시 구간을 해석하고, 화면 픽셀 폭에 맞는 해상도로
+raw 데이터(최근 버퍼) 또는 롤업(분 단위 집계 이력)에서 데이터를 조회합니다.
+최근에 조회한 닫힌 구간은 LRU 캐시에 보관하여 반복 팬 동작이 즉시 응답하도록 합니다.
+"""
+
+import threading
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# 그래프 기본 픽셀 폭 (relayoutData 에는 폭 정보가 없음)
+DEFAULT_PLOT_WIDTH_PX = 1200
+# 롤업 버킷 크기 및 보관 기간 (센서당 24시간)
+ROLLUP_BUCKET_SECONDS = 60
+ROLLUP_MAXLEN = 24 * 60
+# 구간 조회 LRU 캐시 크기
+RANGE_CACHE_SIZE = 32
+
+SeriesMap = Dict[int, Tuple[List[datetime], List[float]]]
+# 캐시 미스 때 raw 구간을 읽는 함수: 센서 ID 튜플 -> (구간 raw, 센서별 가장 오래된 시각)
+RawFetch = Callable[[Tuple[int, ...]], Tuple[SeriesMap, Dict[int, datetime]]]
+
+
+def _parse_plotly_datetime(value: Any) -> Optional[datetime]:
+    """Plotly 가 보내는 날짜 문자열(예: '2025-01-01 12:00:03.5')을 datetime 으로 변환합니다."""
+    if isinstance(value, datetime):
+        return value
+    if not isinstance(value, str) or not value:
+        return None
+    text = value.strip().replace("T", " ")
+    # 소수점 이하 자릿수를 6자리로 맞춤 (구버전 fromisoformat 호환)
+    if "." in text:
+        head, frac = text.split(".", 1)
+        text = f"{head}.{frac[:6].ljust(6, '0')}"
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+def parse_relayout_range(relayout_data: Optional[Dict[str, Any]]) -> Optional[Tuple[datetime, datetime]]:
+    """relayoutData 에서 x축 표시 구간을 추출합니다.
+
+    Returns:
+        (start, end) 튜플. 자동 범위(더블클릭 리셋)이거나 x축 정보가 없으면 None (라이브 모드).
+    """
+    if not relayout_data or relayout_data.get("xaxis.autorange"):
+        return None
+
+    if "xaxis.range" in relayout_data:
+        raw = relayout_data.get("xaxis.range") or [None, None]
+        raw_start, raw_end = (list(raw) + [None, None])[:2]
+    else:
+        raw_start = relayout_data.get("xaxis.range[0]")
+        raw_end = relayout_data.get("xaxis.range[1]")
+
+    start = _parse_plotly_datetime(raw_start)
+    end = _parse_plotly_datetime(raw_end)
+    if start is None or end is None:
+        return None
+    if end < start:
+        start, end = end, start
+    return start, end
+
+
+def downsample_minmax(
+    timestamps: List[datetime], values: List[float], max_points: int
+) -> Tuple[List[datetime], List[float]]:
+    """시간 버킷별 최소/최대값만 남겨 포인트 수를 max_points 이하로 줄입니다.
+
+    스파이크(최소/최대)가 사라지지 않도록 버킷마다 두 점을 시간 순서대로 유지합니다.
+    """
+    n = len(values)
+    if n <= max_points or max_points < 2:
+        return list(timestamps), list(values)
+
+    buckets = max(1, max_points // 2)
+    step = n / buckets
+    out_ts: List[datetime] = []
+    out_vals: List[float] = []
+    for b in range(buckets):
+        lo = int(b * step)
+        hi = min(n, int((b + 1) * step))
+        if lo >= hi:
+            continue
+        i_min = min(range(lo, hi), key=values.__getitem__)
+        i_max = max(range(lo, hi), key=values.__getitem__)
+        for idx in sorted({i_min, i_max}):
+            out_ts.append(timestamps[idx])
+            out_vals.append(values[idx])
+    return out_ts, out_vals
+
+
+class RollupStore:
+    """센서별 분 단위(min/max/mean) 집계 이력 저장소.
+
+    raw 버퍼가 밀려난 이후의 넓은 구간 조회를 위해 버킷 집계만 장기 보관합니다.
+    """
+
+    def __init__(self, bucket_seconds: int = ROLLUP_BUCKET_SECONDS, maxlen: int = ROLLUP_MAXLEN):
+        self.bucket_seconds = bucket_seconds
+        self.maxlen = maxlen
+        # sensor_id -> deque([bucket_start, count, sum, min, max])
+        self._buckets: Dict[int, deque] = {}
+        self._lock = threading.Lock()
+
+    def _bucket_start(self, ts: datetime) -> datetime:
+        epoch = ts.replace(microsecond=0)
+        offset = (epoch.minute * 60 + epoch.second) % self.bucket_seconds
+        return epoch - timedelta(seconds=offset)
+
+    def add(self, sensor_id: int, ts: datetime, temperature: float) -> None:
+        """측정값 1건을 해당 센서의 현재 버킷에 누적합니다."""
+        if sensor_id is None or temperature is None:
+            return
+        start = self._bucket_start(ts)
+        with self._lock:
+            series = self._buckets.get(sensor_id)
+            if series is None:
+                series = self._buckets[sensor_id] = deque(maxlen=self.maxlen)
+            if series and series[-1][0] == start:
+                bucket = series[-1]
+                bucket[1] += 1
+                bucket[2] += temperature
+                bucket[3] = min(bucket[3], temperature)
+                bucket[4] = max(bucket[4], temperature)
+            else:
+                series.append([start, 1, temperature, temperature, temperature])
+
+    def query(self, sensor_ids: Iterable[int], start: datetime, end: datetime) -> SeriesMap:
+        """구간 내 버킷의 평균값을 버킷 중앙 시각으로 반환합니다."""
+        half = timedelta(seconds=self.bucket_seconds / 2)
+        result: SeriesMap = {}
+        with self._lock:
+            for sid in sensor_ids:
+                xs: List[datetime] = []
+                ys: List[float] = []
+                for bucket_start, count, total, _vmin, _vmax in self._buckets.get(sid, ()):
+                    center = bucket_start + half
+                    if start <= center <= end:
+                        xs.append(center)
+                        ys.append(total / count)
+                result[sid] = (xs, ys)
+        return result
+
+
+def _records_in_range(
+    records: List[Dict[str, Any]], ids: Tuple[int, ...], start: datetime, end: datetime
+) -> Tuple[SeriesMap, Dict[int, datetime]]:
+    """시간순 레코드 목록에서 요청 센서의 구간 raw 와 센서별 가장 오래된 시각을 추립니다."""
+    raw: SeriesMap = {sid: ([], []) for sid in ids}
+    oldest_raw: Dict[int, datetime] = {}
+    for rec in records:
+        sid = rec["sensor_id"]
+        if sid not in raw:
+            continue
+        ts = rec["timestamp"]
+        oldest_raw.setdefault(sid, ts)
+        if start <= ts <= end:
+            raw[sid][0].append(ts)
+            raw[sid][1].append(rec["temperature"])
+    return raw, oldest_raw
+
+
+def series_from_arrays(arrays: Dict[Any, Tuple[Any, Any]]) -> SeriesMap:
+    """센서별 (datetime64, float) 배열을 구간 조회용 (datetime 리스트, 온도 리스트) 로 변환합니다."""
+    return {int(sid): (ts.astype(datetime).tolist(), vals.tolist()) for sid, (ts, vals) in arrays.items()}
+
+
+class RangeQueryEngine:
+    """표시 구간 조회기 (raw → 롤업 선택 + 픽셀 폭 다운샘플링 + LRU 캐시)."""
+
+    def __init__(self, cache_size: int = RANGE_CACHE_SIZE):
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[Any, ...], SeriesMap]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def query(
+        self,
+        records: List[Dict[str, Any]],
+        rollups: Optional[RollupStore],
+        start: datetime,
+        end: datetime,
+        sensor_ids: Iterable[int],
+        width_px: int = DEFAULT_PLOT_WIDTH_PX,
+    ) -> SeriesMap:
+        """구간 [start, end] 의 센서별 (timestamps, temperatures) 를 반환합니다.
+
+        Args:
+            records: raw 센서 레코드 (시간순, timestamp/sensor_id/temperature 키)
+            rollups: 장기 이력 롤업 저장소 (없으면 raw 만 사용)
+        """
+        newest = records[-1]["timestamp"] if records else None
+        return self.query_source(
+            lambda ids: _records_in_range(records, ids, start, end),
+            newest,
+            rollups,
+            start,
+            end,
+            sensor_ids,
+            width_px,
+        )
+
+    def query_source(
+        self,
+        fetch_raw: RawFetch,
+        newest: Optional[datetime],
+        rollups: Optional[RollupStore],
+        start: datetime,
+        end: datetime,
+        sensor_ids: Iterable[int],
+        width_px: int = DEFAULT_PLOT_WIDTH_PX,
+    ) -> SeriesMap:
+        """query() 와 같지만 raw 구간은 캐시 미스일 때만 fetch_raw(ids) 로 읽습니다.
+
+        Args:
+            fetch_raw: 센서 ID 튜플 -> (센서별 구간 raw (시각, 온도), 센서별 보관 중인 가장 오래된 시각)
+            newest: raw 저장소의 가장 최근 측정 시각 (닫힌 구간 판별용)
+        """
+        ids = tuple(sorted(int(s) for s in sensor_ids))
+        # 닫힌 구간(최신 데이터 이전에 끝나는 구간)만 캐시 - 라이브 구간은 매번 새로 조회
+        cacheable = newest is not None and end < newest
+        key = (ids, start, end, int(width_px))
+
+        if cacheable:
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    self.cache_hits += 1
+                    return cached
+                self.cache_misses += 1
+
+        max_points = max(2, int(width_px) * 2)
+        raw, oldest_raw = fetch_raw(ids)
+
+        # raw 버퍼보다 오래된 구간은 롤업 이력으로 보충
+        history: SeriesMap = {}
+        if rollups is not None:
+            history = rollups.query(ids, start, end)
+
+        result: SeriesMap = {}
+        for sid in ids:
+            xs, ys = raw.get(sid, ([], []))
+            cutoff = oldest_raw.get(sid)
+            hist_x, hist_y = history.get(sid, ([], []))
+            if hist_x:
+                keep = [i for i, t in enumerate(hist_x) if cutoff is None or t < cutoff]
+                xs = [hist_x[i] for i in keep] + xs
+                ys = [hist_y[i] for i in keep] + ys
+            result[sid] = downsample_minmax(xs, ys, max_points)
+
+        if cacheable:
+            with self._lock:
+                self._cache[key] = result
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        """캐시를 비웁니다 (포트 변경/재연결 시)."""
+        with self._lock:
+            self._cache.clear()
@@ -0,0 +1,134 @@
+"""수집 레코드 타입 정의
+
+센서 측정값/시스템 메시지를 레코드마다 dict 로 만들면 키 해시 테이블 오버헤드가
+메모리 대부분을 차지합니다. `__slots__` 기반 경량 레코드로 저장하고, 상태/출처 값은
+Enum 으로 통일하여 반복 문자열을 공유합니다.
+
+레코드는 읽기 전용 Mapping 인터페이스(`record["sensor_id"]`, `.get()`, `dict(record)`)를
+제공하므로 `pd.DataFrame(records)` 등 기존 소비자 코드와 호환됩니다.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Mapping
+from datetime import datetime
+from enum import Enum
+from typing import Any, Iterator, Optional, Union
+
+
+class _ValueStrEnum(str, Enum):
+    """str() / f-string 출력이 값 문자열과 동일한 Enum (Python 버전 차이 방지)"""
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self.value), format_spec)
+
+
+class SensorStatus(_ValueStrEnum):
+    """센서 측정 상태"""
+
+    OK = "ok"
+    SIMULATED = "simulated"
+    ERROR = "error"
+    DISCONNECTED = "disconnected"
+
+
+class RecordSource(_ValueStrEnum):
+    """레코드 출처 (수신 프레이밍 형식)"""
+
+    JSON = "json"
+    CSV = "csv"
+    SIMULATED = "simulated"
+
+
+class MessageLevel(_ValueStrEnum):
+    """시스템 메시지 레벨"""
+
+    INFO = "info"
+    WARNING = "warning"
+    ERROR = "error"
+
+
+def _coerce(enum_cls, value: Any, default):
+    """알려진 값은 Enum 멤버로, 알 수 없는 문자열은 intern 하여 반환합니다."""
+    if value is None:
+        return default
+    if isinstance(value, enum_cls):
+        return value
+    try:
+        return enum_cls(value)
+    except ValueError:
+        return sys.intern(str(value))
+
+
+def coerce_status(value: Any) -> Union[SensorStatus, str]:
+    return _coerce(SensorStatus, value, SensorStatus.OK)
+
+
+def coerce_level(value: Any) -> Union[MessageLevel, str]:
+    return _coerce(MessageLevel, value, MessageLevel.INFO)
+
+
+class _SlotRecord(Mapping):
+    """__slots__ 필드를 읽기 전용 Mapping 으로 노출하는 레코드 기반 클래스"""
+
+    __slots__ = ()
+    _fields: tuple = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __repr__(self) -> str:
+        body = ", ".join(f"{f}={getattr(self, f)!r}" for f in self._fields)
+        return f"{type(self).__name__}({body})"
+
+
+class SensorReading(_SlotRecord):
+    """센서 측정값 레코드"""
+
+    __slots__ = ("timestamp", "sensor_id", "temperature", "status", "source")
+    _fields = __slots__
+
+    def __init__(
+        self,
+        timestamp: datetime,
+        sensor_id: Optional[int],
+        temperature: Optional[float],
+        status: Union[SensorStatus, str] = SensorStatus.OK,
+        source: RecordSource = RecordSource.JSON,
+    ):
+        self.timestamp = timestamp
+        self.sensor_id = sensor_id
+        self.temperature = temperature
+        self.status = status
+        self.source = source
+
+
+class SystemMessage(_SlotRecord):
+    """시스템 메시지 레코드"""
+
+    __slots__ = ("timestamp", "message", "level", "source")
+    _fields = __slots__
+
+    def __init__(
+        self,
+        timestamp: datetime,
+        message: Optional[str],
+        level: Union[MessageLevel, str] = MessageLevel.INFO,
+        source: RecordSource = RecordSource.JSON,
+    ):
+        self.timestamp = timestamp
+        self.message = message
+        self.level = level
+        self.source = source
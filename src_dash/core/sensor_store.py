@@ -0,0 +1,313 @@
+"""센서별 독립 보관 버퍼 모듈
+
+센서마다 별도의 deque 를 두어, 짧은 주기로 측정하는 센서가 긴 주기 센서의 이력을
+밀어내지 않도록 합니다. 보관 정책은 개수(max_records) 또는 시간(max_age_seconds) 기준이며,
+전체 레코드 수 예산(total_budget)을 넘으면 가장 많이 보관 중인 센서부터 오래된 것을 제거합니다.
+
+그래프용으로 센서별 (시각, 온도) NumPy 배열을 레코드와 함께 유지하며,
+`sensor_arrays()` 는 복사 없이 연속 구간 view 를 반환합니다 (DataFrame 변환 불필요).
+
+모든 레코드에는 저장소 전체에서 증가하는 순번(seq)이 붙습니다. 브라우저 버퍼는 마지막으로 받은
+순번(cursor)을 보내고 `delta()` 로 그 이후 레코드만 받습니다. `epoch` 는 저장소 인스턴스 식별자로,
+서버 재시작/초기화 후 cursor 가 무효임을 판별하는 데 씁니다.
+
+스레드 안전성은 호출자(ArduinoSerial.data_lock)가 보장합니다.
+"""
+
+import heapq
+import uuid
+from collections import deque
+from datetime import datetime, timedelta
+from operator import itemgetter
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+# 센서당 기본 최대 보관 개수 / 전체 레코드 예산
+DEFAULT_MAX_RECORDS_PER_SENSOR = 1000
+DEFAULT_TOTAL_BUDGET = 20000
+
+_by_timestamp = itemgetter("timestamp")
+
+SensorArrays = Dict[Any, Tuple[np.ndarray, np.ndarray]]
+
+
+class _SeriesRing:
+    """미러링 링버퍼 (시각/온도 배열).
+
+    각 값을 pos 와 pos+capacity 두 곳에 기록하여 최근 구간이 항상 연속 메모리에 위치하므로
+    슬라이스 view 로 복사 없이 읽을 수 있습니다.
+    """
+
+    __slots__ = ("capacity", "_ts", "_vals", "_seq", "_end", "_len")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._ts = np.empty(2 * capacity, dtype="datetime64[us]")
+        self._vals = np.empty(2 * capacity, dtype=np.float64)
+        self._seq = np.empty(2 * capacity, dtype=np.int64)
+        self._end = 0
+        self._len = 0
+
+    def append(self, ts: datetime, value: Optional[float], seq: int = 0) -> None:
+        pos = self._end % self.capacity
+        t = np.datetime64(ts, "us")
+        v = np.nan if value is None else value
+        self._ts[pos] = self._ts[pos + self.capacity] = t
+        self._vals[pos] = self._vals[pos + self.capacity] = v
+        self._seq[pos] = self._seq[pos + self.capacity] = seq
+        self._end += 1
+        self._len = min(self._len + 1, self.capacity)
+
+    def resized(self, capacity: int) -> "_SeriesRing":
+        """최근 값(순번 포함)을 유지한 채 용량만 바꾼 새 링버퍼"""
+        ring = _SeriesRing(capacity)
+        n = min(self._len, capacity)
+        start = (self._end - n) % self.capacity
+        for i in range(start, start + n):
+            ring.append(self._ts[i].astype(datetime), self._vals[i], int(self._seq[i]))
+        return ring
+
+    def popleft(self) -> None:
+        self._len = max(0, self._len - 1)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def view(self, count: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """최근 count 개(기본 전체)의 (시각, 온도) 읽기 전용 view"""
+        n = self._len if count is None else min(count, self._len)
+        start = (self._end - n) % self.capacity
+        ts = self._ts[start : start + n]
+        vals = self._vals[start : start + n]
+        ts.flags.writeable = False
+        vals.flags.writeable = False
+        return ts, vals
+
+    def seqs(self, count: Optional[int] = None) -> np.ndarray:
+        """view() 와 같은 구간의 레코드 순번"""
+        n = self._len if count is None else min(count, self._len)
+        start = (self._end - n) % self.capacity
+        return self._seq[start : start + n]
+
+
+def records_to_arrays(records: Iterable[Mapping[str, Any]]) -> SensorArrays:
+    """레코드 목록을 센서별 (시각, 온도) 배열로 그룹화합니다 (시뮬레이션/하위 호환 경로)."""
+    grouped: Dict[Any, Tuple[list, list]] = {}
+    for rec in records:
+        try:
+            sid = int(rec["sensor_id"])
+        except (TypeError, ValueError, KeyError):
+            continue
+        xs, ys = grouped.setdefault(sid, ([], []))
+        xs.append(rec["timestamp"])
+        temp = rec.get("temperature")
+        ys.append(np.nan if temp is None else temp)
+    return {
+        sid: (np.array(xs, dtype="datetime64[us]"), np.array(ys, dtype=np.float64))
+        for sid, (xs, ys) in grouped.items()
+    }
+
+
+class SensorDataStore:
+    """센서별 보관 버퍼 + 전역 메모리 예산"""
+
+    def __init__(
+        self,
+        max_records: int = DEFAULT_MAX_RECORDS_PER_SENSOR,
+        max_age_seconds: Optional[float] = None,
+        total_budget: int = DEFAULT_TOTAL_BUDGET,
+    ):
+        self.max_records = max_records
+        self.max_age_seconds = max_age_seconds
+        self.total_budget = total_budget
+        self._buffers: Dict[Any, Deque[Dict[str, Any]]] = {}
+        self._series: Dict[Any, _SeriesRing] = {}
+        # 센서별 보관 정책 override: sensor_id -> (max_records, max_age_seconds)
+        self._retention: Dict[Any, tuple] = {}
+        self._total = 0
+        # 보관 정책/예산으로 제거된 레코드 수
+        self.evicted = 0
+        # 레코드 순번 / 저장소 인스턴스 식별자 (브라우저 버퍼 delta 동기화용)
+        self.seq = 0
+        self.epoch = uuid.uuid4().hex[:8]
+
+    def set_retention(
+        self, sensor_id, max_records: Optional[int] = None, max_age_seconds: Optional[float] = None
+    ):
+        """특정 센서의 보관 정책을 지정합니다 (None 이면 기본값 사용)."""
+        self._retention[sensor_id] = (max_records, max_age_seconds)
+        buf = self._buffers.get(sensor_id)
+        if buf is not None:
+            self._buffers[sensor_id] = self._new_buffer(sensor_id, buf)
+            self._total += len(self._buffers[sensor_id]) - len(buf)
+            self._series[sensor_id] = self._series[sensor_id].resized(self._policy(sensor_id)[0])
+
+    def _policy(self, sensor_id):
+        max_records, max_age = self._retention.get(sensor_id, (None, None))
+        return (max_records or self.max_records, max_age if max_age is not None else self.max_age_seconds)
+
+    def _new_buffer(self, sensor_id, items=()) -> Deque[Dict[str, Any]]:
+        max_records, _ = self._policy(sensor_id)
+        buf: Deque[Dict[str, Any]] = deque(maxlen=max_records)
+        buf.extend(items)
+        self.evicted += max(0, len(items) - len(buf))
+        return buf
+
+    def _new_series(self, sensor_id) -> _SeriesRing:
+        max_records, _ = self._policy(sensor_id)
+        return _SeriesRing(max_records)
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """레코드 1건 추가 후 시간/개수/예산 정책을 적용합니다."""
+        sensor_id = record["sensor_id"]
+        buf = self._buffers.get(sensor_id)
+        if buf is None:
+            buf = self._buffers[sensor_id] = self._new_buffer(sensor_id)
+            self._series[sensor_id] = self._new_series(sensor_id)
+        ring = self._series[sensor_id]
+
+        if len(buf) == buf.maxlen:
+            self.evicted += 1
+            self._total -= 1
+        buf.append(record)
+        self.seq += 1
+        ring.append(record["timestamp"], record["temperature"], self.seq)
+        self._total += 1
+
+        _, max_age = self._policy(sensor_id)
+        if max_age is not None:
+            cutoff = record["timestamp"] - timedelta(seconds=max_age)
+            while buf and buf[0]["timestamp"] < cutoff:
+                buf.popleft()
+                ring.popleft()
+                self._total -= 1
+                self.evicted += 1
+
+        while self._total > self.total_budget:
+            largest_id = max(self._buffers, key=lambda sid: len(self._buffers[sid]))
+            self._buffers[largest_id].popleft()
+            self._series[largest_id].popleft()
+            self._total -= 1
+            self.evicted += 1
+
+    def __len__(self) -> int:
+        return self._total
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """전체 레코드를 시간순으로 순회합니다."""
+        return iter(self.records())
+
+    def sensor_ids(self) -> List[Any]:
+        return [sid for sid, buf in self._buffers.items() if buf]
+
+    def records(self) -> List[Dict[str, Any]]:
+        """센서별 버퍼를 시간순으로 병합한 전체 레코드"""
+        return list(heapq.merge(*self._buffers.values(), key=_by_timestamp))
+
+    def latest(self, count: int) -> List[Dict[str, Any]]:
+        """전체 센서 기준 최신 count 개 (하위 호환용)"""
+        return self.records()[-count:] if count > 0 else []
+
+    def latest_per_sensor(self) -> Dict[Any, Dict[str, Any]]:
+        """센서별 가장 최근 레코드"""
+        return {sid: buf[-1] for sid, buf in self._buffers.items() if buf}
+
+    def sensor_window(self, sensor_id, seconds: float, now: Optional[datetime] = None, min_points: int = 0):
+        """한 센서의 최근 seconds 초 구간 레코드 (최소 min_points 개 보장)"""
+        buf = self._buffers.get(sensor_id)
+        if not buf:
+            return []
+        cutoff = (now or datetime.now()) - timedelta(seconds=seconds)
+        picked = []
+        for rec in reversed(buf):
+            if rec["timestamp"] < cutoff and len(picked) >= min_points:
+                break
+            picked.append(rec)
+        picked.reverse()
+        return picked
+
+    def window(
+        self, seconds: float, now: Optional[datetime] = None, min_points: int = 0
+    ) -> List[Dict[str, Any]]:
+        """모든 센서의 최근 seconds 초 구간 레코드를 시간순으로 반환합니다.
+
+        측정 주기가 긴 센서도 그래프가 비지 않도록 센서별로 최소 min_points 개를 포함합니다.
+        """
+        now = now or datetime.now()
+        per_sensor = [self.sensor_window(sid, seconds, now, min_points) for sid in self._buffers]
+        return list(heapq.merge(*per_sensor, key=_by_timestamp))
+
+    def sensor_arrays(
+        self, seconds: float, now: Optional[datetime] = None, min_points: int = 0
+    ) -> SensorArrays:
+        """센서별 최근 seconds 초 구간의 (시각, 온도) 배열 view (복사 없음)
+
+        측정 주기가 긴 센서도 그래프가 비지 않도록 센서별로 최소 min_points 개를 포함합니다.
+        """
+        cutoff = np.datetime64(now or datetime.now(), "us") - np.timedelta64(int(seconds * 1_000_000), "us")
+        result: SensorArrays = {}
+        for sid, ring in self._series.items():
+            if not len(ring):
+                continue
+            ts, _ = ring.view()
+            first = int(np.searchsorted(ts, cutoff, side="left"))
+            count = max(len(ts) - first, min(min_points, len(ts)))
+            result[sid] = ring.view(count)
+        return result
+
+    def newest_timestamp(self) -> Optional[datetime]:
+        """전체 센서 중 가장 최근 측정 시각 (센서 수만큼만 확인)"""
+        return max((rec["timestamp"] for rec in self.latest_per_sensor().values()), default=None)
+
+    def range_arrays(
+        self, start: datetime, end: datetime, sensor_ids: Iterable[Any]
+    ) -> Tuple[SensorArrays, Dict[Any, datetime]]:
+        """요청 센서의 [start, end] 구간 (시각, 온도) 배열 복사본과 센서별 보관 중인 가장 오래된 시각
+
+        전체 레코드를 병합하지 않고 센서별 배열을 searchsorted 로 잘라냅니다.
+        복사본이므로 잠금 해제 후에도 안전하게 쓸 수 있습니다.
+        """
+        lo, hi = np.datetime64(start, "us"), np.datetime64(end, "us")
+        arrays: SensorArrays = {}
+        oldest: Dict[Any, datetime] = {}
+        for sid in sensor_ids:
+            ring = self._series.get(sid)
+            if ring is None or not len(ring):
+                continue
+            ts, vals = ring.view()
+            oldest[sid] = ts[0].astype(datetime)
+            first = int(np.searchsorted(ts, lo, side="left"))
+            last = int(np.searchsorted(ts, hi, side="right"))
+            arrays[sid] = (ts[first:last].copy(), vals[first:last].copy())
+        return arrays, oldest
+
+    def sensor_series(self) -> Dict[Any, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """센서별 보관 중인 전체 (시각, 온도, 순번) view (공유 메모리 링 초기 채우기용)"""
+        return {sid: (*ring.view(), ring.seqs()) for sid, ring in self._series.items() if len(ring)}
+
+    def delta(
+        self, since: Optional[int], seconds: float, now: Optional[datetime] = None, min_points: int = 0
+    ) -> SensorArrays:
+        """순번이 since 보다 큰 레코드 중 최근 seconds 초 구간만 센서별 배열로 반환합니다.
+
+        since 가 None 이면 전체 구간(sensor_arrays 와 동일)을 반환합니다.
+        오래 끊겼던 클라이언트도 보관 구간 밖의 레코드는 받지 않습니다.
+        """
+        window = self.sensor_arrays(seconds, now, min_points)
+        if since is None:
+            return window
+        result: SensorArrays = {}
+        for sid, (ts, vals) in window.items():
+            seqs = self._series[sid].seqs(len(ts))
+            first = int(np.searchsorted(seqs, since, side="right"))
+            if first < len(ts):
+                result[sid] = (ts[first:], vals[first:])
+        return result
+
+    def clear(self) -> None:
+        self._buffers.clear()
+        self._series.clear()
+        self._total = 0
+        self.seq = 0
+        self.epoch = uuid.uuid4().hex[:8]
@@ -3,6 +3,7 @@ Arduino 시리얼 통신 모듈 (완전 재작성)
 간단하고 안정적인 시리얼 통신 구현
 """
 
+import contextlib
 import json
 import logging
 import threading
@@ -12,8 +13,28 @@ from datetime import datetime
 
 import serial
 
-# 데이터 저장소 기본 길이
+from .ingest_metrics import IngestMetrics, ingest_metric_lines
+from .latency_trace import LatencyTracer
+from .log_config import HOTPATH_LOGGER, configure_logging
+from .range_query import DEFAULT_PLOT_WIDTH_PX, RangeQueryEngine, RollupStore, series_from_arrays
+from .records import (
+    MessageLevel,
+    RecordSource,
+    SensorReading,
+    SensorStatus,
+    SystemMessage,
+    coerce_level,
+    coerce_status,
+)
+from .sensor_store import SensorDataStore
+from .shm_ring import DEFAULT_MAX_SENSORS, ShmRingWriter
+
+# 데이터 저장소 기본 길이 (센서당)
 SENSOR_DATA_MAXLEN = 1000
+# 센서당 시간 기준 보관 기간 (None 이면 개수 기준만 적용)
+SENSOR_DATA_MAX_AGE_SECONDS = None
+# 전체 센서 레코드 예산 (메모리 상한)
+SENSOR_DATA_TOTAL_BUDGET = 20000
 SYSTEM_MESSAGES_MAXLEN = 100
 ALERTS_MAXLEN = 50
 
@@ -21,7 +42,7 @@ ALERTS_MAXLEN = 50
 class ArduinoSerial:
     """간단하고 안정적인 Arduino 시리얼 통신 클래스"""
 
-    def __init__(self, port=None, baudrate=115200):
+    def __init__(self, port=None, baudrate=115200, board_id=None):
         if port is None:
             try:
                 from .port_manager import find_arduino_port
@@ -31,23 +52,41 @@ class ArduinoSerial:
                 port = "COM4"
         self.port = port
         self.baudrate = baudrate
+        # 다중 보드 운용 시 보드 식별자 (core/fleet_manager.py, 이 인스턴스의 측정값은 모두 이 보드 것)
+        self.board_id = board_id if board_id is not None else port
         self.serial_connection = None
         self.is_connected = False
         self.is_running = False
-        # 데이터 저장소 (최대 길이)
-        self.sensor_data = deque(maxlen=SENSOR_DATA_MAXLEN)
+        # 데이터 저장소 (센서별 독립 버퍼 + 전체 예산)
+        self.sensor_data = SensorDataStore(
+            max_records=SENSOR_DATA_MAXLEN,
+            max_age_seconds=SENSOR_DATA_MAX_AGE_SECONDS,
+            total_budget=SENSOR_DATA_TOTAL_BUDGET,
+        )
         self.system_messages = deque(maxlen=SYSTEM_MESSAGES_MAXLEN)
         self.alerts = deque(maxlen=ALERTS_MAXLEN)
+        # 줌/팬 구간 조회용 롤업 이력 + 조회 캐시
+        self.rollups = RollupStore()
+        self.range_engine = RangeQueryEngine()
         # 스레드 안전성
         self.data_lock = threading.Lock()
         self.read_thread = None
-        # 통계
+        # 통계 (수집 파이프라인 지표: get_ingest_metrics())
+        self.ingest = IngestMetrics()
+        # 측정값 종단 간 지연시간 (수신 → 파싱 → 콜백 응답 → 브라우저 렌더링)
+        self.tracer = LatencyTracer()
+        # 다른 프로세스용 공유 메모리 링 (enable_shared_ring() 호출 시)
+        self.publisher = None
+        self._received_at = None
+        self._line_buffer = ""
         self.total_received = 0
         self.last_data_time = None
         self.connection_time = None
-        # 로깅
-        logging.basicConfig(level=logging.INFO)
+        # 로깅 (비동기 출력, core/log_config.py)
+        # 라인/레코드마다 남기는 로그는 핫패스 logger (기본 DEBUG, 속도 제한)
+        configure_logging()
         self.logger = logging.getLogger(__name__)
+        self.hot_logger = logging.getLogger(HOTPATH_LOGGER)
 
     def connect(self):
         """Arduino 연결"""
@@ -150,7 +189,7 @@ class ArduinoSerial:
         """데이터 읽기 루프 (재작성된 안정적 버전)"""
         self.logger.info("🔄 데이터 읽기 루프 시작")
 
-        buffer = ""
+        self._line_buffer = ""
         last_status_time = time.time()
 
         while self.is_running and self.is_connected:
@@ -162,57 +201,127 @@ class ArduinoSerial:
                     break
 
                 # 데이터 읽기 (바이트 단위)
-                if self.serial_connection.in_waiting > 0:
+                waiting = self.serial_connection.in_waiting
+                if waiting > 0:
+                    loop_start = time.perf_counter()
                     try:
                         # 한 번에 모든 대기 중인 데이터 읽기
-                        data = self.serial_connection.read(self.serial_connection.in_waiting)
+                        data = self.serial_connection.read(waiting)
                         if data:
-                            # 문자열로 변환하고 버퍼에 추가
-                            text = data.decode("utf-8", errors="ignore")
-                            buffer += text
-
-                            # 완전한 라인들 처리
-                            while "\n" in buffer:
-                                line, buffer = buffer.split("\n", 1)
-                                line = line.strip()
-                                if line:
-                                    self.logger.info(f"📥 수신: {line}")
-                                    self._process_line(line)
-                                    self.total_received += 1
-                                    self.last_data_time = datetime.now()
+                            self.consume(data, waiting)
 
                     except UnicodeDecodeError as e:
-                        self.logger.warning(f"문자 디코딩 오류: {e}")
+                        self.hot_logger.warning("문자 디코딩 오류: %s", e)
+                    self.ingest.loop_iteration.observe(time.perf_counter() - loop_start)
 
-                # 5초마다 상태 출력
+                # 5초마다 처리율 갱신 + 상태 출력
                 current_time = time.time()
                 if current_time - last_status_time > 5:
-                    waiting = self.serial_connection.in_waiting if self.serial_connection else 0
-                    self.logger.info(f"📊 상태: 대기바이트={waiting}, 총수신={self.total_received}개")
+                    m = self.ingest
+                    m.update_rates()
+                    self.logger.info(
+                        f"📊 상태: 대기바이트={waiting}, 총수신={self.total_received}개, "
+                        f"{m.lines_per_second:.1f}줄/s ({m.bytes_per_second:.0f}B/s), "
+                        f"파싱오류 JSON={m.parse_errors['json']} CSV={m.parse_errors['csv']}"
+                    )
                     last_status_time = current_time
 
                 # CPU 사용률 조절
                 time.sleep(0.01)
 
             except serial.SerialException as e:
+                self.ingest.serial_errors += 1
                 self.logger.error(f"시리얼 읽기 중 연결 오류: {e}")
                 time.sleep(0.1)
             except Exception as e:
+                self.ingest.serial_errors += 1
                 self.logger.error(f"읽기 루프 예외 발생: {e}")
                 time.sleep(0.1)
 
         self.logger.info("🔄 데이터 읽기 루프 종료")
 
+    def consume(self, data, waiting=0):
+        """읽은 바이트 처리: 디코딩 → 라인 분리 → 파싱/저장 (읽기 루프 / FleetManager 공용)
+
+        waiting: 읽기 직전 포트 대기 바이트 (적체 지표)
+        """
+        self._received_at = time.time()
+        self.ingest.record_read(len(data), waiting)
+        # 문자열로 변환하고 버퍼에 추가
+        self._line_buffer += data.decode("utf-8", errors="ignore")
+
+        # 완전한 라인들 처리
+        while "\n" in self._line_buffer:
+            line, self._line_buffer = self._line_buffer.split("\n", 1)
+            line = line.strip()
+            if line:
+                self.ingest.lines += 1
+                self.hot_logger.debug("📥 수신: %s", line)
+                self._process_line(line)
+                self.total_received += 1
+                self.last_data_time = datetime.now()
+
+    @contextlib.contextmanager
+    def _ingest_lock(self):
+        """data_lock 획득 (대기 시간을 수집 지표에 기록)"""
+        start = time.perf_counter()
+        with self.data_lock:
+            self.ingest.lock_wait.observe(time.perf_counter() - start)
+            yield
+
+    def _append_system_message(self, record):
+        if len(self.system_messages) == self.system_messages.maxlen:
+            self.ingest.system_dropped += 1
+        self.system_messages.append(record)
+
+    def _stored(self, record, device_ms):
+        """방금 저장한 측정값의 수신/파싱 시각 기록 + 공유 메모리 링 게시 (device_ms: 펌웨어 millis)"""
+        store = self.sensor_data
+        self.tracer.parsed(
+            store.epoch, store.seq, record.sensor_id, device_ms, self._received_at or time.time()
+        )
+        if self.publisher is not None:
+            self.publisher.append(
+                store.epoch, record.sensor_id, record.timestamp, record.temperature, store.seq
+            )
+
+    def enable_shared_ring(self, name=None, max_sensors=DEFAULT_MAX_SENSORS):
+        """측정값을 공유 메모리 링(core/shm_ring.py)에도 게시 → 세그먼트 이름 반환
+
+        다른 프로세스는 ShmRingReader(name) 으로 잠금 없이 최근 구간을 읽습니다.
+        이미 보관 중인 측정값을 먼저 채웁니다.
+        """
+        with self.data_lock:
+            if self.publisher is None:
+                writer = ShmRingWriter(name, max_sensors=max_sensors, capacity=SENSOR_DATA_MAXLEN)
+                store = self.sensor_data
+                for sid, (ts, vals, seqs) in store.sensor_series().items():
+                    for t, v, seq in zip(ts.tolist(), vals.tolist(), seqs.tolist()):
+                        writer.append(store.epoch, sid, t, v, seq)
+                if writer.epoch is None:
+                    writer.reset(store.epoch)
+                self.publisher = writer
+            return self.publisher.name
+
+    def close_shared_ring(self):
+        """공유 메모리 링 게시 중단 + 세그먼트 삭제"""
+        with self.data_lock:
+            writer, self.publisher = self.publisher, None
+        if writer is not None:
+            writer.close()
+
     def _process_line(self, line):
         """수신된 라인 처리"""
+        # JSON 형태인지 확인
+        fmt = "json" if line.startswith("{") and line.endswith("}") else "csv"
         try:
-            # JSON 형태인지 확인
-            if line.startswith("{") and line.endswith("}"):
+            if fmt == "json":
                 self._handle_json(line)
             else:
                 self._handle_csv(line)
         except Exception as e:
-            self.logger.error(f"라인 처리 오류: {e}")
+            self.ingest.record_parse(fmt, False)
+            self.hot_logger.error("라인 처리 오류: %s", e)
 
     def _handle_json(self, line):
         """JSON 메시지 처리"""
@@ -220,69 +329,78 @@ class ArduinoSerial:
             data = json.loads(line)
             msg_type = data.get("type", "unknown")
 
-            with self.data_lock:
+            with self._ingest_lock():
                 if msg_type == "sensor":
-                    record = {
-                        "timestamp": datetime.now(),
-                        "sensor_id": data.get("id"),
-                        "temperature": data.get("temp"),
-                        "status": data.get("status", "ok"),
-                        "source": "json",
-                    }
+                    record = SensorReading(
+                        datetime.now(),
+                        data.get("id"),
+                        data.get("temp"),
+                        coerce_status(data.get("status")),
+                        RecordSource.JSON,
+                    )
                     self.sensor_data.append(record)
-                    self.logger.info(
-                        f"✅ JSON 센서 저장: ID={record['sensor_id']}, 온도={record['temperature']}°C"
+                    self.rollups.add(record.sensor_id, record.timestamp, record.temperature)
+                    self._stored(record, data.get("timestamp"))
+                    self.hot_logger.debug(
+                        "✅ JSON 센서 저장: ID=%s, 온도=%s°C", record.sensor_id, record.temperature
                     )
 
                 elif msg_type == "system":
-                    record = {
-                        "timestamp": datetime.now(),
-                        "message": data.get("msg"),
-                        "level": data.get("level", "info"),
-                        "source": "json",
-                    }
-                    self.system_messages.append(record)
+                    record = SystemMessage(
+                        datetime.now(),
+                        data.get("msg"),
+                        coerce_level(data.get("level")),
+                        RecordSource.JSON,
+                    )
+                    self._append_system_message(record)
+            self.ingest.record_parse("json", True)
 
         except json.JSONDecodeError as e:
-            self.logger.warning(f"JSON 파싱 오류: {e}")
+            self.ingest.record_parse("json", False)
+            self.hot_logger.warning("JSON 파싱 오류: %s", e)
 
     def _handle_csv(self, line):
         """CSV 메시지 처리"""
         parts = line.split(",")
         if len(parts) < 2:
+            self.ingest.record_parse("csv", False)
             return
 
         msg_type = parts[0]
+        parsed = True
 
-        with self.data_lock:
+        with self._ingest_lock():
             if msg_type == "SENSOR_DATA" and len(parts) >= 4:
                 try:
-                    record = {
-                        "timestamp": datetime.now(),
-                        "sensor_id": int(parts[1]),
-                        "temperature": float(parts[2]),
-                        "status": "ok",
-                        "source": "csv",
-                    }
+                    record = SensorReading(
+                        datetime.now(),
+                        int(parts[1]),
+                        float(parts[2]),
+                        SensorStatus.OK,
+                        RecordSource.CSV,
+                    )
                     self.sensor_data.append(record)
-                    self.logger.info(
-                        f"✅ CSV 센서 저장: ID={record['sensor_id']}, 온도={record['temperature']}°C"
+                    self.rollups.add(record.sensor_id, record.timestamp, record.temperature)
+                    self._stored(record, parts[3])
+                    self.hot_logger.debug(
+                        "✅ CSV 센서 저장: ID=%s, 온도=%s°C", record.sensor_id, record.temperature
                     )
 
                 except (ValueError, IndexError) as e:
-                    self.logger.warning(f"CSV 센서 데이터 파싱 오류: {e}")
+                    parsed = False
+                    self.hot_logger.warning("CSV 센서 데이터 파싱 오류: %s", e)
 
             elif msg_type in ["SYSTEM", "STATUS", "HEARTBEAT"]:
-                record = {
-                    "timestamp": datetime.now(),
-                    "message": ",".join(parts[1:]) if len(parts) > 1 else line,
-                    "level": "info",
-                    "source": "csv",
-                }
-                self.system_messages.append(record)
+                record = SystemMessage(
+                    datetime.now(),
+                    ",".join(parts[1:]) if len(parts) > 1 else line,
+                    MessageLevel.INFO,
+                    RecordSource.CSV,
+                )
+                self._append_system_message(record)
 
                 # 🔥 센서 주소 정보 파싱 추가
-                message = record["message"]
+                message = record.message
                 if message.startswith("SENSOR_") and "_ADDRESS_" in message:
                     try:
                         # "SENSOR_1_ADDRESS_28:FF:64:1E:80:16:04:3C" 형식 파싱
@@ -302,6 +420,8 @@ class ArduinoSerial:
                     except (ValueError, IndexError) as e:
                         self.logger.warning(f"센서 주소 파싱 오류: {e}")
 
+        self.ingest.record_parse("csv", parsed)
+
     def get_sensor_addresses(self):
         """센서 주소 정보 반환"""
         if hasattr(self, "sensor_addresses"):
@@ -314,37 +434,111 @@ class ArduinoSerial:
             current_temps = {}
             # 🔍 디버그: 센서 주소 정보 확인
             if hasattr(self, "sensor_addresses"):
-                self.logger.info(f"🔍 저장된 센서 주소: {self.sensor_addresses}")
+                self.hot_logger.debug("🔍 저장된 센서 주소: %s", self.sensor_addresses)
             else:
-                self.logger.info("🔍 센서 주소 정보 없음")
-            
-            # 최신 데이터부터 역순으로 검사
-            for data in reversed(self.sensor_data):
-                sensor_id = data["sensor_id"]
-                if sensor_id not in current_temps:
-                    temp_info = {
-                        "temperature": data["temperature"],
-                        "timestamp": data["timestamp"],
-                        "status": data["status"],
-                    }
-
-                    # 🔥 센서 주소 정보 추가
-                    if hasattr(self, "sensor_addresses") and sensor_id in self.sensor_addresses:
-                        # 콜론 제거하여 16자리 16진수 문자열로 변환
-                        address_with_colons = self.sensor_addresses[sensor_id]
-                        address_clean = address_with_colons.replace(":", "")
-                        temp_info["address"] = address_clean
-                        self.logger.info(f"🔍 센서 {sensor_id} 주소 추가: {address_clean}")
-                    else:
-                        self.logger.info(f"🔍 센서 {sensor_id} 주소 없음")
-
-                    current_temps[sensor_id] = temp_info
+                self.hot_logger.debug("🔍 센서 주소 정보 없음")
+
+            # 센서별 최신 레코드
+            for sensor_id, data in self.sensor_data.latest_per_sensor().items():
+                temp_info = {
+                    "temperature": data["temperature"],
+                    "timestamp": data["timestamp"],
+                    "status": data["status"],
+                }
+
+                # 🔥 센서 주소 정보 추가
+                if hasattr(self, "sensor_addresses") and sensor_id in self.sensor_addresses:
+                    # 콜론 제거하여 16자리 16진수 문자열로 변환
+                    address_with_colons = self.sensor_addresses[sensor_id]
+                    address_clean = address_with_colons.replace(":", "")
+                    temp_info["address"] = address_clean
+                    self.hot_logger.debug("🔍 센서 %s 주소 추가: %s", sensor_id, address_clean)
+                else:
+                    self.hot_logger.debug("🔍 센서 %s 주소 없음", sensor_id)
+
+                current_temps[sensor_id] = temp_info
             return current_temps
 
     def get_latest_sensor_data(self, count=50):
-        """최신 센서 데이터 반환"""
+        """최신 센서 데이터 반환 (전체 센서 기준 count 개 - 하위 호환용)"""
         with self.data_lock:
-            return list(self.sensor_data)[-count:]
+            return self.sensor_data.latest(count)
+
+    def get_sensor_window(self, seconds=300, min_points_per_sensor=0):
+        """센서별 최근 seconds 초 구간 데이터를 시간순으로 반환
+
+        Args:
+            seconds: 조회할 시간 창(초)
+            min_points_per_sensor: 측정 주기가 긴 센서를 위해 센서별로 보장할 최소 개수
+        """
+        with self.data_lock:
+            return self.sensor_data.window(seconds, min_points=min_points_per_sensor)
+
+    def get_sensor_arrays(self, seconds=300, min_points_per_sensor=0):
+        """센서별 최근 seconds 초 구간의 (시각, 온도) NumPy 배열 반환
+
+        저장소의 연속 view 를 잠금 안에서 한 번 복사합니다 (잠금 밖에서 수집 스레드가 덮어쓸 수 있음).
+        """
+        with self.data_lock:
+            views = self.sensor_data.sensor_arrays(seconds, min_points=min_points_per_sensor)
+            return {sid: (ts.copy(), vals.copy()) for sid, (ts, vals) in views.items()}
+
+    def get_sensor_delta(
+        self, epoch=None, since=None, seconds=300, min_points_per_sensor=0, mark_served=True
+    ):
+        """브라우저 버퍼 동기화용: cursor(epoch, since) 이후의 센서별 신규 배열
+
+        Returns: (epoch, 최신 순번, 전체 재전송 여부, {sensor_id: (timestamps, temperatures)})
+        epoch 가 다르거나 since 가 없으면 최근 seconds 초 전체를 다시 보냅니다.
+        mark_served: 지연시간 추적에 "콜백 응답에 포함됨" 으로 기록 (수집기 이벤트 구독은 False)
+        """
+        with self.data_lock:
+            store = self.sensor_data
+            reset = since is None or epoch != store.epoch or since > store.seq
+            views = store.delta(None if reset else since, seconds, min_points=min_points_per_sensor)
+            arrays = {sid: (ts.copy(), vals.copy()) for sid, (ts, vals) in views.items()}
+            epoch, seq = store.epoch, store.seq
+        if mark_served:
+            self.tracer.served(epoch, seq)
+        return epoch, seq, reset, arrays
+
+    def set_sensor_retention(self, sensor_id, max_records=None, max_age_seconds=None):
+        """센서별 보관 정책(개수/시간) 지정"""
+        with self.data_lock:
+            self.sensor_data.set_retention(sensor_id, max_records, max_age_seconds)
+
+    def query_sensor_range(self, start, end, sensor_ids, width_px=DEFAULT_PLOT_WIDTH_PX):
+        """표시 구간 [start, end] 의 센서별 (timestamps, temperatures) 반환 (raw + 롤업)"""
+        # 캐시 적중이면 최신 시각만 확인 - 전체 레코드 병합 없이 미스일 때만 요청 센서 구간을 잘라 읽음
+        with self.data_lock:
+            newest = self.sensor_data.newest_timestamp()
+
+        def fetch_raw(ids):
+            with self.data_lock:
+                arrays, oldest = self.sensor_data.range_arrays(start, end, ids)
+            return series_from_arrays(arrays), oldest
+
+        return self.range_engine.query_source(
+            fetch_raw, newest, self.rollups, start, end, sensor_ids, width_px
+        )
+
+    def get_ingest_metrics(self):
+        """수집 파이프라인 지표 (core.ingest_metrics.IngestMetrics.snapshot 형식)
+
+        수신 바이트/라인 수와 처리율, 형식별 파싱 성공/실패, 시리얼 오류, 보관 한도로 밀려난 레코드 수,
+        포트 적체, data_lock 대기 시간, 읽기 루프 반복 시간, 마지막 수신 후 경과 시간을 반환합니다.
+        """
+        last = self.last_data_time
+        age = (datetime.now() - last).total_seconds() if last else None
+        return self.ingest.snapshot(self.sensor_data.evicted, age)
+
+    def ingest_metric_lines(self):
+        """/metrics collector: 수집 지표를 Prometheus 텍스트 줄로 반환"""
+        return ingest_metric_lines(self.get_ingest_metrics(), self.ingest)
+
+    def get_latency_summary(self):
+        """센서별 단계 지연시간 p50/p95/p99 + 알람 표시 SLA 충족 여부 (LatencyTracer.summary)"""
+        return self.tracer.summary()
 
     def get_system_messages(self, count=10):
         """시스템 메시지 반환"""
@@ -0,0 +1,100 @@
+"""운영 서빙 설정 (WSGI 서버 / 응답 압축 / 스레드 수)
+
+개발 실행(`python src_dash/app.py`)은 Flask 개발 서버 + debug 입니다. 운영 실행은 src_dash/wsgi.py 가
+이 모듈로 다음을 적용합니다.
+
+- debug / Dash dev tools 끔 (디버거, hot reload, props 검사 없음, 압축된 JS 번들)
+- 응답 gzip 압축: dash[compress](flask_compress)가 있으면 그것을, 없으면 표준 라이브러리 gzip
+  (콜백 응답 JSON / 레이아웃 / HTML, COMPRESS_MIN_BYTES 이상만. 정적 파일은 브라우저 캐시에 맡김)
+- waitress 스레드 풀 (DASHBOARD_THREADS, 기본 DEFAULT_THREADS). waitress 가 없으면 Flask 서버(debug 끔)로 대체
+
+콜백은 대부분 GIL 을 잡는 짧은 CPU 작업이라 스레드를 코어 수보다 많이 늘려도 처리량은 늘지 않고,
+수집기 소켓/포트 조회처럼 잠깐 기다리는 콜백이 다른 세션 요청을 막지 않을 정도면 충분합니다
+(세션 수 대비 지연시간: test_files/bench_load.py).
+"""
+
+import gzip
+import os
+
+THREADS_ENV = "DASHBOARD_THREADS"
+DEFAULT_THREADS = 8
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8050
+# waitress 동시 연결 상한 (세션당 keep-alive 연결 1~2개)
+CONNECTION_LIMIT = 200
+
+COMPRESS_MIN_BYTES = 1024
+COMPRESS_LEVEL = 5
+COMPRESS_MIMETYPES = ("application/json", "text/html", "text/plain", "text/css", "application/javascript")
+
+
+def server_threads() -> int:
+    """DASHBOARD_THREADS 값 (없거나 잘못되면 DEFAULT_THREADS)"""
+    try:
+        threads = int(os.environ.get(THREADS_ENV, ""))
+    except ValueError:
+        return DEFAULT_THREADS
+    return threads if threads > 0 else DEFAULT_THREADS
+
+
+def enable_compression(app, min_bytes=COMPRESS_MIN_BYTES, level=COMPRESS_LEVEL) -> str:
+    """응답 gzip 압축 적용 → 사용한 방식 ("flask_compress" | "gzip")"""
+    server = app.server
+    try:
+        from flask_compress import Compress
+
+        server.config.setdefault("COMPRESS_ALGORITHM", ["gzip"])
+        server.config.setdefault("COMPRESS_MIN_SIZE", min_bytes)
+        server.config.setdefault("COMPRESS_LEVEL", level)
+        Compress(server)
+        return "flask_compress"
+    except ImportError:
+        pass
+
+    from flask import request
+
+    @server.after_request
+    def gzip_response(response):
+        if (
+            response.status_code != 200
+            or response.direct_passthrough
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in COMPRESS_MIMETYPES
+            or "gzip" not in request.headers.get("Accept-Encoding", "").lower()
+        ):
+            return response
+        data = response.get_data()
+        if len(data) < min_bytes:
+            return response
+        response.set_data(gzip.compress(data, compresslevel=level, mtime=0))
+        response.headers["Content-Encoding"] = "gzip"
+        response.vary.add("Accept-Encoding")
+        return response
+
+    return "gzip"
+
+
+def prepare_production(app) -> str:
+    """debug/dev tools 끄기 + 압축 → 압축 방식 반환"""
+    app.enable_dev_tools(debug=False)
+    return enable_compression(app)
+
+
+def serve(app, host=DEFAULT_HOST, port=DEFAULT_PORT, threads=None) -> None:
+    """운영 WSGI 서버로 실행 (waitress, 없으면 Flask 서버 debug 끔)"""
+    threads = threads or server_threads()
+    try:
+        from waitress import serve as waitress_serve
+    except ImportError:
+        print("⚠️ waitress 가 없어 Flask 서버로 실행합니다 (pip install waitress 권장)")
+        app.run(debug=False, host=host, port=port, use_reloader=False, threaded=True)
+        return
+    print(f"🚀 waitress: http://{host}:{port} (스레드 {threads})")
+    waitress_serve(
+        app.server,
+        host=host,
+        port=port,
+        threads=threads,
+        connection_limit=CONNECTION_LIMIT,
+        ident="ds18b20-dashboard",
+    )
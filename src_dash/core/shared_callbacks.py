@@ -1,315 +1,215 @@
 """공통 콜백 함수들"""
 
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from dash import Input, Output, State, html
+import dash
+from dash import ClientsideFunction, Input, Output, Patch, State
+from dash.exceptions import PreventUpdate
+
+from .client_sync import delta_payload, figure_skeletons, parse_cursor, snapshot_delta
+from .figure_templates import (
+    WEBGL_POINT_THRESHOLD,
+    combined_graph_layout,
+    line_trace,
+    make_figure,
+    titled,
+    webgl_traces,
+    with_layout,
+)
+from .live_outputs import compact_readings, log_entries
+from .mode_callbacks import TICK_STORES, mode_callback
+from .range_query import DEFAULT_PLOT_WIDTH_PX, parse_relayout_range
+from .ui_modes import UIMode
+
+# 종합 그래프 줌 figure 의 trace 순서 (센서 i → data[i - 1], 표시 토글은 visible Patch)
+SENSOR_IDS = tuple(range(1, 9))
+
+
+def register_shared_callbacks(
+    app,
+    snapshot_func,
+    COLOR_SEQ,
+    TH_DEFAULT,
+    TL_DEFAULT,
+    range_query_func=None,
+    delta_func=None,
+    webgl_threshold=WEBGL_POINT_THRESHOLD,
+):
+    """공통 콜백들을 등록합니다.
+
+    range_query_func 가 주어지면 종합 그래프 줌/팬 시 표시 구간을 서버에서 조회합니다.
+    delta_func 는 브라우저 버퍼 cursor 이후의 신규 포인트를 반환하며, 없으면 매 tick 스냅샷 전체를 보냅니다.
+    webgl_threshold 포인트를 넘는 그래프는 scattergl 로 그립니다 (None 이면 항상 SVG).
+
+    Day 모드 실시간 출력은 update_day_live 하나가 스냅샷 1회로 모두 계산합니다 (Day 모드 범위 콜백).
+    interval 대신 tick gate 를 통과한 Day 레이아웃의 tick 저장소로 실행되어, 느린 렌더링 중에는 tick 이
+    쌓이지 않고 Night 모드에서는 요청 자체가 생기지 않습니다.
+    그래프는 브라우저 버퍼(sensor-data-store)에서 clientside 로 그리며 (assets/sensor_buffer.js),
+    서버는 종합 그래프 줌/팬 구간 조회만 담당합니다. 그 외 부분 변경(줌 중 센서 표시 토글,
+    threshold-store 임계선 이동)은 dash.Patch 로 바뀐 경로만 보냅니다.
+    """
+    if delta_func is None:
+
+        def delta_func(cursor=None, snapshot=None):
+            # with_history=False 스냅샷에는 그래프 구간이 없으므로 다시 조회
+            return snapshot_delta(snapshot_func())
+
+    @mode_callback(
+        app,
+        UIMode.DAY,
+        [
+            Output("connection-status", "children"),
+            Output("connection-status", "style"),
+            Output("live-readings-store", "data"),
+            Output("system-log", "children"),
+            Output("sensor-delta-store", "data"),
+        ],
+        Input(TICK_STORES[UIMode.DAY], "data"),
+        [State("sensor-cursor-store", "data"), State("ui-version-store", "data")],
+        prevent_initial_call=True,
+    )
+    def update_day_live(_tick, cursor, ui_version):
+        """Day 모드 실시간 출력 디스패처 (스냅샷 1회 → 상태/카드 데이터/로그/그래프 delta)"""
+        snapshot = snapshot_func(with_history=False)
+        connection_status, connection_style, current_temps, _latest_data, system_messages = snapshot
+        return (
+            connection_status,
+            connection_style,
+            compact_readings(current_temps),
+            log_entries(system_messages),
+            sync_payload(cursor, snapshot),
+        )
 
+    def skeletons():
+        # figure 골격은 첫 동기화 때 만들어 캐시 (plotly 템플릿 로드를 시작 시점에서 미룸)
+        return figure_skeletons(TH_DEFAULT, TL_DEFAULT, COLOR_SEQ, webgl_threshold)
+
+    def sync_payload(cursor, snapshot):
+        """브라우저 버퍼용 delta (figure 골격은 버퍼가 비어 있을 때만 포함)"""
+        first_sync = parse_cursor(cursor)[0] is None
+        return delta_payload(delta_func(cursor, snapshot=snapshot), skeletons() if first_sync else None)
+
+    # tick gate: 이전 tick 이 버퍼 병합까지 끝나지 않았으면 새 interval 을 버림 (assets/tick_gate.js)
+    # 건너뛴 tick 도 다음 delta 에 cursor 이후 데이터가 모두 포함되므로 항상 최신 데이터가 그려집니다.
+    # 출력은 Day/Night tick 저장소 (현재 모드 레이아웃에 있는 쪽만 갱신됨)
+    app.clientside_callback(
+        ClientsideFunction(namespace="tick_gate", function_name="gate"),
+        [Output(store_id, "data") for store_id in TICK_STORES.values()],
+        Input("interval-component", "n_intervals"),
+        State("interval-component", "interval"),
+        prevent_initial_call=True,
+    )
+    app.clientside_callback(
+        ClientsideFunction(namespace="tick_gate", function_name="done"),
+        Output("tick-stats-store", "data"),
+        Input("sensor-cursor-store", "data"),
+        prevent_initial_call=True,
+    )
 
-def register_shared_callbacks(app, snapshot_func, COLOR_SEQ, TH_DEFAULT, TL_DEFAULT):
-    """공통 콜백들을 등록합니다."""
+    # interval 주기: 가장 빠른 센서 측정 주기를 따르고, 유휴/숨김 탭이면 늦춤 (assets/refresh_rate.js)
+    app.clientside_callback(
+        ClientsideFunction(namespace="refresh_rate", function_name="adapt"),
+        Output("interval-component", "interval"),
+        [Input("sensor-data-store", "data"), Input("sensor-intervals-store", "data")],
+        [State("live-readings-store", "data"), State("interval-component", "interval")],
+        prevent_initial_call=True,
+    )
 
-    @app.callback(
-        [Output("connection-status", "children"), Output("connection-status", "style")]
-        + [Output(f"sensor-{i}-temp", "children") for i in range(1, 9)]
+    # 센서 카드 포맷은 브라우저에서 처리 (assets/sensor_cards.js)
+    app.clientside_callback(
+        ClientsideFunction(namespace="sensor_cards", function_name="day"),
+        [Output(f"sensor-{i}-temp", "children") for i in range(1, 9)]
         + [Output(f"sensor-{i}-status", "children") for i in range(1, 9)]
-        + [Output(f"sensor-{i}-address", "children") for i in range(1, 9)]
-        + [Output("system-log", "children")],
-        Input("interval-component", "n_intervals"),
+        + [Output(f"sensor-{i}-address", "children") for i in range(1, 9)],
+        Input("live-readings-store", "data"),
         State("ui-version-store", "data"),
         prevent_initial_call=True,
     )
-    def update_status_and_log(_n, ui_version):
-        (
-            connection_status,
-            connection_style,
-            current_temps,
-            _latest_data,
-            system_messages,
-        ) = snapshot_func()
-        sensor_temps, sensor_statuses, sensor_addresses = [], [], []
 
-        for i in range(1, 9):
-            if i in current_temps:
-                info = current_temps[i]
-                sensor_temps.append(f"{info['temperature']:.1f}°C")
-                status = info.get("status", "")
-                if status == "ok":
-                    sensor_statuses.append("🟢 정상")
-                elif status == "simulated":
-                    sensor_statuses.append("🟡 시뮬레이션")
-                else:
-                    sensor_statuses.append(f"⚠️ {status}")
-
-                # 🔥 센서 주소 추가 (시뮬레이션용 더미 주소)
-                address = info.get("address", "")
-                if address:
-                    # 실제 주소가 있는 경우 (예: "28FF641E8016043C")
-                    formatted_address = f"{address[:4]}:{address[4:8]}:" f"{address[8:12]}:{address[12:16]}"
-                    sensor_addresses.append(formatted_address)
-                elif status == "simulated":
-                    # 시뮬레이션 모드용 더미 주소
-                    dummy_address = f"28FF{i:02d}1E{i:02d}16{i:02d}3C"
-                    formatted_address = (
-                        f"{dummy_address[:4]}:{dummy_address[4:8]}:"
-                        f"{dummy_address[8:12]}:{dummy_address[12:16]}"
-                    )
-                    sensor_addresses.append(formatted_address)
-                else:
-                    sensor_addresses.append("----:----:----:----")
-            else:
-                sensor_temps.append("--°C")
-                sensor_statuses.append("🔴 연결 없음")
-                sensor_addresses.append("----:----:----:----")
+    # delta → 브라우저 버퍼 병합 및 cursor 갱신
+    app.clientside_callback(
+        ClientsideFunction(namespace="sensor_buffer", function_name="merge"),
+        [Output("sensor-data-store", "data"), Output("sensor-cursor-store", "data")],
+        Input("sensor-delta-store", "data"),
+        State("sensor-data-store", "data"),
+        prevent_initial_call=True,
+    )
 
-        log_entries = []
-        for msg in system_messages:
-            ts = msg["timestamp"].strftime("%H:%M:%S")
-            level_icons = {"info": "ℹ️", "warning": "⚠️", "error": "❌"}
-            icon = level_icons.get(msg["level"], "📝")
-            log_entries.append(html.Div(f"[{ts}] {icon} {msg['message']}"))
+    # Day 모드 전체/상세 그래프 (버퍼에서 다시 그림, 상세 그래프는 센서별 임계값 반영)
+    app.clientside_callback(
+        ClientsideFunction(namespace="sensor_buffer", function_name="day_graphs"),
+        [Output("temp-graph", "figure"), Output("detail-sensor-graph", "figure")],
+        [Input("sensor-data-store", "data"), Input("detail-sensor-dropdown", "value")],
+        State("threshold-store", "data"),
+        prevent_initial_call=True,
+    )
 
-        return (
-            [connection_status, connection_style]
-            + sensor_temps
-            + sensor_statuses
-            + sensor_addresses
-            + [log_entries]
-        )
+    # 임계값 변경 시 상세 그래프 TH/TL 선 위치만 Patch
+    app.clientside_callback(
+        ClientsideFunction(namespace="sensor_buffer", function_name="threshold_patch"),
+        Output("detail-sensor-graph", "figure", allow_duplicate=True),
+        Input("threshold-store", "data"),
+        [State("detail-sensor-dropdown", "value"), State("detail-sensor-graph", "figure")],
+        prevent_initial_call=True,
+    )
 
-    @app.callback(
-        [Output("temp-graph", "figure"), Output("detail-sensor-graph", "figure")],
+    # 종합 그래프 라이브 구간 (줌/팬 중이면 아래 서버 콜백 결과 유지)
+    app.clientside_callback(
+        ClientsideFunction(namespace="sensor_buffer", function_name="combined"),
+        Output("combined-graph", "figure", allow_duplicate=True),
         [
-            Input("interval-component", "n_intervals"),
-            Input("detail-sensor-dropdown", "value"),
+            Input("sensor-data-store", "data"),
+            Input("sensor-line-toggle", "value"),
+            Input("combined-graph", "relayoutData"),
         ],
-        [State("ui-version-store", "data")],
+        State("ui-version-store", "data"),
         prevent_initial_call=True,
     )
-    def update_main_graphs(_n, detail_sensor_id, ui_version):
-        if detail_sensor_id is None:
-            detail_sensor_id = 1
-        _, _, _current_temps, latest_data, _msgs = snapshot_func()
-
-        # Temp overview graph
-        if latest_data:
-            df = pd.DataFrame(latest_data)
-            # 필수 컬럼 존재 확인
-            required_cols = {"timestamp", "sensor_id", "temperature"}
-            if required_cols.issubset(df.columns):
-                # 변환 시도 (실패해도 치명적 아님)
-                if "timestamp" in df.columns:
-                    try:
-                        df["timestamp"] = pd.to_datetime(df["timestamp"])
-                    except Exception:
-                        pass
-                if "sensor_id" in df.columns:
-                    try:
-                        df["sensor_id"] = df["sensor_id"].astype(str)
-                    except Exception:
-                        pass
-                try:
-                    fig = px.line(
-                        df,
-                        x="timestamp",
-                        y="temperature",
-                        color="sensor_id",
-                        title="실시간 온도 모니터링 (최근 50개 데이터)",
-                        template="plotly_white",
-                    )
-                except Exception:
-                    fig = go.Figure()
-                    for sid, g in df.groupby("sensor_id"):
-                        fig.add_trace(
-                            go.Scatter(
-                                x=g.get("timestamp"),
-                                y=g.get("temperature"),
-                                mode="lines",
-                                name=sid,
-                            )
-                        )
-                    fig.update_layout(
-                        title="실시간 온도 모니터링 (최근 50개 데이터)",
-                        template="plotly_white",
-                    )
-            else:
-                fig = go.Figure()
-                fig.update_layout(title="데이터 (형식 오류)", template="plotly_white")
-        else:
-            fig = go.Figure()
-            fig.update_layout(title="데이터 없음", template="plotly_white")
-
-        # Add global TH/TL lines
-        try:
-            fig.add_hline(
-                y=TH_DEFAULT,
-                line_dash="dash",
-                line_color="red",
-                annotation_text="TH",
-                annotation_position="top left",
-            )
-            fig.add_hline(
-                y=TL_DEFAULT,
-                line_dash="dash",
-                line_color="blue",
-                annotation_text="TL",
-                annotation_position="bottom left",
-            )
-        except (ValueError, AttributeError):
-            pass
-
-        # Detail graph
-        if latest_data:
-            df_all = pd.DataFrame(latest_data)
-            if {"timestamp", "sensor_id", "temperature"}.issubset(df_all.columns):
-                try:
-                    df_all["timestamp"] = pd.to_datetime(df_all["timestamp"])
-                except Exception:
-                    pass
-                try:
-                    df_all["sensor_id"] = df_all["sensor_id"].astype(int)
-                except Exception:
-                    pass
-                one = df_all[df_all["sensor_id"] == detail_sensor_id]
-                if not one.empty:
-                    try:
-                        detail_fig = px.line(
-                            one,
-                            x="timestamp",
-                            y="temperature",
-                            title=f"센서 {detail_sensor_id} 상세 그래프",
-                            template="plotly_white",
-                        )
-                    except Exception:
-                        detail_fig = go.Figure()
-                        detail_fig.add_trace(
-                            go.Scatter(
-                                x=one.get("timestamp"),
-                                y=one.get("temperature"),
-                                mode="lines",
-                                name=f"센서 {detail_sensor_id}",
-                            )
-                        )
-                else:
-                    detail_fig = go.Figure()
-                    detail_fig.update_layout(
-                        title=f"센서 {detail_sensor_id} 데이터 없음",
-                        template="plotly_white",
-                    )
-            else:
-                detail_fig = go.Figure()
-                detail_fig.update_layout(title="상세 데이터 (형식 오류)", template="plotly_white")
-        else:
-            detail_fig = go.Figure()
-            detail_fig.update_layout(title="상세 데이터 없음", template="plotly_white")
-
-        try:
-            detail_fig.add_hline(y=TH_DEFAULT, line_dash="dash", line_color="red")
-            detail_fig.add_hline(y=TL_DEFAULT, line_dash="dash", line_color="blue")
-        except (ValueError, AttributeError):
-            pass
-
-        fig.update_layout(height=440)
-        detail_fig.update_layout(height=440)
-        return fig, detail_fig
 
     @app.callback(
         Output("combined-graph", "figure"),
         [
-            Input("interval-component", "n_intervals"),
             Input("sensor-line-toggle", "value"),
+            Input("combined-graph", "relayoutData"),
         ],
         State("ui-version-store", "data"),
         prevent_initial_call=True,
     )
-    def update_combined_graph(_n, selected_sensor_lines, ui_version):
-        from .ui_modes import UIMode
-
+    def update_combined_graph(selected_sensor_lines, relayout_data, ui_version):
         ui_is_night = UIMode.is_night(ui_version)
-        # 선택된 센서가 없으면 빈 그래프 반환 (임계선/센서라인 모두 제거)
-        if not selected_sensor_lines:
-            empty_fig = go.Figure()
-            empty_fig.update_layout(
-                title="전체 센서 실시간 온도 (센서 선택 없음)",
-                template="plotly_dark" if ui_is_night else "plotly_white",
-                height=560 if ui_is_night else 480,
-                showlegend=False,
-                plot_bgcolor="#000" if ui_is_night else None,
-                paper_bgcolor="#000" if ui_is_night else None,
-            )
-            return empty_fig
-        _, _, _current_temps, latest_data, _msgs = snapshot_func()
+        layout = combined_graph_layout(ui_is_night)
         # 선택된 센서 ID를 정수 리스트로 변환
         try:
-            selected_ids = [int(s) for s in selected_sensor_lines]
+            selected_ids = [int(s) for s in selected_sensor_lines or []]
         except Exception:
             selected_ids = []
+        # 줌/팬 상태면 표시 구간만 서버에서 조회 (라이브 구간은 브라우저 버퍼에서 그림)
+        visible_range = parse_relayout_range(relayout_data) if range_query_func else None
+        if visible_range is None:
+            # 선택된 센서가 없으면 빈 그래프 반환 (임계선/센서라인 모두 제거)
+            if not selected_ids:
+                return make_figure(titled(layout, "전체 센서 실시간 온도 (센서 선택 없음)"))
+            raise PreventUpdate
+        # 줌 구간 데이터는 이미 브라우저에 있으므로 표시 토글은 trace visible 만 변경
+        if dash.callback_context.triggered_id == "sensor-line-toggle":
+            return visibility_patch(selected_ids)
+
+        start, end = visible_range
+        series = range_query_func(start, end, list(SENSOR_IDS), DEFAULT_PLOT_WIDTH_PX)
+        traces = []
+        for sid in SENSOR_IDS:
+            xs, ys = series.get(sid, ([], []))
+            trace = line_trace(xs, ys, name=f"센서 {sid}", color=COLOR_SEQ[(sid - 1) % len(COLOR_SEQ)])
+            trace["visible"] = sid in selected_ids
+            traces.append(trace)
+        zoomed = with_layout(
+            layout, title={"text": "전체 센서 온도 (선택 구간)"}, xaxis={"range": [start, end]}
+        )
+        return make_figure(zoomed, webgl_traces(traces, webgl_threshold))
 
-        if latest_data:
-            df = pd.DataFrame(latest_data)
-            if {"timestamp", "sensor_id", "temperature"}.issubset(df.columns):
-                # 타입 변환 (best-effort)
-                try:
-                    df["sensor_id"] = df["sensor_id"].astype(int)
-                except Exception:
-                    pass
-                try:
-                    df["timestamp"] = pd.to_datetime(df["timestamp"])
-                except Exception:
-                    pass
-                df = df[df["sensor_id"].isin(selected_ids)]
-                fig = go.Figure()
-                for sid, g in df.groupby("sensor_id"):
-                    if sid in selected_ids:
-                        trace_color = (
-                            COLOR_SEQ[(sid - 1) % len(COLOR_SEQ)] if isinstance(sid, int) else "#888"
-                        )
-                        fig.add_trace(
-                            go.Scatter(
-                                x=g.get("timestamp"),
-                                y=g.get("temperature"),
-                                mode="lines",
-                                name=f"센서 {sid}",
-                                line=dict(color=trace_color, width=2),  # type: ignore[arg-type]
-                            )
-                        )
-                if ui_is_night:
-                    fig.update_layout(
-                        title="전체 센서 실시간 온도",
-                        template="plotly_dark",
-                        height=560,
-                        showlegend=False,
-                        plot_bgcolor="#000",
-                        paper_bgcolor="#000",
-                    )
-                    fig.update_xaxes(tickformat="%H:%M:%S")
-                else:
-                    fig.update_layout(
-                        title="전체 센서 실시간 온도",
-                        template="plotly_white",
-                        height=480,
-                        showlegend=False,
-                    )
-            else:
-                fig = go.Figure()
-                fig.update_layout(
-                    title="전체 센서 실시간 온도 (형식 오류)",
-                    height=480,
-                    template="plotly_dark" if ui_is_night else "plotly_white",
-                )
-        else:
-            fig = go.Figure()
-            fig.update_layout(
-                title="전체 센서 실시간 온도 (데이터 없음)",
-                height=560 if ui_is_night else 480,
-                template="plotly_dark" if ui_is_night else "plotly_white",
-                showlegend=False,
-                plot_bgcolor="#000" if ui_is_night else None,
-                paper_bgcolor="#000" if ui_is_night else None,
-            )
-            if ui_is_night:
-                fig.update_xaxes(tickformat="%H:%M:%S")
-        return fig
+    def visibility_patch(selected_ids):
+        patch = Patch()
+        for index, sid in enumerate(SENSOR_IDS):
+            patch["data"][index]["visible"] = sid in selected_ids
+        return patch
 
     # 콜백 충돌 방지를 위해 임시 비활성화
     # @app.callback(
@@ -0,0 +1,304 @@
+"""공유 메모리 센서 링버퍼 (수집 프로세스 1개 → 웹 워커 여러 개, 잠금 없는 zero-copy 읽기)
+
+수집 쪽(ShmRingWriter)이 `multiprocessing.shared_memory` 세그먼트 하나에 센서별 링을 기록하고,
+여러 웹 워커 프로세스(ShmRingReader)가 이름으로 붙어 최근 구간을 복사 없이 NumPy view 로 읽습니다.
+센서별 링은 sensor_store._SeriesRing 과 같은 미러링 방식(pos, pos+capacity 두 곳 기록)이라
+용량 이내의 최근 구간은 항상 연속 메모리입니다.
+
+동기화는 센서별 seqlock 입니다. 쓰는 쪽은 카운터를 홀수로 올린 뒤 값/개수를 기록하고 다시 짝수로
+올립니다. 읽는 쪽은 카운터가 짝수이고 읽기 전후 값이 같을 때만 결과를 채택하고, 아니면 양보(sleep(0))
+→ 짧은 sleep 으로 물러났다가 다시 읽습니다. READ_TIMEOUT_SECONDS 안에 일관된 값을 못 읽으면(쓰는 쪽이
+기록 중 멈춤 등) TimeoutError 이며, CollectorClient 는 이때 소켓 조회로 대신합니다.
+epoch(수집 저장소 식별자)가 바뀌면(재시작/초기화) 모든 링을 비우고 헤더 generation 을 올립니다.
+
+반환된 view 는 공유 메모리를 직접 가리키므로, 쓰는 쪽이 그 센서에 (용량 - 구간 길이) 건을 더 기록하면
+덮어써집니다. 1 Hz 센서 기준 수백 초 여유가 있어 콜백 안에서 바로 직렬화하는 용도에는 충분하며,
+오래 보관할 때는 copy=True 로 읽습니다.
+
+세그먼트 구조 (int64 단위):
+    헤더 HEADER_WORDS: magic, version, max_sensors, capacity, generation(seqlock),
+                       epoch(8바이트), 센서 수, 예약
+    센서 ID 표 max_sensors
+    센서별: 제어(seqlock, 누적 기록 수, 마지막 순번, 예약) + 시각[2C] + 온도[2C] + 순번[2C]
+
+한 프로세스만 쓰기를 가정합니다 (수집기 / ArduinoSerial 읽기 스레드).
+"""
+
+import itertools
+import secrets
+import threading
+import time
+from datetime import datetime, timedelta
+from multiprocessing import shared_memory
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from .sensor_store import DEFAULT_MAX_RECORDS_PER_SENSOR
+
+MAGIC = 0x44535249_4E473031  # "DSRING01"
+VERSION = 1
+HEADER_WORDS = 8
+CONTROL_WORDS = 4
+DEFAULT_MAX_SENSORS = 64
+# seqlock 재시도: YIELD_RETRIES 회까지 sleep(0) 양보, 이후 BACKOFF_MAX_SECONDS 까지 두 배씩 늘려 대기
+READ_TIMEOUT_SECONDS = 0.5
+YIELD_RETRIES = 10
+BACKOFF_MIN_SECONDS = 0.00005
+BACKOFF_MAX_SECONDS = 0.002
+
+_G_SEQLOCK, _G_EPOCH, _G_COUNT = 4, 5, 6
+_C_SEQLOCK, _C_WRITTEN, _C_LAST_SEQ = 0, 1, 2
+
+_ATTACH_LOCK = threading.Lock()
+
+
+def segment_size(max_sensors: int, capacity: int) -> int:
+    per_sensor = CONTROL_WORDS + 3 * 2 * capacity
+    return 8 * (HEADER_WORDS + max_sensors + max_sensors * per_sensor)
+
+
+def _epoch_word(epoch: str) -> int:
+    return int(np.frombuffer(epoch.encode("ascii")[:8].ljust(8, b"\0"), dtype=np.int64)[0])
+
+
+def _word_epoch(word) -> str:
+    return np.int64(word).tobytes().rstrip(b"\0").decode("ascii", errors="replace")
+
+
+class _Layout:
+    """세그먼트 버퍼 위의 NumPy view 모음 (쓰기/읽기 공용)"""
+
+    def __init__(self, buf, max_sensors: int, capacity: int):
+        words = np.ndarray(segment_size(max_sensors, capacity) // 8, dtype=np.int64, buffer=buf)
+        self.max_sensors = max_sensors
+        self.capacity = capacity
+        self.header = words[:HEADER_WORDS]
+        self.ids = words[HEADER_WORDS : HEADER_WORDS + max_sensors]
+        base = HEADER_WORDS + max_sensors
+        per = CONTROL_WORDS + 6 * capacity
+        self.control, self.ts, self.vals, self.seqs = [], [], [], []
+        for slot in range(max_sensors):
+            start = base + slot * per
+            block = words[start : start + per]
+            data = block[CONTROL_WORDS:]
+            self.control.append(block[:CONTROL_WORDS])
+            self.ts.append(data[: 2 * capacity].view("datetime64[us]"))
+            self.vals.append(data[2 * capacity : 4 * capacity].view(np.float64))
+            self.seqs.append(data[4 * capacity :])
+
+
+class ShmRingWriter:
+    """수집 쪽: 센서 측정값을 공유 메모리 링에 기록 (단일 쓰기 스레드)"""
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        max_sensors: int = DEFAULT_MAX_SENSORS,
+        capacity: int = DEFAULT_MAX_RECORDS_PER_SENSOR,
+    ):
+        name = name or f"ds18b20_{secrets.token_hex(4)}"
+        self._shm = shared_memory.SharedMemory(
+            name=name, create=True, size=segment_size(max_sensors, capacity)
+        )
+        self.layout = _Layout(self._shm.buf, max_sensors, capacity)
+        self.layout.header[:] = (MAGIC, VERSION, max_sensors, capacity, 0, 0, 0, 0)
+        self._slots: Dict[Any, int] = {}
+        self.epoch: Optional[str] = None
+        self.dropped_sensors = 0
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def reset(self, epoch: str) -> None:
+        """저장소 epoch 변경 → 모든 링 비우기 (읽는 쪽은 generation/epoch 변화로 감지)"""
+        h = self.layout.header
+        h[_G_SEQLOCK] += 1
+        for control in self.layout.control[: len(self._slots)]:
+            control[_C_SEQLOCK] += 1
+            control[_C_WRITTEN] = 0
+            control[_C_LAST_SEQ] = 0
+            control[_C_SEQLOCK] += 1
+        self.layout.ids[:] = 0
+        self._slots.clear()
+        h[_G_EPOCH] = _epoch_word(epoch)
+        h[_G_COUNT] = 0
+        h[_G_SEQLOCK] += 1
+        self.epoch = epoch
+
+    def _slot(self, sensor_id) -> Optional[int]:
+        slot = self._slots.get(sensor_id)
+        if slot is not None:
+            return slot
+        if len(self._slots) >= self.layout.max_sensors:
+            self.dropped_sensors += 1
+            return None
+        try:
+            numeric = int(sensor_id)
+        except (TypeError, ValueError):
+            return None
+        slot = self._slots[sensor_id] = len(self._slots)
+        h = self.layout.header
+        h[_G_SEQLOCK] += 1
+        self.layout.ids[slot] = numeric
+        h[_G_COUNT] = len(self._slots)
+        h[_G_SEQLOCK] += 1
+        return slot
+
+    def append(self, epoch: str, sensor_id, ts: datetime, value: Optional[float], seq: int) -> None:
+        if epoch != self.epoch:
+            self.reset(epoch)
+        slot = self._slot(sensor_id)
+        if slot is None:
+            return
+        lay = self.layout
+        control = lay.control[slot]
+        cap = lay.capacity
+        pos = int(control[_C_WRITTEN]) % cap
+        t = np.datetime64(ts, "us")
+        v = np.nan if value is None else value
+        control[_C_SEQLOCK] += 1  # 홀수: 기록 중
+        lay.ts[slot][pos] = lay.ts[slot][pos + cap] = t
+        lay.vals[slot][pos] = lay.vals[slot][pos + cap] = v
+        lay.seqs[slot][pos] = lay.seqs[slot][pos + cap] = seq
+        control[_C_WRITTEN] += 1
+        control[_C_LAST_SEQ] = seq
+        control[_C_SEQLOCK] += 1  # 짝수: 완료
+
+    def close(self, unlink: bool = True) -> None:
+        self.layout = None
+        _close(self._shm)
+        if unlink:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _close(shm: shared_memory.SharedMemory) -> None:
+    try:
+        shm.close()
+    except BufferError:
+        pass  # 밖에서 아직 view 를 들고 있음 → 마지막 view 가 사라질 때 매핑 해제
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """이름으로 붙기 (읽는 프로세스가 종료할 때 resource_tracker 가 세그먼트를 지우지 않도록 등록하지 않음)"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        pass
+    from multiprocessing import resource_tracker
+
+    with _ATTACH_LOCK:
+        register = resource_tracker.register
+        resource_tracker.register = lambda n, rtype: None if rtype == "shared_memory" else register(n, rtype)
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+def _attempts(what: str):
+    """seqlock 읽기 시도 회차 (첫 회는 바로, 이후 물러났다가 다시, 시간 초과면 TimeoutError)"""
+    deadline = time.monotonic() + READ_TIMEOUT_SECONDS
+    yield 0
+    for attempt in itertools.count(1):
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"{what} 시간 초과 ({READ_TIMEOUT_SECONDS}초)")
+        if attempt <= YIELD_RETRIES:
+            time.sleep(0)
+        else:
+            time.sleep(min(BACKOFF_MAX_SECONDS, BACKOFF_MIN_SECONDS * 2 ** (attempt - YIELD_RETRIES - 1)))
+        yield attempt
+
+
+class ShmRingReader:
+    """웹 워커 쪽: 공유 메모리 링을 잠금 없이 읽기"""
+
+    def __init__(self, name: str):
+        self._shm = _attach(name)
+        header = np.ndarray(HEADER_WORDS, dtype=np.int64, buffer=self._shm.buf)
+        if int(header[0]) != MAGIC or int(header[1]) != VERSION:
+            self._shm.close()
+            raise ValueError(f"센서 링 세그먼트가 아님: {name}")
+        self.name = name
+        self.layout = _Layout(self._shm.buf, int(header[2]), int(header[3]))
+        for arrays in (self.layout.ts, self.layout.vals, self.layout.seqs):
+            for array in arrays:
+                array.flags.writeable = False
+
+    def _sensors(self) -> Tuple[str, Dict[int, int]]:
+        """(epoch, {sensor_id: slot}) - 헤더 seqlock 으로 일관된 값"""
+        h = self.layout.header
+        for _ in _attempts("센서 링 헤더 읽기"):
+            before = int(h[_G_SEQLOCK])
+            if before & 1:
+                continue
+            epoch = _word_epoch(h[_G_EPOCH])
+            count = int(h[_G_COUNT])
+            slots = {int(sid): slot for slot, sid in enumerate(self.layout.ids[:count].tolist())}
+            if int(h[_G_SEQLOCK]) == before:
+                return epoch, slots
+
+    @property
+    def epoch(self) -> str:
+        return self._sensors()[0]
+
+    def _read(self, slot: int, cutoff, min_points: int, since: Optional[int], copy: bool):
+        lay = self.layout
+        control = lay.control[slot]
+        ts_all, vals_all, seqs_all = lay.ts[slot], lay.vals[slot], lay.seqs[slot]
+        cap = lay.capacity
+        for _ in _attempts("센서 링 읽기"):
+            before = int(control[_C_SEQLOCK])
+            if before & 1:
+                continue
+            written = int(control[_C_WRITTEN])
+            n = written if written < cap else cap
+            start = (written - n) % cap
+            end = start + n
+            first = start + int(ts_all[start:end].searchsorted(cutoff))
+            first = min(first, max(start, end - min_points))
+            if since is not None:
+                first = max(first, start + int(seqs_all[start:end].searchsorted(since, "right")))
+            ts, vals = ts_all[first:end], vals_all[first:end]
+            if copy:
+                ts, vals = ts.copy(), vals.copy()
+            last_seq = int(control[_C_LAST_SEQ])
+            if int(control[_C_SEQLOCK]) == before:
+                return ts, vals, last_seq
+
+    def arrays(self, seconds: float = 300, min_points: int = 0, now=None, copy: bool = False):
+        """(epoch, {sensor_id: (시각, 온도)}) - 최근 seconds 초 (센서별 최소 min_points 개)"""
+        epoch, slots = self._sensors()
+        cutoff = np.datetime64((now or datetime.now()) - timedelta(seconds=seconds), "us")
+        result = {}
+        for sid, slot in slots.items():
+            ts, vals, _ = self._read(slot, cutoff, min_points, None, copy)
+            if len(ts):
+                result[sid] = (ts, vals)
+        return epoch, result
+
+    def delta(
+        self, epoch=None, since=None, seconds: float = 300, min_points: int = 0, now=None, copy: bool = False
+    ):
+        """ArduinoSerial.get_sensor_delta 와 같은 형식 (epoch, 최신 순번, 전체 재전송 여부, 배열)"""
+        current, slots = self._sensors()
+        cutoff = np.datetime64((now or datetime.now()) - timedelta(seconds=seconds), "us")
+        reset = since is None or epoch != current
+        result = {}
+        latest = 0
+        for sid, slot in slots.items():
+            ts, vals, last_seq = self._read(slot, cutoff, min_points, None if reset else since, copy)
+            latest = max(latest, last_seq)
+            if len(ts):
+                result[sid] = (ts, vals)
+        if not reset and since > latest:
+            return self.delta(None, None, seconds, min_points, now, copy)
+        return current, latest, reset, result
+
+    def close(self) -> None:
+        self.layout = None
+        _close(self._shm)
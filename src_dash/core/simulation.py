@@ -0,0 +1,258 @@
+"""시뮬레이션 센서 데이터 엔진
+
+Arduino 가 연결되지 않았을 때 사용할 데이터 소스입니다. 호출마다 난수를 새로 만드는 대신
+시드 고정 물리 모델을 벽시계 기준 step 단위로 한 번씩만 진행하고, 결과를 실제 하드웨어와 같은
+수집 저장소(SensorDataStore + RollupStore)에 SensorReading 으로 기록합니다.
+같은 tick 에 여러 콜백이 조회해도 모두 같은 데이터를 보고, 브라우저 버퍼 delta 동기화(cursor)도
+하드웨어 경로와 동일하게 동작합니다.
+
+센서별 모델 (센서 축으로 벡터화되어 수백 개 센서도 step 당 수 ms):
+- 설정점(setpoint)으로 되돌아가는 완만한 드리프트 (Ornstein-Uhlenbeck)
+- 가끔 시작되는 설정점 램프 (가열/냉각 구간)
+- 측정 노이즈 + DS18B20 분해능(0.0625°C) 양자화
+- 신호 끊김 구간 (온도 None, 상태 disconnected)
+
+조회 메서드는 ArduinoSerial 과 같은 이름/반환 형식을 사용하며, 조회 전에 현재 시각까지 진행합니다.
+"""
+
+import math
+import os
+import threading
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .range_query import DEFAULT_PLOT_WIDTH_PX, RangeQueryEngine, RollupStore, series_from_arrays
+from .records import MessageLevel, RecordSource, SensorReading, SensorStatus, SystemMessage
+from .sensor_store import DEFAULT_TOTAL_BUDGET, SensorDataStore
+
+# 부하 테스트용 환경 변수 (센서 수 / 시드)
+SIM_SENSORS_ENV = "DASHBOARD_SIM_SENSORS"
+SIM_SEED_ENV = "DASHBOARD_SIM_SEED"
+
+SIM_DEFAULT_SENSORS = 4
+SIM_STEP_SECONDS = 1.0
+# 첫 조회 시 미리 채우는 이력(초) / 오래 조회가 없었을 때 한 번에 따라잡는 최대 구간(초)
+SIM_BACKFILL_SECONDS = 60
+SIM_MAX_CATCH_UP_SECONDS = 600
+SIM_MAX_RECORDS_PER_SENSOR = 600
+SYSTEM_MESSAGES_MAXLEN = 100
+
+# 물리 모델 파라미터 (단위: °C, 초)
+SETPOINT_RANGE = (18.0, 30.0)
+REVERSION_PER_SECOND = 0.02
+DRIFT_SIGMA = 0.05
+NOISE_SIGMA = 0.03
+RESOLUTION = 0.0625
+RAMP_PROBABILITY_PER_SECOND = 1 / 600
+RAMP_DELTA_RANGE = (-8.0, 15.0)
+RAMP_SECONDS_RANGE = (60, 300)
+DROPOUT_PROBABILITY_PER_SECOND = 1 / 900
+DROPOUT_SECONDS_RANGE = (3, 20)
+
+
+def sensor_address(sensor_id: int) -> str:
+    """시뮬레이션용 더미 ROM 주소 (16자리 16진수)"""
+    b = sensor_id & 0xFF
+    return f"28FF{b:02X}1E{b:02X}16{b:02X}3C"
+
+
+class SensorSimulator:
+    """시드 고정 센서 시뮬레이터 (ArduinoSerial 조회 API 호환)"""
+
+    def __init__(
+        self,
+        sensor_count: int = SIM_DEFAULT_SENSORS,
+        seed: Optional[int] = None,
+        step_seconds: float = SIM_STEP_SECONDS,
+        backfill_seconds: float = SIM_BACKFILL_SECONDS,
+        max_records: int = SIM_MAX_RECORDS_PER_SENSOR,
+    ):
+        self.sensor_count = sensor_count
+        self.seed = seed
+        self.step_seconds = step_seconds
+        self.backfill_seconds = backfill_seconds
+        self.sensor_ids = list(range(1, sensor_count + 1))
+        self.sensor_data = SensorDataStore(
+            max_records=max_records, total_budget=max(DEFAULT_TOTAL_BUDGET, sensor_count * max_records)
+        )
+        self.rollups = RollupStore()
+        self.range_engine = RangeQueryEngine()
+        self.system_messages = deque(maxlen=SYSTEM_MESSAGES_MAXLEN)
+        self.data_lock = threading.Lock()
+        self._max_catch_up = max(1, int(SIM_MAX_CATCH_UP_SECONDS / step_seconds))
+        self._origin: Optional[datetime] = None
+        self.steps = 0
+        self._reset_model()
+
+    def _reset_model(self) -> None:
+        rng = self._rng = np.random.default_rng(self.seed)
+        n = self.sensor_count
+        self._setpoint = rng.uniform(*SETPOINT_RANGE, n)
+        self._temp = self._setpoint + rng.normal(0.0, 0.5, n)
+        self._ramp_rate = np.zeros(n)
+        self._ramp_left = np.zeros(n, dtype=np.int64)
+        self._dropout_left = np.zeros(n, dtype=np.int64)
+
+    def _step(self) -> np.ndarray:
+        """모델을 한 step 진행하고 측정값(끊김은 NaN)을 반환합니다.
+
+        상태와 무관하게 step 마다 같은 개수의 난수를 뽑아 시드가 같으면 결과가 항상 같습니다.
+        """
+        rng, n, dt = self._rng, self.sensor_count, self.step_seconds
+        ramp_roll, drop_roll = rng.random(n), rng.random(n)
+        ramp_delta = rng.uniform(*RAMP_DELTA_RANGE, n)
+        ramp_steps = np.maximum(1, (rng.uniform(*RAMP_SECONDS_RANGE, n) / dt).astype(np.int64))
+        drop_steps = np.maximum(1, (rng.uniform(*DROPOUT_SECONDS_RANGE, n) / dt).astype(np.int64))
+        drift, noise = rng.standard_normal(n), rng.standard_normal(n)
+
+        start = (self._ramp_left == 0) & (ramp_roll < RAMP_PROBABILITY_PER_SECOND * dt)
+        self._ramp_rate[start] = ramp_delta[start] / ramp_steps[start]
+        self._ramp_left[start] = ramp_steps[start]
+        ramping = self._ramp_left > 0
+        self._setpoint[ramping] += self._ramp_rate[ramping]
+        self._ramp_left[ramping] -= 1
+
+        self._temp += (
+            REVERSION_PER_SECOND * dt * (self._setpoint - self._temp) + DRIFT_SIGMA * math.sqrt(dt) * drift
+        )
+
+        dropped = (self._dropout_left == 0) & (drop_roll < DROPOUT_PROBABILITY_PER_SECOND * dt)
+        self._dropout_left[dropped] = drop_steps[dropped]
+        measured = np.round((self._temp + NOISE_SIGMA * noise) / RESOLUTION) * RESOLUTION
+        offline = self._dropout_left > 0
+        measured[offline] = np.nan
+        self._dropout_left[offline] -= 1
+        return measured
+
+    def advance(self, now: Optional[datetime] = None) -> int:
+        """now 까지 지난 step 들을 진행해 저장소에 기록하고, 기록한 step 수를 반환합니다.
+
+        같은 step 안에서 다시 호출하면 아무것도 하지 않습니다.
+        """
+        now = now or datetime.now()
+        with self.data_lock:
+            if self._origin is None:
+                self._origin = now - timedelta(seconds=self.backfill_seconds)
+                self._message(
+                    f"Simulation mode active (센서 {self.sensor_count}개, 시드 {self.seed})",
+                    MessageLevel.WARNING,
+                )
+            due = int((now - self._origin).total_seconds() // self.step_seconds)
+            if due - self.steps > self._max_catch_up:
+                # 오래 조회가 없었던 경우 최근 구간만 생성 (모델 상태는 이어서 사용)
+                self.steps = due - self._max_catch_up
+            count = max(0, due - self.steps)
+            for _ in range(count):
+                self.steps += 1
+                self._record(self._origin + timedelta(seconds=self.steps * self.step_seconds), self._step())
+            return count
+
+    def _record(self, ts: datetime, measured: np.ndarray) -> None:
+        for sid, value in zip(self.sensor_ids, measured.tolist()):
+            if value != value:
+                record = SensorReading(ts, sid, None, SensorStatus.DISCONNECTED, RecordSource.SIMULATED)
+            else:
+                record = SensorReading(ts, sid, value, SensorStatus.SIMULATED, RecordSource.SIMULATED)
+            self.sensor_data.append(record)
+            self.rollups.add(sid, ts, record.temperature)
+
+    def _message(self, text: str, level: MessageLevel = MessageLevel.INFO) -> None:
+        self.system_messages.append(SystemMessage(datetime.now(), text, level, RecordSource.SIMULATED))
+
+    def reset(self) -> None:
+        """모델과 저장소를 시드 초기 상태로 되돌립니다 (저장소 epoch 가 바뀌어 브라우저 버퍼도 초기화)."""
+        with self.data_lock:
+            self.sensor_data.clear()
+            self.rollups = RollupStore()
+            self.range_engine.clear()
+            self.system_messages.clear()
+            self._origin = None
+            self.steps = 0
+            self._reset_model()
+
+    # ── ArduinoSerial 호환 조회 API ──
+
+    def get_current_temperatures(self) -> Dict[int, Dict[str, Any]]:
+        self.advance()
+        with self.data_lock:
+            return {
+                sid: {
+                    "temperature": rec["temperature"],
+                    "timestamp": rec["timestamp"],
+                    "status": rec["status"],
+                    "address": sensor_address(sid),
+                }
+                for sid, rec in self.sensor_data.latest_per_sensor().items()
+            }
+
+    def get_sensor_window(self, seconds=300, min_points_per_sensor=0):
+        self.advance()
+        with self.data_lock:
+            return self.sensor_data.window(seconds, min_points=min_points_per_sensor)
+
+    def get_sensor_arrays(self, seconds=300, min_points_per_sensor=0):
+        self.advance()
+        with self.data_lock:
+            views = self.sensor_data.sensor_arrays(seconds, min_points=min_points_per_sensor)
+            return {sid: (ts.copy(), vals.copy()) for sid, (ts, vals) in views.items()}
+
+    def get_sensor_delta(self, epoch=None, since=None, seconds=300, min_points_per_sensor=0):
+        self.advance()
+        with self.data_lock:
+            store = self.sensor_data
+            reset = since is None or epoch != store.epoch or since > store.seq
+            views = store.delta(None if reset else since, seconds, min_points=min_points_per_sensor)
+            arrays = {sid: (ts.copy(), vals.copy()) for sid, (ts, vals) in views.items()}
+            return store.epoch, store.seq, reset, arrays
+
+    def query_sensor_range(self, start, end, sensor_ids: Iterable[int], width_px=DEFAULT_PLOT_WIDTH_PX):
+        self.advance()
+        # 캐시 적중이면 최신 시각만 확인 - 전체 레코드 병합 없이 미스일 때만 요청 센서 구간을 잘라 읽음
+        with self.data_lock:
+            newest = self.sensor_data.newest_timestamp()
+
+        def fetch_raw(ids):
+            with self.data_lock:
+                arrays, oldest = self.sensor_data.range_arrays(start, end, ids)
+            return series_from_arrays(arrays), oldest
+
+        return self.range_engine.query_source(
+            fetch_raw, newest, self.rollups, start, end, sensor_ids, width_px
+        )
+
+    def get_system_messages(self, count=10) -> List[SystemMessage]:
+        self.advance()
+        with self.data_lock:
+            return list(self.system_messages)[-count:]
+
+    def get_connection_stats(self) -> Dict[str, Any]:
+        with self.data_lock:
+            return {
+                "is_connected": False,
+                "is_healthy": False,
+                "sensor_data_count": len(self.sensor_data),
+                "system_message_count": len(self.system_messages),
+                "total_received": self.sensor_data.seq,
+                "port": "SIMULATION",
+                "sensor_count": self.sensor_count,
+                "seed": self.seed,
+                "steps": self.steps,
+            }
+
+
+def create_simulator() -> SensorSimulator:
+    """환경 변수(DASHBOARD_SIM_SENSORS, DASHBOARD_SIM_SEED)로 설정한 시뮬레이터를 생성합니다."""
+
+    def _int_env(name: str) -> Optional[int]:
+        try:
+            return int(os.environ[name])
+        except (KeyError, ValueError):
+            return None
+
+    sensors = _int_env(SIM_SENSORS_ENV)
+    return SensorSimulator(
+        sensor_count=sensors if sensors and sensors > 0 else SIM_DEFAULT_SENSORS, seed=_int_env(SIM_SEED_ENV)
+    )
@@ -0,0 +1,99 @@
+"""앱 시작 시간 측정 (단계별 시간 + import 시간 보고서)
+
+app.py 는 시작 단계마다 `startup.phase(...)` 로 시간을 기록하고, 끝에서 `startup.finish()` 로
+총 시작 시간을 예산(STARTUP_BUDGET_MS)과 비교해 한 줄로 출력합니다. 예산을 넘거나
+DASHBOARD_STARTUP_PROFILE=1 이면 단계별 표도 출력합니다.
+
+`-X importtime` 형식의 모듈별 import 시간과 첫 응답까지의 시간(TTFR)은
+test_files/bench_cold_start.py 가 별도 프로세스로 측정합니다 (importtime_report).
+"""
+
+import contextlib
+import os
+import re
+import subprocess
+import sys
+import time
+from typing import Iterator, List, Optional, Tuple
+
+PROFILE_ENV = "DASHBOARD_STARTUP_PROFILE"
+BUDGET_ENV = "DASHBOARD_STARTUP_BUDGET_MS"
+STARTUP_BUDGET_MS = 1500.0
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class StartupTimer:
+    """프로세스 시작 후 단계별 경과 시간 기록"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+        self._last = self.started
+        self.total_ms: Optional[float] = None
+
+    def mark(self, name: str) -> None:
+        """직전 기록 시점부터 지금까지를 name 단계로 기록"""
+        now = time.perf_counter()
+        self.phases.append((name, (now - self._last) * 1000))
+        self._last = now
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """with 블록 구간을 name 단계로 기록 (직전 기록 이후 블록 전까지는 '기타')"""
+        if time.perf_counter() - self._last > 0.001:
+            self.mark("기타")
+        try:
+            yield
+        finally:
+            self.mark(name)
+
+    def finish(self, budget_ms: Optional[float] = None) -> float:
+        """총 시작 시간을 출력하고 반환합니다."""
+        self.mark("기타")
+        self.total_ms = (time.perf_counter() - self.started) * 1000
+        budget = budget_ms if budget_ms is not None else float(os.environ.get(BUDGET_ENV, STARTUP_BUDGET_MS))
+        over = self.total_ms > budget
+        mark = "⚠️" if over else "⏱️"
+        print(f"{mark} [STARTUP] 시작 {self.total_ms:.0f} ms (예산 {budget:.0f} ms)")
+        if over or _env_flag(PROFILE_ENV):
+            for name, ms in self.phases:
+                if ms >= 0.5:
+                    print(f"   - {name:<12} {ms:8.1f} ms")
+        return self.total_ms
+
+
+# core 패키지가 처음 import 될 때 시작 (app.py 의 첫 import)
+startup = StartupTimer()
+
+
+def parse_importtime(text: str) -> List[Tuple[str, int, int, int]]:
+    """`-X importtime` stderr → [(모듈, self μs, 누적 μs, 깊이)]"""
+    rows = []
+    for line in text.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cum_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cum_us), len(indent) // 2))
+    return rows
+
+
+def importtime_report(
+    target: str = "app", cwd: Optional[str] = None
+) -> Tuple[List[Tuple[str, int, int, int]], str]:
+    """별도 프로세스에서 `import target` 을 -X importtime 으로 실행해 (모듈 목록, stdout) 반환"""
+    env = dict(os.environ, **{PROFILE_ENV: "1"})
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    return parse_importtime(proc.stderr), proc.stdout
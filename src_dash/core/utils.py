@@ -3,6 +3,14 @@
 import os
 import sys
 
+# 1 이면 시작 시 콜백 목록 출력 / 모드 범위 점검 실행 (기본: 생략)
+DEBUG_AUDIT_ENV = "DASHBOARD_DEBUG_AUDIT"
+
+
+def debug_audits_enabled():
+    """시작 시 디버그 점검(콜백 목록 출력, 모드 범위 점검) 실행 여부"""
+    return os.environ.get(DEBUG_AUDIT_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
 
 def configure_console_encoding():
     """콘솔 인코딩을 설정합니다."""
@@ -38,6 +46,27 @@ def post_registration_audit(app):
         print(f"[DEBUG] Callback audit failed: {e}")
 
 
+def mode_scope_audit(app, mode_layouts):
+    """모드별 레이아웃에서 다른 모드 전용 tick 콜백이 트리거되는지 점검합니다.
+
+    mode_layouts: {UIMode: 해당 모드 레이아웃 컴포넌트}
+    """
+    from .mode_callbacks import audit_mode_layouts, layout_component_ids
+
+    try:
+        mode_ids = set().union(*(layout_component_ids(layout) for layout in mode_layouts.values()))
+        base_ids = layout_component_ids(app.layout) - mode_ids
+        issues = audit_mode_layouts(app, mode_layouts, base_ids)
+        for issue in issues:
+            print(f"⚠️ [MODE_AUDIT] {issue}")
+        if not issues:
+            print("✅ [MODE_AUDIT] 모드별 tick 콜백 범위 정상")
+        return issues
+    except (AttributeError, KeyError, TypeError) as e:
+        print(f"[DEBUG] Mode scope audit failed: {e}")
+        return []
+
+
 def print_startup_info(arduino_connected):
     """시작 정보를 출력합니다."""
     print("🚀 DS18B20 JSON 대시보드 시작")
@@ -3,6 +3,8 @@
 import time
 
 import dash
+from core.mode_callbacks import mode_callback
+from core.ui_modes import UIMode
 from dash import Input, Output, State
 
 
@@ -77,13 +79,16 @@ def register_day_callbacks(app, arduino, arduino_connected_ref, COLOR_SEQ, TH_DE
             return "❌ 요청 실패"
         return "통계 요청"
 
-    @app.callback(
+    @mode_callback(
+        app,
+        UIMode.DAY,
         [Output("port-dropdown", "options"), Output("port-dropdown", "value")],
-        [Input("interval-component", "n_intervals")],
+        # 캐시된 Day 레이아웃으로 전환되면 즉시 현재 포트 목록을 채움
+        [Input("ui-version-store", "data"), Input("interval-component", "n_intervals")],
         [State("port-dropdown", "value")],
         prevent_initial_call=True,
     )
-    def refresh_port_options(_n, current_value):
+    def refresh_port_options(_ui_version, _n, current_value):
         try:
             try:
                 from serial.tools import list_ports
@@ -169,6 +174,22 @@ def register_day_callbacks(app, arduino, arduino_connected_ref, COLOR_SEQ, TH_DE
             arduino_connected_ref["connected"] = False
             return f"❌ 오류: {str(e)[:20]}..."
 
+    @app.callback(
+        Output("sensor-intervals-store", "data", allow_duplicate=True),
+        Input("btn-change-interval", "n_clicks"),
+        State("input-interval", "value"),
+        State("sensor-intervals-store", "data"),
+        prevent_initial_call=True,
+    )
+    def record_global_interval(n_clicks, interval_ms, intervals_map):
+        """Day 모드 SET_INTERVAL(전체 센서)을 센서별 주기 store 에 반영 (화면 갱신 주기 계산용)"""
+        if not n_clicks or interval_ms is None or not arduino.is_healthy():
+            raise dash.exceptions.PreventUpdate
+        ms = int(interval_ms)
+        intervals = dict(intervals_map or {})
+        intervals.update({str(i): ms for i in range(1, 9)})
+        return intervals
+
     @app.callback(
         Output("last-command-result", "data"),
         Output("threshold-store", "data"),
@@ -281,5 +281,7 @@ def create_layout_v1(INITIAL_PORT_OPTIONS, selected_port, INITIAL_PORT_VALUE):
                 ],
                 style={"margin": "20px"},
             ),
+            # 이 레이아웃에서만 Day tick 콜백이 실행되도록 tick gate 통과 tick 을 받는 저장소
+            dcc.Store(id="day-tick-store"),
         ]
     )
@@ -1,8 +1,12 @@
 """Night Mode (v2) 콜백 함수들"""
 
 import dash
+from core.client_sync import delta_payload, figure_skeletons, parse_cursor, snapshot_delta
+from core.figure_templates import WEBGL_POINT_THRESHOLD
+from core.live_outputs import compact_readings, log_entries
+from core.mode_callbacks import TICK_STORES, mode_callback
 from core.ui_modes import UIMode
-from dash import Input, Output, State, html
+from dash import ClientsideFunction, Input, Output, State
 
 from .connection_utils import (
     attempt_arduino_connection,
@@ -11,13 +15,35 @@ from .connection_utils import (
     get_port_options_safely,
     safe_disconnect_arduino,
 )
-from .mini_graph_utils import create_empty_mini_graph, create_sensor_mini_graph, prepare_dataframe
+
+LOG_ENTRY_STYLE = {"color": "white", "marginBottom": "2px"}
 
 
 def register_night_callbacks(
-    app, arduino, arduino_connected_ref, COLOR_SEQ, TH_DEFAULT, TL_DEFAULT, _snapshot
+    app,
+    arduino,
+    arduino_connected_ref,
+    COLOR_SEQ,
+    TH_DEFAULT,
+    TL_DEFAULT,
+    _snapshot,
+    delta_func=None,
+    webgl_threshold=WEBGL_POINT_THRESHOLD,
 ):
-    """Night mode 관련 콜백들을 등록"""
+    """Night mode 관련 콜백들을 등록
+
+    delta_func 는 브라우저 버퍼 cursor 이후의 신규 포인트를 반환합니다 (data_manager.create_delta_function).
+    webgl_threshold 는 미니 그래프의 scattergl 전환 기준입니다 (core.figure_templates.WEBGL_POINT_THRESHOLD).
+    """
+    if delta_func is None:
+
+        def delta_func(cursor=None, snapshot=None):
+            # with_history=False 스냅샷에는 그래프 구간이 없으므로 다시 조회
+            return snapshot_delta(_snapshot())
+
+    def skeletons():
+        # figure 골격은 첫 동기화 때 만들어 캐시 (plotly 템플릿 로드를 시작 시점에서 미룸)
+        return figure_skeletons(TH_DEFAULT, TL_DEFAULT, COLOR_SEQ, webgl_threshold)
 
     # V2 제어 버튼 콜백들
     @app.callback(
@@ -119,32 +145,10 @@ def register_night_callbacks(
             return "❌ 요청 실패"
         return "통계 요청"
 
-    # V2 시스템 로그 업데이트 콜백
-    @app.callback(
-        Output("system-log-v2", "children"),
-        Input("interval-component", "n_intervals"),
-        State("ui-version-store", "data"),
-        prevent_initial_call=True,
-    )
-    def update_system_log_v2(_n, ui_version):
-        if not UIMode.is_night(ui_version):
-            return dash.no_update
-        _, _, _current_temps, _latest_data, system_messages = _snapshot()
-        log_entries = []
-        for msg in system_messages:
-            ts = msg["timestamp"].strftime("%H:%M:%S")
-            level_icons = {"info": "ℹ️", "warning": "⚠️", "error": "❌"}
-            icon = level_icons.get(msg["level"], "📝")
-            log_entries.append(
-                html.Div(
-                    f"[{ts}] {icon} {msg['message']}",
-                    style={"color": "white", "marginBottom": "2px"},
-                )
-            )
-        return log_entries
-
     # V2 포트 드롭다운 콜백
-    @app.callback(
+    @mode_callback(
+        app,
+        UIMode.NIGHT,
         [Output("port-dropdown-v2", "options"), Output("port-dropdown-v2", "value")],
         [Input("ui-version-store", "data"), Input("interval-component", "n_intervals")],
         [State("port-dropdown-v2", "value")],
@@ -152,9 +156,6 @@ def register_night_callbacks(
     )
     def unified_refresh_v2_ports(ui_version, _n, current_value):
         """V2 포트 드롭다운을 새로고침합니다."""
-        if not UIMode.is_night(ui_version):
-            return dash.no_update, dash.no_update
-
         try:
             # 🔥 핵심 수정: 현재 Arduino가 연결된 포트 확인
             current_arduino_port = None
@@ -191,135 +192,49 @@ def register_night_callbacks(
         except (ImportError, AttributeError, OSError):
             return dash.no_update, dash.no_update
 
-    # 미니 그래프 업데이트 콜백
-    @app.callback(
-        [Output(f"sensor-{i}-mini-graph", "figure") for i in range(1, 9)],
-        Input("interval-component", "n_intervals"),
-        State("ui-version-store", "data"),
+    # Night 모드 실시간 출력 디스패처 (스냅샷 1회 → 카드 데이터/로그/그래프 delta, tick gate 통과 시에만)
+    @mode_callback(
+        app,
+        UIMode.NIGHT,
+        [
+            Output("live-readings-store", "data", allow_duplicate=True),
+            Output("system-log-v2", "children"),
+            Output("sensor-delta-store", "data", allow_duplicate=True),
+        ],
+        Input(TICK_STORES[UIMode.NIGHT], "data"),
+        [State("sensor-cursor-store", "data"), State("ui-version-store", "data")],
         prevent_initial_call=True,
     )
-    def update_v2_mini_graphs(_n, ui_version):
-        """V2 미니 그래프들을 업데이트합니다."""
-        if not UIMode.is_night(ui_version):
-            return [dash.no_update] * 8
-
-        _, _, _current_temps, latest_data, _msgs = _snapshot()
-
-        # 데이터가 없는 경우 빈 그래프 반환
-        if not latest_data:
-            return [create_empty_mini_graph() for _ in range(8)]
-
-        # 데이터프레임 준비
-        df = prepare_dataframe(latest_data)
-        if df is None:
-            return [create_empty_mini_graph() for _ in range(8)]
-
-        # 각 센서별 그래프 생성
-        figures = []
-        ranges_debug = []
-
-        for sid in range(1, 9):
-            sensor_data = df[df["sensor_id"] == sid]
-            fig = create_sensor_mini_graph(sensor_data, sid, COLOR_SEQ, TH_DEFAULT, TL_DEFAULT)
-            figures.append(fig)
-
-            # 디버그 정보 수집
-            if not sensor_data.empty:
-                y = sensor_data["temperature"]
-                vmin, vmax = float(min(y)), float(max(y))
-                ranges_debug.append(f"{sid}:{vmin:.1f}-{vmax:.1f}")
-
-        if ranges_debug:
-            print("🌙 v2 mini graphs 갱신: " + ", ".join(ranges_debug))
-
-        return figures
-
-    # Night 모드 센서 상태 및 주소 업데이트 콜백
-    @app.callback(
+    def update_v2_live(_tick, cursor, ui_version):
+        snapshot = _snapshot(with_history=False)
+        _, _, current_temps, _latest_data, system_messages = snapshot
+        first_sync = parse_cursor(cursor)[0] is None
+        return (
+            compact_readings(current_temps),
+            log_entries(system_messages, style=LOG_ENTRY_STYLE),
+            delta_payload(delta_func(cursor, snapshot=snapshot), skeletons() if first_sync else None),
+        )
+
+    # 센서 카드 + 우측 패널 현재 온도 포맷은 브라우저에서 처리 (assets/sensor_cards.js)
+    app.clientside_callback(
+        ClientsideFunction(namespace="sensor_cards", function_name="night"),
         [Output(f"sensor-{i}-temp", "children", allow_duplicate=True) for i in range(1, 9)]
         + [Output(f"sensor-{i}-status", "children", allow_duplicate=True) for i in range(1, 9)]
-        + [Output(f"sensor-{i}-address", "children", allow_duplicate=True) for i in range(1, 9)],
-        Input("interval-component", "n_intervals"),
+        + [Output(f"sensor-{i}-address", "children", allow_duplicate=True) for i in range(1, 9)]
+        + [Output(f"sensor-{i}-current-temp", "children") for i in range(1, 9)],
+        Input("live-readings-store", "data"),
         State("ui-version-store", "data"),
         prevent_initial_call=True,
     )
-    def update_v2_sensor_displays(_n, ui_version):
-        if not UIMode.is_night(ui_version):
-            return [dash.no_update] * 24  # 8센서 x 3개 출력 = 24개
-
-        _, _, current_temps, latest_data, _msgs = _snapshot()
-
-        # 메인 온도 표시 (큰 글씨)
-        main_temps = []
-        # 상태 표시
-        statuses = []
-        # 주소 표시
-        addresses = []
-
-        for sid in range(1, 9):
-            if sid in current_temps:
-                info = current_temps[sid]
-                temp = info["temperature"]
-                status = info.get("status", "")
-
-                # 메인 온도 표시
-                main_temps.append(f"{temp:.1f}°C")
-
-                # 상태 표시
-                if status == "ok":
-                    statuses.append("정상")
-                elif status == "simulated":
-                    statuses.append("시뮬레이션")
-                else:
-                    statuses.append("연결 없음")
-
-                # 주소 표시
-                address = info.get("address", "")
-                if address:
-                    # 실제 주소가 있는 경우
-                    formatted_address = f"{address[:4]}:{address[4:8]}:" f"{address[8:12]}:{address[12:16]}"
-                    addresses.append(formatted_address)
-                elif status == "simulated":
-                    # 시뮬레이션 모드용 더미 주소
-                    dummy_address = f"28FF{sid:02d}1E{sid:02d}16{sid:02d}3C"
-                    formatted_address = (
-                        f"{dummy_address[:4]}:{dummy_address[4:8]}:"
-                        f"{dummy_address[8:12]}:{dummy_address[12:16]}"
-                    )
-                    addresses.append(formatted_address)
-                else:
-                    addresses.append("----:----:----:----")
 
-            else:
-                main_temps.append("--°C")
-                statuses.append("연결 없음")
-                addresses.append("----:----:----:----")
-
-        return main_temps + statuses + addresses
-
-    # Night 모드 전용 현재 온도 표시 콜백 (우측 패널용)
-    @app.callback(
-        [Output(f"sensor-{i}-current-temp", "children") for i in range(1, 9)],
-        Input("interval-component", "n_intervals"),
-        State("ui-version-store", "data"),
+    # 미니 그래프 8개 (브라우저 버퍼에서 다시 그림, 센서별 임계값 반영, assets/sensor_buffer.js)
+    app.clientside_callback(
+        ClientsideFunction(namespace="sensor_buffer", function_name="mini_graphs"),
+        [Output(f"sensor-{i}-mini-graph", "figure") for i in range(1, 9)],
+        Input("sensor-data-store", "data"),
+        State("threshold-store", "data"),
         prevent_initial_call=True,
     )
-    def update_v2_current_temp_displays(_n, ui_version):
-        if not UIMode.is_night(ui_version):
-            return [dash.no_update] * 8
-
-        _, _, current_temps, latest_data, _msgs = _snapshot()
-        current_temp_displays = []
-
-        for sid in range(1, 9):
-            if sid in current_temps:
-                info = current_temps[sid]
-                temp = info["temperature"]
-                current_temp_displays.append(f"{temp:.1f}°C")
-            else:
-                current_temp_displays.append("--°C")
-
-        return current_temp_displays
 
     # 모달 관련 콜백들
     def _format_interval(ms: int) -> str:
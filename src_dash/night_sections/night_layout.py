@@ -1,6 +1,6 @@
 """Night Mode (v2) 레이아웃 - 섹션별로 분리된 구조"""
 
-from dash import html
+from dash import dcc, html
 
 from .controls import create_control_log_section
 from .main_graph import create_combined_graph_section
@@ -20,7 +20,11 @@ def create_layout_v2(
     tl_default=None,
     snapshot_func=None,
 ):
-    """Night mode (v2) – dark theme; 섹션별로 분리된 구조"""
+    """Night mode (v2) – dark theme; 섹션별로 분리된 구조
+
+    Day 전용 출력(temp-graph 등)의 숨김 플레이스홀더는 두지 않습니다.
+    플레이스홀더가 있으면 Day 콜백이 Night 모드에서도 매 tick 트리거됩니다.
+    """
     print("🔍 [NIGHT_LAYOUT] create_layout_v2 함수 시작")
 
     try:
@@ -52,19 +56,6 @@ def create_layout_v2(
         traceback.print_exc()
         raise
 
-    # 5. 숨겨진 플레이스홀더 (공유 콜백 출력용)
-    hidden_placeholders = html.Div(
-        [
-            html.Div(id="connection-status"),
-            html.Div(id="temp-graph"),  # dcc.Graph 대신 html.Div 사용
-            html.Div(id="system-log"),
-            html.Div(id="detail-sensor-dropdown"),  # dcc.Dropdown 대신 html.Div 사용
-            html.Div(id="detail-sensor-graph"),  # dcc.Graph 대신 html.Div 사용
-            *[html.Div(id=f"sensor-{i}-status") for i in range(1, 9)],
-        ],
-        style={"display": "none"},
-    )
-
     # 전체 레이아웃 구성
     return html.Div(
         style={
@@ -89,7 +80,7 @@ def create_layout_v2(
             combined_graph_block,
             # 4. 제어&로그 섹션
             control_panel_v2,
-            # 5. 숨겨진 플레이스홀더
-            hidden_placeholders,
+            # 이 레이아웃에서만 Night tick 콜백이 실행되도록 tick gate 통과 tick 을 받는 저장소
+            dcc.Store(id="night-tick-store"),
         ],
     )
@@ -0,0 +1,52 @@
+import os
+import sys
+
+# allow importing core module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from core.callback_metrics import instrument_callbacks, register_metrics_route
+from dash import Dash, Input, Output, html
+from dash.exceptions import PreventUpdate
+
+
+def _app():
+    app = Dash(__name__)
+    app.layout = html.Div([html.Button(id="btn"), html.Div(id="out")])
+
+    @app.callback(Output("out", "children"), Input("btn", "n_clicks"))
+    def echo(n_clicks):
+        if n_clicks == 2:
+            raise PreventUpdate
+        return f"clicked {n_clicks}"
+
+    return app
+
+
+def _click(client, n):
+    body = {
+        "output": "out.children",
+        "outputs": {"id": "out", "property": "children"},
+        "inputs": [{"id": "btn", "property": "n_clicks", "value": n}],
+        "changedPropIds": ["btn.n_clicks"],
+    }
+    return client.post("/_dash-update-component", json=body)
+
+
+def test_callbacks_are_counted_and_exposed_on_metrics_route():
+    app = _app()
+    metrics = instrument_callbacks(app)
+    register_metrics_route(app, metrics, lambda: ["dashboard_extra 1"])
+    client = app.server.test_client()
+
+    ok = _click(client, 1)
+    assert ok.status_code == 200
+    assert _click(client, 2).status_code == 204
+
+    stats = metrics.snapshot()["echo"]
+    assert stats["calls"] == 2 and stats["prevented"] == 1 and stats["errors"] == 0
+    assert stats["bytes"] == len(ok.data)
+
+    text = client.get("/metrics").get_data(as_text=True)
+    assert 'dashboard_callback_calls_total{callback="echo",outcome="ok"} 1' in text
+    assert 'dashboard_callback_duration_seconds_bucket{callback="echo",le="+Inf"} 2' in text
+    assert "dashboard_extra 1" in text
+    assert client.get("/metrics", environ_base={"REMOTE_ADDR": "10.0.0.5"}).status_code == 403
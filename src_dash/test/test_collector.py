@@ -0,0 +1,114 @@
+import os
+import socket
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+# allow importing core module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from core.collector_client import CollectorClient, CollectorUnavailable
+from core.collector_protocol import ERROR, REPLY, REQUEST, encode_frame, read_frame
+from core.collector_service import CollectorServer, write_token
+from core.serial_json_communication import ArduinoSerial
+
+
+def test_frame_roundtrip_keeps_arrays_datetimes_and_int_keys():
+    import io
+
+    ts = np.array(["2024-01-01T00:00:00.5"], dtype="datetime64[us]")
+    message = {
+        "id": 3,
+        "result": ["e1", 7, {1: (ts, np.array([21.5])), "sla": {"ok": True}}, datetime(2024, 1, 1)],
+    }
+    kind, decoded = read_frame(io.BytesIO(encode_frame(REPLY, message)))
+    epoch, seq, series, when = decoded["result"]
+    assert kind == REPLY and (epoch, seq, when) == ("e1", 7, datetime(2024, 1, 1))
+    assert np.array_equal(series[1][0], ts) and series[1][1].tolist() == [21.5]
+    assert series["sla"] == {"ok": True}
+
+
+@pytest.fixture
+def served_arduino():
+    arduino = ArduinoSerial(port="TEST")
+    arduino.is_connected = True
+    arduino.connection_time = datetime.now()
+    arduino.serial_connection = type("Port", (), {"is_open": True})()
+    arduino._process_line('{"type":"sensor","id":1,"temp":21.5,"status":"ok"}')
+    arduino._process_line("SENSOR_DATA,2,22.25,1000")
+    if hasattr(socket, "AF_UNIX"):
+        address = os.path.join(tempfile.mkdtemp(), "c.sock")
+    else:
+        address = "127.0.0.1:0"
+    server = CollectorServer(arduino, address, token_file=os.path.join(tempfile.mkdtemp(), "token"))
+    if isinstance(server._server.server_address, tuple):
+        server.address = "%s:%d" % server._server.server_address
+    server.start()
+    yield arduino, server
+    server.shutdown()
+
+
+def test_thin_client_mirrors_arduino_api(served_arduino):
+    arduino, server = served_arduino
+    if server.token is None:
+        assert os.stat(server.address).st_mode & 0o777 == 0o600  # bind 시점부터 소유자 전용
+    client = CollectorClient(server.address, token_file=server.token_file)
+    try:
+        assert client.is_healthy() and client.port == "TEST"
+        assert client.get_current_temperatures()[1]["temperature"] == 21.5
+        epoch, seq, reset, arrays = client.get_sensor_delta()
+        assert (epoch, seq, reset) == (arduino.sensor_data.epoch, 2, True)
+        assert arrays[2][1].tolist() == [22.25]
+        now = datetime.now()
+        assert set(client.query_sensor_range(now - timedelta(minutes=1), now, [1, 2])) == {1, 2}
+        assert client.tracer.rendered(epoch, seq) == 2
+        assert any(line.startswith("dashboard_ingest_lines_total") for line in client.ingest_metric_lines())
+
+        events = client.events(interval=0.05)
+        first = next(events)
+        assert first["event"] == "readings" and first["cursor"] == 2
+        events.close()
+    finally:
+        client.close()
+
+
+def test_client_degrades_when_collector_is_down():
+    client = CollectorClient(
+        os.path.join(tempfile.mkdtemp(), "missing.sock") if hasattr(socket, "AF_UNIX") else "127.0.0.1:1"
+    )
+    assert client.is_healthy() is False
+    assert client.get_current_temperatures() == {}
+    with pytest.raises(CollectorUnavailable):
+        client.ping()
+
+
+def test_tcp_collector_requires_loopback_and_token(served_arduino):
+    arduino, _ = served_arduino
+    with pytest.raises(ValueError):
+        CollectorServer(arduino, "0.0.0.0:0")
+
+    token_file = os.path.join(tempfile.mkdtemp(), "token")
+    server = CollectorServer(arduino, "127.0.0.1:0", token_file=token_file)
+    server.address = "%s:%d" % server._server.server_address[:2]
+    server.start()
+    try:
+        if os.name == "posix":
+            assert os.stat(token_file).st_mode & 0o777 == 0o600
+        assert CollectorClient(server.address, token_file=token_file).ping()["pid"] == os.getpid()
+
+        wrong = os.path.join(tempfile.mkdtemp(), "wrong")
+        write_token(wrong)
+        with pytest.raises(CollectorUnavailable):
+            CollectorClient(server.address, token_file=wrong).ping()
+
+        # 토큰 없이 바로 요청하면 응답 없이 연결 종료
+        sock = socket.create_connection(server._server.server_address[:2], timeout=5)
+        sock.sendall(encode_frame(REQUEST, {"id": 1, "op": "status", "args": {}}))
+        kind, _ = read_frame(sock.makefile("rb"))
+        assert kind == ERROR
+        sock.close()
+    finally:
+        server.shutdown()
+    assert not os.path.exists(token_file)
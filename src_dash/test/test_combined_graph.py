@@ -8,7 +8,9 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 import plotly.graph_objects as go
 from core.shared_callbacks import register_shared_callbacks
 from core.ui_modes import UIMode
-from dash import Dash
+from dash import Dash, Patch
+from dash._callback_context import context_value
+from dash._utils import AttributeDict
 
 
 def snapshot_stub(*args, **kwargs):
@@ -36,14 +38,63 @@ def test_empty_selection_returns_empty_figure():
     # Dash v2 organizes callback_map keys as output+input combo
     cb_func = None
     for cb in app.callback_map.values():
-        if cb["callback"].__name__ == "update_combined_graph":
+        if "callback" in cb and cb["callback"].__name__ == "update_combined_graph":
             cb_func = cb["callback"]
             break
     assert cb_func, "update_combined_graph callback not registered"
     # Call original callback function with empty selection (bypass Dash wrapper)
     orig_func = getattr(cb_func, "__wrapped__", cb_func)
-    fig = orig_func(0, [], UIMode.NIGHT.value)
-    assert isinstance(fig, go.Figure)
-    assert not fig.data
-    title = fig.layout.title.text if fig.layout.title else fig.layout["title"]
+    fig = orig_func([], None, UIMode.NIGHT.value)
+    # figure 골격 기반 plain dict (go.Figure 로 검증 가능해야 함)
+    assert isinstance(fig, dict)
+    assert not fig["data"]
+    assert not go.Figure(fig).data
+    title = fig["layout"]["title"]["text"]
     assert "센서 선택 없음" in title
+
+
+def _zoom_callback(threshold):
+    def range_query(start, end, sensor_ids, width_px):
+        return {sid: (list(range(300)), [20.0] * 300) for sid in sensor_ids}
+
+    app = Dash(__name__, suppress_callback_exceptions=True)
+    register_shared_callbacks(
+        app, snapshot_stub, ["#111", "#222"], 0.0, 0.0, range_query, webgl_threshold=threshold
+    )
+    cb_func = next(
+        cb["callback"]
+        for cb in app.callback_map.values()
+        if "callback" in cb and cb["callback"].__name__ == "update_combined_graph"
+    )
+    return getattr(cb_func, "__wrapped__", cb_func)
+
+
+def _triggered(prop_id):
+    context_value.set(AttributeDict(triggered_inputs=[{"prop_id": prop_id, "value": None}]))
+
+
+RELAYOUT = {"xaxis.range[0]": "2025-01-01 00:00:00", "xaxis.range[1]": "2025-01-01 01:00:00"}
+
+
+def test_zoomed_range_switches_to_webgl_above_threshold():
+    _triggered("combined-graph.relayoutData")
+    svg = _zoom_callback(5000)(["1"], RELAYOUT, UIMode.DAY.value)
+    assert {t["type"] for t in svg["data"]} == {"scatter"}
+    gl = _zoom_callback(500)(["1", "2"], RELAYOUT, UIMode.DAY.value)
+    assert {t["type"] for t in gl["data"]} == {"scattergl"}
+    assert [t["line"]["color"] for t in gl["data"][:3]] == ["#111", "#222", "#111"]
+    assert go.Figure(gl).data[0].type == "scattergl"
+
+
+def test_zoomed_toggle_patches_visibility_only():
+    update = _zoom_callback(5000)
+    _triggered("combined-graph.relayoutData")
+    fig = update(["1", "3"], RELAYOUT, UIMode.DAY.value)
+    assert [t["visible"] for t in fig["data"]] == [sid in (1, 3) for sid in range(1, 9)]
+
+    _triggered("sensor-line-toggle.value")
+    patch = update(["2"], RELAYOUT, UIMode.DAY.value)
+    assert isinstance(patch, Patch)
+    ops = patch.to_plotly_json()["operations"]
+    assert [op["location"] for op in ops] == [["data", i, "visible"] for i in range(8)]
+    assert [op["params"]["value"] for op in ops] == [sid == 2 for sid in range(1, 9)]
@@ -0,0 +1,82 @@
+import os
+import sys
+import time
+
+import pytest
+
+# allow importing core module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from core.fleet_manager import FleetManager, parse_fleet_ports
+
+
+class _PolledPort:
+    """fileno() 없는 포트 (Windows COM 포트와 같은 경로)"""
+
+    def __init__(self):
+        self.is_open = True
+        self.buf = bytearray()
+
+    @property
+    def in_waiting(self):
+        return len(self.buf)
+
+    def read(self, size=1):
+        data = bytes(self.buf[:size])
+        del self.buf[:size]
+        return data
+
+    def write(self, data):
+        return len(data)
+
+    def close(self):
+        self.is_open = False
+
+
+def _wait(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.mark.skipif(not hasattr(os, "openpty"), reason="pty 필요")
+def test_boards_share_one_io_thread_and_are_tagged():
+    import serial
+
+    master, slave = os.openpty()
+    tty = serial.Serial(os.ttyname(slave), timeout=0.1)
+    polled = _PolledPort()
+    fleet = FleetManager(poll_interval=0.005)
+    fleet.start()
+    try:
+        fleet.add_board("pty", "rack1", connection=tty)
+        fleet.add_board("COM9", "rack2", connection=polled)
+        os.write(master, b'{"type":"sensor","id":1,"temp":21.5,"status":"ok"}\n')
+        polled.buf += b"SENSOR_DATA,1,30.25,1000\nSENSOR_DATA,2,31.0,1000\n"
+        assert _wait(
+            lambda: fleet.board("rack1").total_received == 1 and fleet.board("rack2").total_received == 2
+        )
+
+        temps = fleet.get_current_temperatures()
+        assert temps["rack1"][1]["temperature"] == 21.5
+        assert temps["rack2"][1]["temperature"] == 30.25
+        stats = fleet.get_board_stats()
+        assert stats["rack1"]["selectable"] and not stats["rack2"]["selectable"]
+        assert 'dashboard_fleet_lines_total{board="rack2"} 2' in "\n".join(fleet.metric_lines())
+
+        assert fleet.remove_board("rack2") and not polled.is_open
+        assert fleet.board_ids() == ["rack1"]
+        fleet.add_board("COM9", "rack2", connection=_PolledPort())
+        with pytest.raises(ValueError):
+            fleet.add_board("COM9", "rack2", connection=_PolledPort())
+    finally:
+        fleet.stop()
+        os.close(master)
+        os.close(slave)
+    assert fleet.board_ids() == []
+
+
+def test_parse_fleet_ports():
+    assert parse_fleet_ports("rack1=/dev/ttyACM0, COM5,") == {"rack1": "/dev/ttyACM0", "COM5": "COM5"}
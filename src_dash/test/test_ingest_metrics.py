@@ -0,0 +1,33 @@
+import logging
+import os
+import sys
+
+# allow importing core module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from core.serial_json_communication import ArduinoSerial
+
+
+def test_parse_results_and_drops_are_counted():
+    arduino = ArduinoSerial(port="TEST")
+    logging.disable(logging.WARNING)
+    try:
+        arduino._process_line('{"type":"sensor","id":1,"temp":21.5,"status":"ok"}')
+        arduino._process_line('{"type":"sensor","id":1,"temp":}')
+        arduino._process_line("SENSOR_DATA,2,22.25,1000")
+        arduino._process_line("SENSOR_DATA,2,abc,1000")
+        arduino._process_line("garbage")
+        for i in range(arduino.system_messages.maxlen + 3):
+            arduino._process_line(f"SYSTEM,boot {i}")
+    finally:
+        logging.disable(logging.NOTSET)
+
+    metrics = arduino.get_ingest_metrics()
+    assert metrics["parse_ok"]["json"] == 1 and metrics["parse_errors"]["json"] == 1
+    assert metrics["parse_errors"]["csv"] == 2
+    assert metrics["parse_ok"]["csv"] == 1 + arduino.system_messages.maxlen + 3
+    assert metrics["system_messages_dropped"] == 3
+    assert metrics["lock_wait_seconds"]["count"] == 2 + 1 + arduino.system_messages.maxlen + 3
+
+    text = "\n".join(arduino.ingest_metric_lines())
+    assert 'dashboard_ingest_parse_total{format="csv",result="error"} 2' in text
+    assert 'dashboard_ingest_records_dropped_total{buffer="system"} 3' in text
@@ -0,0 +1,54 @@
+import logging
+import os
+import sys
+
+# allow importing core module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from core.latency_trace import LatencyTracer
+from core.serial_json_communication import ArduinoSerial
+
+
+def test_stages_follow_reading_from_serial_to_render():
+    arduino = ArduinoSerial(port="TEST")
+    logging.disable(logging.WARNING)
+    try:
+        arduino._process_line('{"type":"sensor","timestamp":1000,"id":1,"temp":21.5,"status":"ok"}')
+        arduino._process_line("SENSOR_DATA,2,22.25,1000")
+    finally:
+        logging.disable(logging.NOTSET)
+
+    epoch, seq, _reset, _arrays = arduino.get_sensor_delta()
+    assert arduino.tracer.rendered("other-epoch", seq) == 0
+    assert arduino.tracer.rendered(epoch, seq) == 2
+
+    summary = arduino.get_latency_summary()
+    assert set(summary) == {1, 2, "all", "sla"}
+    assert summary["all"]["total"]["count"] == 2
+    for stage in ("transport", "parse", "serve", "render", "total"):
+        assert summary[1][stage]["count"] == 1
+        assert summary[1][stage]["p99"] >= 0
+    assert summary["sla"]["ok"] is True
+    text = "\n".join(arduino.tracer.metric_lines())
+    assert 'dashboard_e2e_latency_seconds_count{sensor="2",stage="total"} 1' in text
+
+
+def test_unrendered_traces_are_bounded_and_epoch_change_resets():
+    tracer = LatencyTracer(capacity=3)
+    for seq in range(1, 6):
+        tracer.parsed("a", seq, 1, None, 0.0)
+    tracer.served("a", 5)
+    assert tracer.dropped == 2
+    tracer.parsed("b", 1, 1, None, 0.0)
+    assert tracer.rendered("a", 5) == 0
+    tracer.served("b", 1)
+    assert tracer.rendered("b", 1) == 1
+
+
+def test_render_without_serve_record_keeps_total_only():
+    # 공유 메모리 링으로 다른 프로세스가 응답한 측정값
+    tracer = LatencyTracer()
+    tracer.parsed("a", 1, 1, None, 0.0)
+    assert tracer.rendered("a", 1) == 1
+    stages = tracer.summary()[1]
+    assert stages["total"]["count"] == 1
+    assert "serve" not in stages or stages["serve"]["count"] == 0
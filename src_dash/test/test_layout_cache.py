@@ -0,0 +1,23 @@
+import os
+import sys
+
+# allow importing core module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from core.layout_cache import create_layout_cache
+from core.ui_modes import UIMode
+from dash import html
+
+
+def test_layouts_are_built_once_per_mode():
+    calls = []
+
+    def build(name):
+        calls.append(name)
+        return html.Div([html.H2(name), html.Div(id=f"{name}-content")])
+
+    layout_for = create_layout_cache({UIMode.DAY: lambda: build("day"), UIMode.NIGHT: lambda: build("night")})
+    assert layout_for("v1") is layout_for(UIMode.DAY)
+    payload = layout_for("v2", serialized=True)
+    assert payload is layout_for(UIMode.NIGHT, serialized=True)
+    assert payload["type"] == "Div" and payload["props"]["children"][1]["props"]["id"] == "night-content"
+    assert calls == ["day", "night"]
@@ -0,0 +1,21 @@
+import os
+import sys
+
+# allow importing core module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from core.live_outputs import compact_readings
+from core.records import SensorStatus
+
+
+def test_compact_readings_is_sorted_json_array():
+    current = {
+        3: {"temperature": 18.0, "status": "error"},
+        1: {"temperature": 21.256, "status": SensorStatus.OK, "address": "28FF641E8016043C"},
+        2: {"temperature": None, "status": "simulated"},
+    }
+    assert compact_readings(current) == [
+        [1, 21.26, "ok", "28FF641E8016043C"],
+        [2, None, "simulated", ""],
+        [3, 18.0, "error", ""],
+    ]
+    assert compact_readings({}) == []
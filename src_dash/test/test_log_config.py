@@ -0,0 +1,29 @@
+import logging
+import os
+import sys
+
+# allow importing core module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from core.log_config import HOTPATH_LOGGER, RateLimitFilter, parse_levels
+
+
+def _record(msg, *args):
+    return logging.LogRecord(HOTPATH_LOGGER, logging.DEBUG, __file__, 1, msg, args, None)
+
+
+def test_rate_limit_is_per_message_format_and_reports_skipped():
+    limiter = RateLimitFilter(rate=0.0, burst=2)
+    passed = [limiter.filter(_record("📥 수신: %s", i)) for i in range(5)]
+    assert passed == [True, True, False, False, False]
+    assert limiter.filter(_record("JSON 파싱 오류: %s", "x"))
+    assert limiter.suppressed == 3
+
+    limiter.rate = 1e9  # 토큰 즉시 회복
+    record = _record("📥 수신: %s", 9)
+    assert limiter.filter(record)
+    assert record.getMessage() == "[3건 생략] 📥 수신: 9"
+
+
+def test_parse_levels_accepts_aliases_and_skips_invalid():
+    levels = parse_levels("hotpath=debug, werkzeug=WARNING,bad,serial=NOPE")
+    assert levels == {HOTPATH_LOGGER: logging.DEBUG, "werkzeug": logging.WARNING}
@@ -0,0 +1,76 @@
+import os
+import sys
+
+import pytest
+
+# allow importing core module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from core.app_layout import create_main_layout
+from core.mode_callbacks import audit_mode_layouts, layout_component_ids, mode_callback, mode_registry
+from core.shared_callbacks import register_shared_callbacks
+from core.ui_modes import UIMode
+from dash import Dash, Input, Output
+from dash.exceptions import PreventUpdate
+from day_sections.day_callbacks import register_day_callbacks
+from day_sections.day_layout import create_layout_v1
+from night_sections.night_callbacks import register_night_callbacks
+from night_sections.night_layout import create_layout_v2
+
+
+def snapshot_stub(*args, **kwargs):
+    return "", {}, {}, [], []
+
+
+def test_mode_callback_skips_other_mode():
+    app = Dash(__name__)
+
+    @mode_callback(app, UIMode.NIGHT, Output("out", "children"), Input("interval-component", "n_intervals"))
+    def night_only(n):
+        return f"tick {n}"
+
+    func = next(cb["callback"] for cb in app.callback_map.values())
+    gated = func.__wrapped__
+    assert gated(3, UIMode.NIGHT.value) == "tick 3"
+    with pytest.raises(PreventUpdate):
+        gated(3, UIMode.DAY.value)
+    assert mode_registry(app).skipped == 1
+
+
+def test_mode_layouts_only_trigger_own_tick_callbacks():
+    app = Dash(__name__, suppress_callback_exceptions=True)
+    register_shared_callbacks(app, snapshot_stub, ["#000"], 55.0, -25.0)
+    register_day_callbacks(app, None, {"connected": False}, ["#000"], 55.0, -25.0, snapshot_stub)
+    register_night_callbacks(app, None, {"connected": False}, ["#000"], 55.0, -25.0, snapshot_stub)
+
+    options = [{"label": "COM4", "value": "COM4"}]
+    day = create_layout_v1(options, "COM4", "COM4")
+    night = create_layout_v2(options, "COM4", "COM4")
+    base_ids = layout_component_ids(create_main_layout(options, "COM4", "COM4", lambda *a: None))
+
+    assert audit_mode_layouts(app, {UIMode.DAY: day, UIMode.NIGHT: night}, base_ids) == []
+    registry = mode_registry(app)
+    night_ids = layout_component_ids(night) | base_ids
+    assert [name for _, name in registry.triggered_in(night_ids)] == [
+        "unified_refresh_v2_ports",
+        "update_v2_live",
+    ]
+    day_ids = layout_component_ids(day) | base_ids
+    assert [name for _, name in registry.triggered_in(day_ids)] == ["update_day_live", "refresh_port_options"]
+
+
+def test_callback_with_any_output_present_is_triggered():
+    app = Dash(__name__)
+
+    @mode_callback(
+        app,
+        UIMode.DAY,
+        [Output("day-only", "children"), Output("shared-store", "data")],
+        Input("interval-component", "n_intervals"),
+    )
+    def day_tick(n):
+        return n, n
+
+    # 렌더러는 없는 출력만 빼고 실행하므로 공통 저장소만 있어도 트리거됨
+    registry = mode_registry(app)
+    assert registry.triggered_in({"interval-component", "shared-store"}) == [(UIMode.DAY, "day_tick")]
+    assert registry.triggered_in({"shared-store"}) == []
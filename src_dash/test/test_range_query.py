@@ -0,0 +1,82 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+# allow importing core module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from core.range_query import (
+    RangeQueryEngine,
+    RollupStore,
+    downsample_minmax,
+    parse_relayout_range,
+    series_from_arrays,
+)
+from core.sensor_store import SensorDataStore
+
+T0 = datetime(2025, 1, 1, 12, 0, 0)
+
+
+def make_records(n, sensors=(1, 2)):
+    return [
+        {"timestamp": T0 + timedelta(seconds=i), "sensor_id": sid, "temperature": float(i % 7)}
+        for i in range(n)
+        for sid in sensors
+    ]
+
+
+def test_parse_relayout_range_forms():
+    assert parse_relayout_range(None) is None
+    assert parse_relayout_range({"xaxis.autorange": True}) is None
+    assert parse_relayout_range({"autosize": True}) is None
+    start, end = parse_relayout_range(
+        {"xaxis.range[0]": "2025-01-01 12:00:01.5", "xaxis.range[1]": "2025-01-01 12:00:09"}
+    )
+    assert start == T0 + timedelta(seconds=1, milliseconds=500)
+    assert end == T0 + timedelta(seconds=9)
+    assert parse_relayout_range({"xaxis.range": ["2025-01-01 12:00:09", "2025-01-01 12:00:01"]})[0] < end
+
+
+def test_downsample_keeps_extremes():
+    ts = [T0 + timedelta(seconds=i) for i in range(1000)]
+    ys = [0.0] * 1000
+    ys[500] = 99.0
+    xs, out = downsample_minmax(ts, ys, 100)
+    assert len(out) <= 100
+    assert 99.0 in out
+
+
+def test_closed_range_is_cached_and_rollups_fill_history():
+    engine = RangeQueryEngine(cache_size=2)
+    rollups = RollupStore()
+    for i in range(600):
+        rollups.add(1, T0 - timedelta(minutes=30) + timedelta(seconds=i), 10.0)
+    records = make_records(120)
+    start, end = T0 - timedelta(minutes=40), T0 + timedelta(seconds=30)
+    first = engine.query(records, rollups, start, end, [1])
+    xs, ys = first[1]
+    assert xs[0] < T0  # 롤업 이력 포함
+    assert xs == sorted(xs)
+    second = engine.query(records, rollups, start, end, [1])
+    assert second is first
+    assert engine.cache_hits == 1
+
+
+def test_cache_hit_skips_store_and_store_slices_requested_sensors():
+    store = SensorDataStore()
+    for rec in make_records(120, sensors=(1, 2, 3)):
+        store.append(rec)
+    start, end = T0 + timedelta(seconds=10), T0 + timedelta(seconds=19)
+    calls = []
+
+    def fetch_raw(ids):
+        calls.append(ids)
+        arrays, oldest = store.range_arrays(start, end, ids)
+        return series_from_arrays(arrays), oldest
+
+    engine = RangeQueryEngine()
+    first = engine.query_source(fetch_raw, store.newest_timestamp(), None, start, end, [2, 1])
+    assert set(first) == {1, 2}
+    assert first[1][0] == [T0 + timedelta(seconds=i) for i in range(10, 20)]
+    assert first == engine.query(store.records(), None, start, end, [1, 2])
+    assert engine.query_source(fetch_raw, store.newest_timestamp(), None, start, end, [1, 2]) is first
+    assert calls == [(1, 2)]
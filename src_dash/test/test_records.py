@@ -0,0 +1,25 @@
+import os
+import sys
+from datetime import datetime
+
+# allow importing core module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from core.records import RecordSource, SensorReading, SensorStatus, coerce_status
+from night_sections.mini_graph_utils import prepare_dataframe
+
+
+def test_reading_is_slotted_mapping():
+    rec = SensorReading(datetime(2025, 1, 1), 3, 21.5, coerce_status("ok"), RecordSource.CSV)
+    assert not hasattr(rec, "__dict__")
+    assert rec["sensor_id"] == 3 and rec.get("missing") is None
+    assert rec["status"] == "ok" and rec["status"] is SensorStatus.OK
+    assert f"{rec['source']}" == "csv"
+    assert dict(rec)["temperature"] == 21.5
+
+
+def test_unknown_status_is_interned_and_dataframe_compatible():
+    status = coerce_status("".join(["READ", "_ERROR"]))
+    assert status is coerce_status("READ_ERROR")
+    df = prepare_dataframe([SensorReading(datetime(2025, 1, 1), 1, 20.0, status)])
+    assert list(df.columns) == ["timestamp", "sensor_id", "temperature", "status", "source"]
+    assert df["sensor_id"].iloc[0] == 1
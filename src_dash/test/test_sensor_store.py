@@ -0,0 +1,61 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+# allow importing core module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from core.sensor_store import SensorDataStore
+
+T0 = datetime(2025, 1, 1, 12, 0, 0)
+
+
+def rec(sid, seconds, temp=20.0):
+    return {"timestamp": T0 + timedelta(seconds=seconds), "sensor_id": sid, "temperature": temp}
+
+
+def test_chatty_sensor_does_not_evict_slow_sensor():
+    store = SensorDataStore(max_records=100, total_budget=10000)
+    store.append(rec(2, 0))
+    for i in range(5000):
+        store.append(rec(1, i * 0.1))
+    assert len(store) == 101
+    assert store.latest_per_sensor()[2]["timestamp"] == T0
+    assert store.evicted == 4900
+
+
+def test_time_retention_and_global_budget():
+    store = SensorDataStore(max_records=1000, total_budget=150)
+    store.set_retention(1, max_age_seconds=10)
+    for i in range(100):
+        store.append(rec(1, i))
+        store.append(rec(2, i))
+    first_1 = store.sensor_window(1, 3600, now=T0 + timedelta(seconds=100))
+    assert len(first_1) == 11
+    assert len(store) <= 150
+    assert [r["timestamp"] for r in store.records()] == sorted(r["timestamp"] for r in store.records())
+
+
+def test_window_keeps_min_points_for_slow_sensors():
+    store = SensorDataStore()
+    for i in range(3):
+        store.append(rec(2, i * 600))
+    for i in range(1300, 1330):
+        store.append(rec(1, i))
+    window = store.window(10, now=T0 + timedelta(seconds=1330), min_points=2)
+    assert sum(1 for r in window if r["sensor_id"] == 2) == 2
+    assert sum(1 for r in window if r["sensor_id"] == 1) == 10
+
+
+def test_delta_returns_only_points_after_cursor():
+    store = SensorDataStore()
+    for i in range(5):
+        store.append(rec(1, i))
+        store.append(rec(2, i))
+    cursor = store.seq
+    store.append(rec(1, 5, temp=21.0))
+    delta = store.delta(cursor, 3600, now=T0 + timedelta(seconds=10))
+    assert list(delta) == [1]
+    assert delta[1][1].tolist() == [21.0]
+    epoch = store.epoch
+    store.clear()
+    assert store.epoch != epoch and store.seq == 0
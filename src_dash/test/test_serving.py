@@ -0,0 +1,35 @@
+import gzip
+import json
+import os
+import sys
+
+import dash
+from dash import html
+
+# allow importing core module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from core.serving import DEFAULT_THREADS, THREADS_ENV, prepare_production, server_threads
+
+
+def test_production_app_gzips_large_responses_only():
+    app = dash.Dash(__name__)
+    app.layout = html.Div([html.Div("온도 " * 400, id="big")], id="root")
+    server = app.server
+    server.add_url_rule("/small", "small", lambda: {"ok": True})
+    prepare_production(app)
+    client = server.test_client()
+
+    response = client.get("/_dash-layout", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert json.loads(gzip.decompress(response.get_data()))["props"]["id"] == "root"
+
+    assert "Content-Encoding" not in client.get("/_dash-layout").headers
+    assert "Content-Encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+
+
+def test_server_threads_from_env(monkeypatch):
+    monkeypatch.setenv(THREADS_ENV, "12")
+    assert server_threads() == 12
+    monkeypatch.setenv(THREADS_ENV, "many")
+    assert server_threads() == DEFAULT_THREADS
@@ -0,0 +1,119 @@
+import multiprocessing
+import os
+import socket
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+# allow importing core module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import core.shm_ring as shm_ring
+from core.collector_client import CollectorClient
+from core.collector_service import CollectorServer
+from core.serial_json_communication import ArduinoSerial
+from core.shm_ring import ShmRingReader, ShmRingWriter
+
+T0 = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def ring():
+    writer = ShmRingWriter(max_sensors=4, capacity=5)
+    reader = ShmRingReader(writer.name)
+    yield writer, reader
+    reader.close()
+    writer.close()
+
+
+def test_wraparound_window_is_contiguous_readonly_view(ring):
+    writer, reader = ring
+    for i in range(8):
+        writer.append("e1", 1, T0 + timedelta(seconds=i), 20.0 + i, i + 1)
+    epoch, arrays = reader.arrays(seconds=60, now=T0 + timedelta(seconds=8))
+    ts, vals = arrays[1]
+    assert epoch == "e1" and vals.tolist() == [23.0, 24.0, 25.0, 26.0, 27.0]
+    assert not vals.flags.writeable and not vals.flags.owndata
+    # 시간 창 밖이어도 센서별 최소 개수 보장
+    _, arrays = reader.arrays(seconds=1, min_points=3, now=T0 + timedelta(seconds=100))
+    assert arrays[1][1].tolist() == [25.0, 26.0, 27.0]
+
+
+def test_delta_matches_serial_cursor_and_epoch_reset(ring):
+    writer, reader = ring
+    writer.append("e1", 1, T0, 21.0, 1)
+    writer.append("e1", 2, T0, 22.0, 2)
+    now = T0 + timedelta(seconds=1)
+    epoch, seq, reset, arrays = reader.delta(None, None, now=now)
+    assert (epoch, seq, reset, sorted(arrays)) == ("e1", 2, True, [1, 2])
+    writer.append("e1", 2, T0 + timedelta(seconds=1), 22.5, 3)
+    epoch, seq, reset, arrays = reader.delta("e1", 2, now=now)
+    assert (seq, reset, list(arrays), arrays[2][1].tolist()) == (3, False, [2], [22.5])
+    assert reader.delta("e1", 3, now=now)[3] == {}
+    # 수집 저장소가 바뀌면 링을 비우고 전체 재전송
+    writer.append("e2", 3, T0, 19.0, 1)
+    epoch, seq, reset, arrays = reader.delta("e1", 3, now=now)
+    assert (epoch, seq, reset, list(arrays)) == ("e2", 1, True, [3])
+
+
+def _read_in_child(name, queue):
+    reader = ShmRingReader(name)
+    _, arrays = reader.arrays(seconds=3600, now=T0 + timedelta(seconds=10), copy=True)
+    queue.put({sid: vals.tolist() for sid, (_, vals) in arrays.items()})
+    reader.close()
+
+
+def test_other_process_reads_by_name_without_unlinking(ring):
+    writer, _ = ring
+    writer.append("e1", 7, T0, 21.5, 1)
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    child = ctx.Process(target=_read_in_child, args=(writer.name, queue))
+    child.start()
+    assert queue.get(timeout=30) == {7: [21.5]}
+    child.join(timeout=30)
+    # 읽는 프로세스가 종료해도 세그먼트는 남아 있음
+    ShmRingReader(writer.name).close()
+
+
+def test_arduino_publishes_and_backfills():
+    arduino = ArduinoSerial(port="TEST")
+    arduino._process_line("SENSOR_DATA,1,21.5,1000")
+    name = arduino.enable_shared_ring()
+    arduino._process_line('{"type":"sensor","id":2,"temp":22.0,"status":"ok"}')
+    reader = ShmRingReader(name)
+    try:
+        epoch, seq, reset, arrays = reader.delta(None, None)
+        assert (epoch, seq) == (arduino.sensor_data.epoch, arduino.sensor_data.seq)
+        assert {sid: vals.tolist() for sid, (_, vals) in arrays.items()} == {1: [21.5], 2: [22.0]}
+        assert np.array_equal(arrays[1][0], arduino.get_sensor_arrays()[1][0])
+    finally:
+        reader.close()
+        arduino.close_shared_ring()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix 소켓 수집기 필요")
+def test_stuck_writer_times_out_and_client_falls_back_to_socket(monkeypatch, tmp_path):
+    monkeypatch.setattr(shm_ring, "READ_TIMEOUT_SECONDS", 0.05)
+    arduino = ArduinoSerial(port="TEST")
+    arduino._process_line("SENSOR_DATA,1,21.5,1000")
+    name = arduino.enable_shared_ring()
+    server = CollectorServer(arduino, str(tmp_path / "c.sock"))
+    server.start()
+    client = CollectorClient(server.address)
+    try:
+        header = arduino.publisher.layout.header
+        header[shm_ring._G_SEQLOCK] += 1  # 쓰는 쪽이 헤더 기록 중 멈춤 (홀수 유지)
+        reader = ShmRingReader(name)
+        with pytest.raises(TimeoutError):
+            reader.delta(None, None)
+        reader.close()
+        epoch, seq, reset, arrays = client.get_sensor_delta()
+        assert client._ring is not None and (epoch, seq) == (arduino.sensor_data.epoch, 1)
+        assert arrays[1][1].tolist() == [21.5]
+        header[shm_ring._G_SEQLOCK] += 1
+    finally:
+        client.close()
+        server.shutdown()
+        arduino.close_shared_ring()
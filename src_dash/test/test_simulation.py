@@ -0,0 +1,42 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+
+# allow importing core module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from core.simulation import SensorSimulator
+
+T0 = datetime(2025, 1, 1, 12, 0, 0)
+
+
+def values(sim, now):
+    return {sid: vals for sid, (_ts, vals) in sim.sensor_data.sensor_arrays(3600, now=now).items()}
+
+
+def test_same_seed_gives_same_series_regardless_of_call_pattern():
+    once, stepwise = SensorSimulator(6, seed=7), SensorSimulator(6, seed=7)
+    once.advance(T0)
+    once.advance(T0 + timedelta(seconds=30))
+    for k in range(31):
+        stepwise.advance(T0 + timedelta(seconds=k))
+    end = T0 + timedelta(seconds=30)
+    a, b = values(once, end), values(stepwise, end)
+    assert sorted(a) == list(range(1, 7))
+    assert all(np.array_equal(a[sid], b[sid], equal_nan=True) for sid in a)
+    other = SensorSimulator(6, seed=8)
+    other.advance(end)
+    assert not np.array_equal(a[1], values(other, end)[1])
+
+
+def test_reads_within_a_step_share_data_and_new_steps_extend_the_store():
+    sim = SensorSimulator(3, seed=1, backfill_seconds=10)
+    assert sim.advance(T0) == 10
+    assert sim.advance(T0 + timedelta(seconds=0.5)) == 0
+    cursor = sim.sensor_data.seq
+
+    assert sim.advance(T0 + timedelta(seconds=2)) == 2
+    delta = sim.sensor_data.delta(cursor, 3600, now=T0 + timedelta(seconds=2))
+    assert sorted(delta) == [1, 2, 3]
+    assert all(len(ts) == 2 for ts, _vals in delta.values())
@@ -0,0 +1,30 @@
+import os
+import sys
+
+# allow importing core module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from core.startup_profile import StartupTimer, parse_importtime
+
+SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     core.ui_modes
+import time:       184 |        445 |   core.app_layout
+import time:     20000 |      90000 | app
+"""
+
+
+def test_parse_importtime_keeps_depth():
+    assert parse_importtime(SAMPLE) == [
+        ("core.ui_modes", 120, 120, 2),
+        ("core.app_layout", 184, 445, 1),
+        ("app", 20000, 90000, 0),
+    ]
+
+
+def test_timer_reports_over_budget_phases(capsys):
+    timer = StartupTimer()
+    with timer.phase("callbacks"):
+        pass
+    total = timer.finish(budget_ms=0)
+    out = capsys.readouterr().out
+    assert total >= 0 and "예산 0 ms" in out
+    assert [name for name, _ in timer.phases][-2:] == ["callbacks", "기타"]
@@ -0,0 +1,91 @@
+"""
+콜드 스타트 / 첫 응답까지의 시간(TTFR) 벤치마크 (하드웨어 불필요)
+
+새 Python 프로세스를 띄워 app 을 import 하고 Flask 테스트 클라이언트로
+페이지(/), 레이아웃(/_dash-layout), 첫 콜백(update_main_layout)을 요청해
+프로세스 시작부터 각 응답까지의 시간을 측정합니다. 이어서 -X importtime 으로
+누적 import 시간 상위 모듈을 출력합니다.
+
+    python src_dash/test_files/bench_cold_start.py [반복 횟수] [상위 모듈 수]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+from core.startup_profile import importtime_report  # noqa: E402
+
+CHILD = r"""
+import contextlib, io, json, time
+t0 = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    import app
+    t_import = time.perf_counter()
+    client = app.app.server.test_client()
+    client.get("/")
+    t_page = time.perf_counter()
+    client.get("/_dash-layout")
+    t_layout = time.perf_counter()
+    body = {
+        "output": (
+            "..main-content.children...ui-version-store.data"
+            "...mode-indicator.children...mode-feedback.children.."
+        ),
+        "outputs": [
+            {"id": "main-content", "property": "children"},
+            {"id": "ui-version-store", "property": "data"},
+            {"id": "mode-indicator", "property": "children"},
+            {"id": "mode-feedback", "property": "children"},
+        ],
+        "inputs": [{"id": "btn-ver-1", "property": "n_clicks", "value": 0},
+                   {"id": "btn-ver-2", "property": "n_clicks", "value": 0}],
+        "changedPropIds": [],
+        "state": [{"id": "ui-version-store", "property": "data", "value": "v1"}],
+    }
+    status = client.post("/_dash-update-component", json=body).status_code
+    t_callback = time.perf_counter()
+ms = lambda t: (t - t0) * 1000
+print(json.dumps({"import": ms(t_import), "page": ms(t_page), "layout": ms(t_layout),
+                  "callback": ms(t_callback), "status": status}))
+"""
+
+
+def run_once():
+    started = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-c", CHILD], cwd=_ROOT, capture_output=True, text=True)
+    wall = (time.perf_counter() - started) * 1000
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["wall"] = wall
+    return result
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    top = int(sys.argv[2]) if len(sys.argv) > 2 else 15
+
+    runs = [run_once() for _ in range(repeat)]
+    assert all(r["status"] == 200 for r in runs), "첫 콜백 응답 실패"
+    print(f"반복 {repeat}회 중앙값 (app import 시작 기준, 프로세스 전체는 인터프리터 시작 포함)")
+    for key, label in (
+        ("import", "app import"),
+        ("page", "첫 페이지(/)"),
+        ("layout", "레이아웃"),
+        ("callback", "첫 콜백(TTFR)"),
+        ("wall", "프로세스 전체"),
+    ):
+        print(f"  {label:<14} {statistics.median(r[key] for r in runs):8.1f} ms")
+
+    rows, _stdout = importtime_report("app", cwd=_ROOT)
+    print(f"\n-X importtime 누적 상위 {top}개")
+    print(f"{'누적(ms)':>9} | {'자체(ms)':>9} | 모듈")
+    for module, self_us, cum_us, depth in sorted(rows, key=lambda r: r[2], reverse=True)[:top]:
+        print(f"{cum_us / 1000:9.1f} | {self_us / 1000:9.1f} | {'  ' * depth}{module}")
+
+
+if __name__ == "__main__":
+    main()
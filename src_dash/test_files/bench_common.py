@@ -0,0 +1,182 @@
+"""
+벤치마크 공용 헬퍼 (하드웨어 불필요)
+
+- 가짜 연결 상태의 ArduinoSerial 에 센서 데이터를 채워 실제 수집 저장소 경로를 사용합니다.
+- app.py 와 동일한 순서로 콜백을 등록하고, 모드별 레이아웃에 실제로 존재하는 컴포넌트 기준으로
+  interval tick 마다 실행되는 콜백을 찾아 직접 호출합니다.
+"""
+
+import contextlib
+import inspect
+import io
+import logging
+import os
+import sys
+from datetime import datetime, timedelta
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+import core.data_manager as data_manager  # noqa: E402
+from core.sensor_store import SensorDataStore  # noqa: E402
+from core.serial_json_communication import ArduinoSerial  # noqa: E402
+from dash import Dash  # noqa: E402
+
+COLOR_SEQ = ["#2C7BE5", "#00A3A3", "#E67E22", "#6F42C1", "#FF6B6B", "#20C997", "#795548", "#FFB400"]
+TH_DEFAULT, TL_DEFAULT = 55.0, -25.0
+SENSORS = 8
+TICK_INPUTS = ("interval-component.n_intervals", "day-tick-store.data", "night-tick-store.data")
+
+
+def quiet():
+    """콜백 내부 print/logging 출력을 숨깁니다."""
+    logging.disable(logging.INFO)
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def build_arduino(points, sensors=SENSORS, span_seconds=290.0):
+    """points 개(센서 전체 합) 데이터를 채운 가짜 연결 ArduinoSerial"""
+    arduino = ArduinoSerial(port="BENCH")
+    arduino.is_healthy = lambda: True
+    arduino.sensor_data = SensorDataStore(max_records=max(1000, points), total_budget=max(20000, points * 2))
+    now = datetime.now()
+    per_sensor = max(1, points // sensors)
+    step = span_seconds / per_sensor
+    for i in range(per_sensor):
+        ts = now - timedelta(seconds=span_seconds - i * step)
+        for sid in range(1, sensors + 1):
+            arduino.sensor_data.append(
+                {
+                    "timestamp": ts,
+                    "sensor_id": sid,
+                    "temperature": 20.0 + (i % 50) * 0.1,
+                    "status": "ok",
+                    "source": "json",
+                }
+            )
+    return arduino
+
+
+def feed_readings(arduino, sensors=SENSORS):
+    """센서마다 현재 시각 측정값 1건씩 추가 (tick 사이 신규 데이터 모사)"""
+    now = datetime.now()
+    with arduino.data_lock:
+        for sid in range(1, sensors + 1):
+            arduino.sensor_data.append(
+                {"timestamp": now, "sensor_id": sid, "temperature": 21.0, "status": "ok", "source": "json"}
+            )
+
+
+def _call_with_supported(func, *args, **kwargs):
+    params = inspect.signature(func).parameters
+    return func(*args, **{k: v for k, v in kwargs.items() if k in params})
+
+
+def build_app(arduino, connected=True):
+    """app.py 와 같은 구성으로 콜백을 등록한 Dash 앱"""
+    from core.shared_callbacks import register_shared_callbacks
+    from day_sections.day_callbacks import register_day_callbacks
+    from night_sections.night_callbacks import register_night_callbacks
+
+    ref = {"connected": connected}
+    snapshot = data_manager.create_snapshot_function(arduino, ref)
+    extra = {}
+    if hasattr(data_manager, "create_series_function"):
+        extra["series_func"] = data_manager.create_series_function(arduino, ref, snapshot)
+    if hasattr(data_manager, "create_delta_function"):
+        extra["delta_func"] = data_manager.create_delta_function(arduino, ref, snapshot)
+    if hasattr(data_manager, "create_range_query_function"):
+        extra["range_query_func"] = data_manager.create_range_query_function(arduino, ref, snapshot)
+
+    app = Dash(__name__, suppress_callback_exceptions=True)
+    with quiet():
+        _call_with_supported(
+            register_shared_callbacks, app, snapshot, COLOR_SEQ, TH_DEFAULT, TL_DEFAULT, **extra
+        )
+        _call_with_supported(
+            register_day_callbacks, app, arduino, ref, COLOR_SEQ, TH_DEFAULT, TL_DEFAULT, snapshot, **extra
+        )
+        _call_with_supported(
+            register_night_callbacks, app, arduino, ref, COLOR_SEQ, TH_DEFAULT, TL_DEFAULT, snapshot, **extra
+        )
+    return app
+
+
+def layout_ids(mode):
+    """모드별 전체 레이아웃(메인 + 모드 레이아웃)에 존재하는 컴포넌트 ID 집합"""
+    from core.app_layout import create_main_layout
+    from core.mode_callbacks import layout_component_ids
+    from day_sections.day_layout import create_layout_v1
+    from night_sections.night_layout import create_layout_v2
+
+    options = [{"label": "COM4", "value": "COM4"}]
+    with quiet():
+        if mode == "v2":
+            mode_layout = create_layout_v2(
+                options, "COM4", "COM4", th_default=TH_DEFAULT, tl_default=TL_DEFAULT
+            )
+        else:
+            mode_layout = create_layout_v1(options, "COM4", "COM4")
+        root = create_main_layout(options, "COM4", "COM4", lambda *a: mode_layout)
+
+    return layout_component_ids(root)
+
+
+def _split_outputs(key):
+    parts = key.strip(".").split("...") if key.startswith("..") else [key]
+    return [p.split("@")[0] for p in parts]
+
+
+def tick_callbacks(app, mode):
+    """해당 모드 레이아웃에서 interval tick 으로 실행되는 콜백 목록 [(이름, 함수, 인자 spec, 출력 목록)]"""
+    present = layout_ids(mode)
+    result = []
+    for key, cb in app.callback_map.items():
+        if "callback" not in cb:
+            continue  # clientside 콜백 (서버 비용 없음)
+        inputs = [f"{i['id']}.{i['property']}" for i in cb["inputs"]]
+        if not any(tick in inputs for tick in TICK_INPUTS):
+            continue
+        output_props = _split_outputs(key)
+        outputs = [o.rsplit(".", 1)[0] for o in output_props]
+        # 렌더러 규칙: 출력이 하나라도 있고 입력이 모두 있으면 실행 (없는 출력은 빼고 요청)
+        if not any(o in present for o in outputs):
+            continue
+        if not all(i["id"] in present for i in cb["inputs"]):
+            continue
+        spec = inputs + [f"{s['id']}.{s['property']}" for s in cb.get("state", [])]
+        fn = cb["callback"]
+        result.append((fn.__name__, getattr(fn, "__wrapped__", fn), spec, output_props))
+    return result
+
+
+def response_bytes(result, output_props, skip_figures=False):
+    """Dash 응답 본문과 같은 {id: {prop: 값}} JSON 크기 (no_update/PreventUpdate 는 0)"""
+    from dash import no_update
+    from plotly.io.json import to_json_plotly
+
+    if result is None:
+        return 0
+    values = result if len(output_props) > 1 else [result]
+    response = {}
+    for prop, value in zip(output_props, values):
+        cid, name = prop.rsplit(".", 1)
+        if value is no_update or (skip_figures and name == "figure"):
+            continue
+        response.setdefault(cid, {})[name] = value
+    return len(to_json_plotly({"multi": True, "response": response}).encode("utf-8")) if response else 0
+
+
+def default_args(spec, mode, n_intervals=1, cursor=None):
+    values = {
+        "interval-component.n_intervals": n_intervals,
+        "day-tick-store.data": {"n": n_intervals, "skipped": 0},
+        "night-tick-store.data": {"n": n_intervals, "skipped": 0},
+        "ui-version-store.data": mode,
+        "detail-sensor-dropdown.value": 1,
+        "sensor-line-toggle.value": list(range(1, SENSORS + 1)),
+        "combined-graph.relayoutData": None,
+        "sensor-cursor-store.data": cursor,
+    }
+    return [values.get(s) for s in spec]
@@ -0,0 +1,104 @@
+"""
+서버측 그래프 경로 지연시간 벤치마크 (하드웨어 불필요)
+
+가짜 연결 상태의 ArduinoSerial 저장소에 N개 포인트(8센서)를 채운 뒤
+서버가 실제로 만드는 응답을 직접 호출하여 실행 시간과 응답 직렬화 시간을 측정합니다.
+
+- update_day_live / update_v2_live: 첫 동기화(cursor 없음, figure 골격 포함)와
+  tick 1회 분량 delta(cursor = 저장소 {epoch, seq})
+- update_combined_graph: 줌 구간(relayoutData) 조회로 만든 figure (캐시 적중/미스)
+
+실행:
+    python src_dash/test_files/bench_figure_path.py [포인트수 ...]
+"""
+
+import statistics
+import sys
+import time
+from datetime import timedelta
+
+from bench_common import SENSORS, build_app, build_arduino, quiet
+from dash._callback_context import context_value
+from dash._utils import AttributeDict
+from plotly.io.json import to_json_plotly
+
+REPEAT = 7
+
+
+def callback_funcs(app):
+    funcs = {}
+    for cb in app.callback_map.values():
+        if "callback" not in cb:
+            continue
+        fn = cb["callback"]
+        funcs[fn.__name__] = getattr(fn, "__wrapped__", fn)
+    return funcs
+
+
+def time_call(fn, make_args):
+    """make_args(i) 로 회차별 인자를 만들어 호출 (실행 ms, +직렬화 ms, 응답 KB 의 중앙값)"""
+    samples, ser_samples, sizes = [], [], []
+    for i in range(REPEAT):
+        args = make_args(i)
+        with quiet():
+            t0 = time.perf_counter()
+            result = fn(*args)
+            t1 = time.perf_counter()
+            body = to_json_plotly(result)
+            t2 = time.perf_counter()
+        samples.append((t1 - t0) * 1000)
+        ser_samples.append((t2 - t0) * 1000)
+        sizes.append(len(body) / 1024)
+    return statistics.median(samples), statistics.median(ser_samples), statistics.median(sizes)
+
+
+def tick_cursor(store):
+    """센서마다 1건씩 새로 들어온 직후의 브라우저 cursor (tick 1회 분량 delta)"""
+    return {"epoch": store.epoch, "seq": max(0, store.seq - SENSORS)}
+
+
+def zoom_relayout(store, shift_seconds=0.0):
+    """최신 시각 기준 200~60초 전 구간을 보는 relayoutData (shift 로 구간을 옮겨 캐시 미스 유도)"""
+    newest = max(rec["timestamp"] for rec in store.latest_per_sensor().values())
+    start = newest - timedelta(seconds=200 - shift_seconds)
+    end = newest - timedelta(seconds=60 - shift_seconds)
+    return {"xaxis.range[0]": start.isoformat(sep=" "), "xaxis.range[1]": end.isoformat(sep=" ")}
+
+
+def main():
+    counts = [int(a) for a in sys.argv[1:]] or [50, 5000, 50000]
+    selected = list(range(1, SENSORS + 1))
+    print(f"{'포인트':>8} | {'경로':<32} | {'실행(ms)':>9} | {'+직렬화(ms)':>11} | {'응답(KB)':>9}")
+    # update_combined_graph 는 triggered_id 로 줌/표시 토글을 구분하므로 relayoutData 트리거로 고정
+    context_value.set(
+        AttributeDict(triggered_inputs=[{"prop_id": "combined-graph.relayoutData", "value": None}])
+    )
+    for points in counts:
+        arduino = build_arduino(points)
+        store = arduino.sensor_data
+        funcs = callback_funcs(build_app(arduino))
+        cursor = tick_cursor(store)
+        hit_relayout = zoom_relayout(store)
+        cases = [
+            ("update_day_live 첫 동기화", funcs["update_day_live"], lambda i: (i, None, "v1")),
+            ("update_day_live tick delta", funcs["update_day_live"], lambda i: (i, cursor, "v1")),
+            ("update_v2_live 첫 동기화", funcs["update_v2_live"], lambda i: (i, None, "v2")),
+            ("update_v2_live tick delta", funcs["update_v2_live"], lambda i: (i, cursor, "v2")),
+            (
+                "update_combined_graph 줌(미스)",
+                funcs["update_combined_graph"],
+                lambda i: (selected, zoom_relayout(store, shift_seconds=i + 1), "v1"),
+            ),
+            (
+                "update_combined_graph 줌(적중)",
+                funcs["update_combined_graph"],
+                lambda i: (selected, hit_relayout, "v1"),
+            ),
+        ]
+        for name, fn, make_args in cases:
+            run_ms, total_ms, size_kb = time_call(fn, make_args)
+            print(f"{points:>8} | {name:<32} | {run_ms:9.2f} | {total_ms:11.2f} | {size_kb:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
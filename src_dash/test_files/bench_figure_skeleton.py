@@ -0,0 +1,127 @@
+"""
+figure 생성 방식 비교 벤치마크 (go.Figure/px.line vs 캐시된 dict 골격)
+
+8개 미니 그래프와 Day 전체 그래프를 두 방식으로 생성하여 생성 시간과 직렬화 시간을 비교합니다.
+기존 방식은 리팩토링 이전 create_sensor_mini_graph / update_main_graphs 구현을 그대로 재현합니다.
+
+실행:
+    python src_dash/test_files/bench_figure_skeleton.py [센서당 포인트수]
+"""
+
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+import pandas as pd  # noqa: E402
+import plotly.express as px  # noqa: E402
+import plotly.graph_objects as go  # noqa: E402
+from core.figure_templates import line_trace, main_graph_layout, make_figure, titled  # noqa: E402
+from night_sections.mini_graph_utils import calculate_y_axis_range, create_sensor_mini_graph  # noqa: E402
+from plotly.io.json import to_json_plotly  # noqa: E402
+
+COLOR_SEQ = ["#2C7BE5", "#00A3A3", "#E67E22", "#6F42C1", "#FF6B6B", "#20C997", "#795548", "#FFB400"]
+TH, TL = 55.0, -25.0
+REPEAT = 15
+
+
+def legacy_mini_graph(x, y, sensor_id):
+    """리팩토링 이전 방식: go.Figure + add_hline x3 + update_* 반복"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=x, y=y, mode="lines", line=dict(color=COLOR_SEQ[sensor_id - 1], width=2)))
+    y_range = calculate_y_axis_range(y, TH, TL)
+    if y_range:
+        fig.update_yaxes(range=y_range)
+    fig.add_hline(y=0, line_dash="solid", line_color="#ccc", line_width=1)
+    for val, color in [(TH, "red"), (TL, "blue")]:
+        fig.add_hline(y=val, line_dash="dash", line_color=color)
+    fig.update_xaxes(
+        showgrid=False,
+        tickfont=dict(color="#aaa"),
+        nticks=4,
+        tickformat="%H:%M:%S",
+        ticklabelposition="outside bottom",
+        ticklabelstandoff=10,
+    )
+    fig.update_yaxes(showgrid=False, tickfont=dict(color="#aaa"), nticks=3, showticklabels=False)
+    fig.update_layout(
+        template="plotly_dark",
+        margin=dict(l=4, r=10, t=16, b=14),
+        height=170,
+        xaxis=dict(title=None),
+        yaxis=dict(title=None),
+        showlegend=False,
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)",
+    )
+    return fig
+
+
+def legacy_main_graph(arrays):
+    """리팩토링 이전 방식: px.line + add_hline"""
+    frames = [
+        pd.DataFrame({"timestamp": ts, "temperature": ys, "sensor_id": str(sid)})
+        for sid, (ts, ys) in arrays.items()
+    ]
+    df = pd.concat(frames)
+    fig = px.line(df, x="timestamp", y="temperature", color="sensor_id", template="plotly_white")
+    fig.add_hline(
+        y=TH, line_dash="dash", line_color="red", annotation_text="TH", annotation_position="top left"
+    )
+    fig.add_hline(
+        y=TL, line_dash="dash", line_color="blue", annotation_text="TL", annotation_position="bottom left"
+    )
+    fig.update_layout(height=440)
+    return fig
+
+
+def skeleton_main_graph(arrays):
+    traces = [line_trace(ts, ys, name=str(sid)) for sid, (ts, ys) in sorted(arrays.items())]
+    return make_figure(titled(main_graph_layout(TH, TL), "실시간 온도 모니터링 (최근 5분)"), traces)
+
+
+def bench(build):
+    build_ms, total_ms = [], []
+    for _ in range(REPEAT):
+        t0 = time.perf_counter()
+        figs = build()
+        t1 = time.perf_counter()
+        for fig in figs:
+            to_json_plotly(fig)
+        t2 = time.perf_counter()
+        build_ms.append((t1 - t0) * 1000)
+        total_ms.append((t2 - t0) * 1000)
+    return statistics.median(build_ms), statistics.median(total_ms)
+
+
+def main():
+    per_sensor = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    now = np.datetime64(datetime.now(), "us")
+    ts = now - np.arange(per_sensor)[::-1].astype("timedelta64[s]")
+    arrays = {sid: (ts, 20 + np.random.default_rng(sid).normal(0, 1, per_sensor)) for sid in range(1, 9)}
+
+    cases = [
+        ("미니 그래프 x8 (go.Figure)", lambda: [legacy_mini_graph(*arrays[s], s) for s in range(1, 9)]),
+        (
+            "미니 그래프 x8 (dict 골격)",
+            lambda: [create_sensor_mini_graph(*arrays[s], s, COLOR_SEQ, TH, TL) for s in range(1, 9)],
+        ),
+        ("전체 그래프 (px.line)", lambda: [legacy_main_graph(arrays)]),
+        ("전체 그래프 (dict 골격)", lambda: [skeleton_main_graph(arrays)]),
+    ]
+    print(f"센서당 {per_sensor}포인트, 반복 {REPEAT}회 중앙값")
+    print(f"{'방식':<28} | {'생성(ms)':>9} | {'+직렬화(ms)':>11}")
+    for name, build in cases:
+        build_ms, total_ms = bench(build)
+        print(f"{name:<28} | {build_ms:9.2f} | {total_ms:11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+다중 보드 수집 벤치마크: FleetManager 단일 I/O 스레드 vs 보드별 읽기 스레드 (하드웨어 불필요, POSIX)
+
+보드마다 pty 쌍을 만들어 한쪽은 pySerial 포트로 열고, 다른 쪽에는 펌웨어 형식 JSON 라인을
+센서 8개 × rate_hz 로 써 넣습니다. 같은 입력을 두 방식으로 읽으며 다음을 비교합니다.
+
+- 보드별 ArduinoSerial.start_reading() 스레드 (보드마다 10 ms 폴링)
+- FleetManager 하나 (selectors 로 모든 pty 다중화)
+
+출력: 보드별 / 전체 처리율(라인/초), 유실 라인, 프로세스 CPU 사용률(라인 생성 제외), 스레드 수
+
+실행:
+    python src_dash/test_files/bench_fleet.py [보드수] [초] [rate_hz]
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+
+from bench_common import quiet
+from core.fleet_manager import FleetManager
+from core.serial_json_communication import ArduinoSerial
+from load_scenarios import SCENARIOS, sensor_lines
+
+SENSORS_PER_BOARD = 8
+
+
+def open_ptys(count):
+    import serial
+
+    pairs = []
+    for _ in range(count):
+        master, slave = os.openpty()
+        pairs.append((master, slave, serial.Serial(os.ttyname(slave), baudrate=115200, timeout=0.1)))
+    return pairs
+
+
+def feed(pairs, seconds, rate_hz, stop):
+    """모든 보드에 rate_hz 로 라인 쓰기 → (보낸 라인 수, 생성 CPU 시간)"""
+    spec = dict(SCENARIOS["day_compressed"], sensors=SENSORS_PER_BOARD, rate_hz=rate_hz)
+    rng = random.Random(0)
+    cpu0 = time.thread_time()
+    sent = 0
+    start = time.perf_counter()
+    step = 0
+    while time.perf_counter() - start < seconds and not stop.is_set():
+        due = int((time.perf_counter() - start) * rate_hz) + 1
+        while step < due:
+            for master, _slave, _tty in pairs:
+                lines = sensor_lines(spec, step, rng)
+                os.write(master, ("\n".join(lines) + "\n").encode())
+                sent += len(lines)
+            step += 1
+        time.sleep(0.005)
+    return sent, time.thread_time() - cpu0
+
+
+def run(mode, boards, seconds, rate_hz):
+    pairs = open_ptys(boards)
+    with quiet():
+        if mode == "fleet":
+            fleet = FleetManager()
+            fleet.start()
+            readers = [
+                fleet.add_board(f"pty{i}", f"board{i}", connection=tty)
+                for i, (_m, _s, tty) in enumerate(pairs)
+            ]
+        else:
+            fleet = None
+            readers = []
+            for i, (_m, _s, tty) in enumerate(pairs):
+                board = ArduinoSerial(port=f"pty{i}", board_id=f"board{i}")
+                board.serial_connection = tty
+                board.is_connected = True
+                board.is_running = True
+                board.read_thread = threading.Thread(target=board._read_loop, daemon=True)
+                board.read_thread.start()
+                readers.append(board)
+    threads = threading.active_count()
+    stop = threading.Event()
+    result = {}
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    feeder = threading.Thread(target=lambda: result.setdefault("feed", feed(pairs, seconds, rate_hz, stop)))
+    feeder.start()
+    feeder.join()
+    time.sleep(0.3)  # 마지막 조각 처리
+    wall = time.perf_counter() - wall0
+    sent, feed_cpu = result["feed"]
+    cpu = time.process_time() - cpu0 - feed_cpu
+    received = [board.total_received for board in readers]
+    with quiet():
+        if fleet is not None:
+            fleet.stop()
+        else:
+            for board in readers:
+                board.disconnect()
+    for master, slave, _tty in pairs:
+        os.close(master)
+        os.close(slave)
+    return {
+        "threads": threads,
+        "sent": sent,
+        "received": sum(received),
+        "per_board": [r / wall for r in received],
+        "cpu_percent": cpu / wall * 100,
+    }
+
+
+def main():
+    if not hasattr(os, "openpty"):
+        print("⚠️ pty 를 지원하지 않는 OS 입니다 (POSIX 전용)")
+        return 1
+    boards = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 10.0
+    rate_hz = float(sys.argv[3]) if len(sys.argv) > 3 else 10.0
+    print(f"🧪 보드 {boards}개 × 센서 {SENSORS_PER_BOARD}개 × {rate_hz:g} Hz, {seconds:g}초")
+    print(
+        f"  {'방식':<22} | {'스레드':>6} | {'전체 라인/초':>12} | "
+        f"{'보드 최소/최대':>15} | {'유실':>6} | {'CPU %':>6}"
+    )
+    for mode, label in (("threads", "보드별 읽기 스레드"), ("fleet", "FleetManager (select)")):
+        r = run(mode, boards, seconds, rate_hz)
+        per = r["per_board"]
+        print(
+            f"  {label:<22} | {r['threads']:6d} | {sum(per):12.0f} | {min(per):7.0f}/{max(per):<7.0f} | "
+            f"{r['sent'] - r['received']:6d} | {r['cpu_percent']:6.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+interval tick 당 서버 부하 벤치마크 (하드웨어 불필요)
+
+모드별 레이아웃에 실제로 존재하는 컴포넌트를 기준으로 interval-component 가 트리거하는
+콜백을 찾아 한 tick 분량을 직접 실행하고, 콜백 수 / 스냅샷 호출 수 / 서버 시간 / 응답 크기를 측정합니다.
+브라우저 버퍼 cursor 는 tick 사이에 이어서 전달합니다 (delta 동기화 정상 상태).
+
+실행:
+    python src_dash/test_files/bench_interval_tick.py [포인트수]
+"""
+
+import statistics
+import sys
+import time
+
+from bench_common import (
+    build_app,
+    build_arduino,
+    default_args,
+    feed_readings,
+    quiet,
+    response_bytes,
+    tick_callbacks,
+)
+from core import data_manager
+from dash.exceptions import PreventUpdate
+
+REPEAT = 15
+DELTA_OUTPUT = "sensor-delta-store.data"
+
+
+def count_snapshots():
+    """create_snapshot_function 이 만든 스냅샷의 호출 횟수를 세는 래퍼를 설치합니다."""
+    calls = {"n": 0}
+    original = data_manager.create_snapshot_function
+
+    def counting_factory(*args, **kwargs):
+        snapshot = original(*args, **kwargs)
+
+        def counted(*a, **kw):
+            calls["n"] += 1
+            return snapshot(*a, **kw)
+
+        return counted
+
+    data_manager.create_snapshot_function = counting_factory
+    return calls
+
+
+def run_tick(callbacks, mode, n, cursor):
+    """한 tick 분량 콜백 실행 → (결과 목록, 다음 cursor)"""
+    results = []
+    for _name, fn, spec, outputs in callbacks:
+        try:
+            result = fn(*default_args(spec, mode, n, cursor))
+        except PreventUpdate:
+            result = None
+        results.append(result)
+        if result is not None and DELTA_OUTPUT in outputs:
+            payload = result[outputs.index(DELTA_OUTPUT)]
+            cursor = {"epoch": payload["epoch"], "seq": payload["cursor"]}
+    return results, cursor
+
+
+def main():
+    points = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    calls = count_snapshots()
+    arduino = build_arduino(points)
+    app = build_app(arduino)
+
+    print(f"포인트 {points}개, tick 마다 센서당 1건 추가, 반복 {REPEAT}회 중앙값")
+    print(
+        f"{'모드':<6} | {'콜백 수':>6} | {'스냅샷/tick':>10} | {'tick 시간(ms)':>13} | "
+        f"{'응답(B)':>9} | {'figure 제외(B)':>13}"
+    )
+    for mode, label in (("v1", "Day"), ("v2", "Night")):
+        callbacks = tick_callbacks(app, mode)
+        samples, total_bytes, text_bytes = [], [], []
+        cursor = None
+        with quiet():
+            # 첫 동기화 (브라우저 버퍼가 비어 있는 상태) 는 측정에서 제외
+            _results, cursor = run_tick(callbacks, mode, 0, cursor)
+            for n in range(REPEAT):
+                feed_readings(arduino)
+                calls["n"] = 0
+                t0 = time.perf_counter()
+                results, cursor = run_tick(callbacks, mode, n + 1, cursor)
+                samples.append((time.perf_counter() - t0) * 1000)
+                pairs = list(zip(callbacks, results))
+                total_bytes.append(sum(response_bytes(r, cb[3]) for cb, r in pairs))
+                text_bytes.append(sum(response_bytes(r, cb[3], skip_figures=True) for cb, r in pairs))
+        print(
+            f"{label:<6} | {len(callbacks):>6} | {calls['n']:>10} | {statistics.median(samples):13.2f} | "
+            f"{int(statistics.median(total_bytes)):>9} | {int(statistics.median(text_bytes)):>13}"
+        )
+        print("       └ " + ", ".join(name for name, _fn, _spec, _outputs in callbacks))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,381 @@
+"""대시보드 부하 테스트: 브라우저 세션 N 개의 `_dash-update-component` 요청 재현 → 콜백별 처리량 / p95 / p99
+
+세션마다 브라우저와 같은 순서로 요청합니다.
+
+1. `/_dash-layout`, `/_dash-dependencies` 로 레이아웃/콜백 목록을 받고 컴포넌트 속성 값을 세션 상태로 보관
+2. 초기 콜백(prevent_initial_call 아님) 실행 → 응답으로 받은 모드 레이아웃의 컴포넌트도 상태에 추가
+   (Night 세션은 이어서 Night 버튼 클릭 요청)
+3. tick 마다 interval-component.n_intervals 를 올리고, tick gate(assets/tick_gate.js)와 같은 모드별 tick
+   저장소 값을 만들어 두 입력으로 실행되는 서버 콜백을 요청. 응답 값은 세션 상태에 반영하고,
+   sensor-delta-store 를 받으면 버퍼 병합(assets/sensor_buffer.js)처럼 sensor-cursor-store 를 갱신
+   → 다음 tick 은 delta 동기화
+
+clientside 콜백은 서버 요청이 없으므로 위 두 가지(tick gate, cursor 갱신)만 흉내 냅니다.
+한 세션의 요청은 순서대로 보냅니다 (실제 브라우저는 같은 tick 의 독립 콜백을 동시에 보냄).
+
+대상:
+- 기본: 이 프로세스에서 운영 설정(src_dash/wsgi.py: debug 끔, 압축)의 앱을 Flask test client 로 호출
+  (하드웨어 없으면 시뮬레이션 데이터). 세션 스레드가 곧 서버 스레드라 WSGI 서버 비용은 빠집니다.
+- --url: 실행 중인 서버에 HTTP keep-alive 연결로 요청 (`python -m src_dash.wsgi` 등)
+
+출력: 콜백별 호출 수, 호출/초, p50 / p95 / p99 / 최대 지연시간(ms), 오류 수, 평균 응답 크기(전송/원본 KB)
+
+실행:
+    python src_dash/test_files/bench_load.py                                    # 세션 20개, 30초, 1초 tick
+    python src_dash/test_files/bench_load.py --sessions 50 --seconds 60 --night 0.5
+    python src_dash/test_files/bench_load.py --url http://127.0.0.1:8050 --sessions 100
+    python src_dash/test_files/bench_load.py --interval 0 --sessions 8          # tick 간격 없이 최대 처리량
+"""
+
+import argparse
+import gzip
+import http.client
+import json
+import os
+import random
+import sys
+import threading
+import time
+from urllib.parse import urlparse
+
+import numpy as np
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from bench_common import quiet  # noqa: E402
+
+UPDATE_PATH = "/_dash-update-component"
+TICK_PROP = "interval-component.n_intervals"
+# tick gate 출력 (Day/Night 레이아웃 안의 tick 저장소, 현재 레이아웃에 있는 쪽만 콜백을 실행)
+GATE_PROPS = ("day-tick-store.data", "night-tick-store.data")
+DELTA_PROP = "sensor-delta-store.data"
+CURSOR_PROP = "sensor-cursor-store.data"
+NIGHT_BUTTON = "btn-ver-2.n_clicks"
+HEADERS = {"Content-Type": "application/json", "Accept": "application/json", "Accept-Encoding": "gzip"}
+
+
+# ---- 전송 ----------------------------------------------------------------------
+
+
+class _Reply:
+    __slots__ = ("status", "body", "wire_bytes")
+
+    def __init__(self, status, body, encoding):
+        self.status = status
+        self.wire_bytes = len(body)
+        self.body = gzip.decompress(body) if encoding == "gzip" else body
+
+
+class TestClientTransport:
+    """이 프로세스의 Flask 앱 (세션마다 test client 1개)"""
+
+    def __init__(self, app):
+        self.app = app
+        self.label = "in-process (Flask test client)"
+
+    def session(self):
+        client = self.app.server.test_client()
+
+        def request(method, path, body=None):
+            response = client.open(path, method=method, data=body, headers=HEADERS)
+            return _Reply(response.status_code, response.get_data(), response.headers.get("Content-Encoding"))
+
+        return request
+
+
+class HttpTransport:
+    """실행 중인 서버 (세션마다 keep-alive 연결 1개)"""
+
+    def __init__(self, url):
+        parsed = urlparse(url)
+        self.host, self.port = parsed.hostname, parsed.port or 80
+        self.label = url
+
+    def session(self):
+        conn = {"c": None}
+
+        def request(method, path, body=None):
+            for attempt in (0, 1):
+                if conn["c"] is None:
+                    conn["c"] = http.client.HTTPConnection(self.host, self.port, timeout=30)
+                try:
+                    conn["c"].request(method, path, body=body, headers=HEADERS)
+                    response = conn["c"].getresponse()
+                    return _Reply(response.status, response.read(), response.getheader("Content-Encoding"))
+                except (http.client.HTTPException, OSError):
+                    conn["c"].close()
+                    conn["c"] = None
+                    if attempt:
+                        raise
+
+        return request
+
+
+# ---- 콜백 목록 / 세션 상태 -----------------------------------------------------------
+
+
+def split_output(output):
+    """콜백 출력 문자열 → [(id, 속성)] ("..a.b...c.d.." 다중 출력, 속성의 @hash 유지)"""
+    parts = output[2:-2].split("...") if output.startswith("..") else [output]
+    return [tuple(part.split(".", 1)) for part in parts]
+
+
+class Callback:
+    def __init__(self, dep, name=None):
+        self.output = dep["output"]
+        self.outputs = split_output(self.output)
+        self.inputs = [(i["id"], i["property"]) for i in dep["inputs"]]
+        self.state = [(s["id"], s["property"]) for s in dep.get("state", [])]
+        self.prevent_initial = bool(dep.get("prevent_initial_call"))
+        first = f"{self.outputs[0][0]}.{self.outputs[0][1].split('@')[0]}"
+        self.name = name or (first if len(self.outputs) == 1 else f"{first} (+{len(self.outputs) - 1})")
+        self.output_ids = {cid for cid, _ in self.outputs}
+        self.input_ids = {cid for cid, _ in self.inputs}
+
+    def input_props(self):
+        return {f"{cid}.{prop}" for cid, prop in self.inputs}
+
+
+def server_callbacks(deps, names=None):
+    """clientside / 패턴 매칭 ID 콜백을 뺀 서버 콜백 목록"""
+    names = names or {}
+    return [
+        Callback(dep, names.get(dep["output"]))
+        for dep in deps
+        if not dep.get("clientside_function") and "{" not in dep["output"]
+    ]
+
+
+def collect_props(node, props, ids):
+    """컴포넌트 트리(JSON) → props["id.속성"] = 값, ids 에 컴포넌트 ID 추가"""
+    if isinstance(node, list):
+        for child in node:
+            collect_props(child, props, ids)
+        return
+    if not isinstance(node, dict) or "props" not in node:
+        return
+    node_props = node["props"]
+    cid = node_props.get("id")
+    if isinstance(cid, str):
+        ids.add(cid)
+        for key, value in node_props.items():
+            props[f"{cid}.{key}"] = value
+    collect_props(node_props.get("children"), props, ids)
+
+
+class Stats:
+    """콜백별 지연시간/응답 크기 (세션 스레드 공용)"""
+
+    def __init__(self):
+        self.samples = {}
+        self.lock = threading.Lock()
+
+    def add(self, name, seconds, status, wire_bytes, raw_bytes):
+        with self.lock:
+            self.samples.setdefault(name, []).append((seconds, status, wire_bytes, raw_bytes))
+
+
+class BrowserSession:
+    def __init__(self, request, layout, callbacks, stats, night=False):
+        self.request = request
+        self.callbacks = callbacks
+        self.stats = stats
+        self.night = night
+        self.props = {}
+        self.ids = set()
+        # children 로 받은 하위 트리의 컴포넌트 ID (모드 전환 시 이전 모드 컴포넌트 제거)
+        self.subtrees = {}
+        self.n = 0
+        collect_props(layout, self.props, self.ids)
+
+    def _value(self, cid, prop):
+        return self.props.get(f"{cid}.{prop.split('@')[0]}")
+
+    def call(self, cb, changed):
+        body = {
+            "output": cb.output,
+            "outputs": [{"id": c, "property": p} for c, p in cb.outputs],
+            "inputs": [{"id": c, "property": p, "value": self._value(c, p)} for c, p in cb.inputs],
+            "changedPropIds": changed,
+            "state": [{"id": c, "property": p, "value": self._value(c, p)} for c, p in cb.state],
+        }
+        if len(cb.outputs) == 1:
+            body["outputs"] = body["outputs"][0]
+        data = json.dumps(body).encode("utf-8")
+        start = time.perf_counter()
+        try:
+            reply = self.request("POST", UPDATE_PATH, data)
+        except (http.client.HTTPException, OSError):
+            self.stats.add(cb.name, time.perf_counter() - start, 0, 0, 0)
+            return
+        self.stats.add(cb.name, time.perf_counter() - start, reply.status, reply.wire_bytes, len(reply.body))
+        if reply.status == 200:
+            self.apply(json.loads(reply.body).get("response", {}))
+
+    def apply(self, response):
+        for cid, values in response.items():
+            for prop, value in values.items():
+                self.props[f"{cid}.{prop}"] = value
+                if prop == "children":
+                    self.ids -= self.subtrees.pop(cid, set())
+                    added = self.subtrees[cid] = set()
+                    collect_props(value, self.props, added)
+                    self.ids |= added
+                if f"{cid}.{prop}" == DELTA_PROP and isinstance(value, dict) and "cursor" in value:
+                    # 브라우저 버퍼 병합 (assets/sensor_buffer.js merge)
+                    self.props[CURSOR_PROP] = {"epoch": value.get("epoch"), "seq": value["cursor"]}
+
+    def _present(self, cb):
+        # 렌더러 규칙: 출력이 하나라도 있고 입력이 모두 있으면 실행 (core/mode_callbacks.py 와 같음)
+        return bool(cb.output_ids & self.ids) and cb.input_ids <= self.ids
+
+    def initial_calls(self, done):
+        for cb in self.callbacks:
+            if cb.output not in done and not cb.prevent_initial and self._present(cb):
+                done.add(cb.output)
+                self.call(cb, [])
+
+    def start(self):
+        done = set()
+        self.initial_calls(done)
+        self.initial_calls(done)  # 초기 콜백이 채운 모드 레이아웃의 초기 콜백
+        if self.night:
+            self.props[NIGHT_BUTTON] = 1
+            self.fire(NIGHT_BUTTON)
+            self.initial_calls(done)
+
+    def fire(self, prop):
+        for cb in self.callbacks:
+            if prop in cb.input_props() and self._present(cb):
+                self.call(cb, [prop])
+
+    def tick(self):
+        self.n += 1
+        self.props[TICK_PROP] = self.n
+        self.fire(TICK_PROP)
+        # tick gate: 이전 tick 응답을 기다린 뒤 보내므로 항상 통과
+        for prop in GATE_PROPS:
+            self.props[prop] = {"n": self.n, "skipped": 0, "last_ms": None}
+            self.fire(prop)
+
+
+# ---- 실행 ----------------------------------------------------------------------
+
+
+def run_session(transport, layout, callbacks, stats, night, seconds, interval, startup_stats):
+    request = transport.session()
+    time.sleep(random.uniform(0, interval))  # 세션 시작 시점 분산
+    session = BrowserSession(request, layout, callbacks, startup_stats, night)
+    session.start()
+    session.stats = stats
+    deadline = time.perf_counter() + seconds
+    next_tick = time.perf_counter()
+    while True:
+        next_tick += interval
+        session.tick()
+        delay = next_tick - time.perf_counter()
+        if next_tick >= deadline:
+            return
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            next_tick = time.perf_counter()  # 늦은 tick 은 쌓지 않음 (tick gate 와 동일)
+
+
+def report(stats, seconds, title):
+    print(title)
+    print(
+        f"{'콜백':<34}{'호출':>7}{'호출/초':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'최대 ms':>9}"
+        f"{'오류':>6}{'  응답 KB 전송/원본':>18}"
+    )
+    total = []
+    for name, samples in sorted(stats.samples.items()):
+        total.extend(samples)
+        _row(name, samples, seconds)
+    if total:
+        _row("전체", total, seconds)
+
+
+def _row(name, samples, seconds):
+    ms = np.array([s[0] for s in samples]) * 1000
+    errors = sum(1 for s in samples if s[1] not in (200, 204))
+    wire = np.mean([s[2] for s in samples]) / 1024
+    raw = np.mean([s[3] for s in samples]) / 1024
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    print(
+        f"{name[:33]:<34}{len(samples):>7}{len(samples) / seconds:>9.1f}{p50:>9.2f}{p95:>9.2f}{p99:>9.2f}"
+        f"{ms.max():>9.2f}{errors:>6}{wire:>9.2f} / {raw:.2f}"
+    )
+
+
+def load_target(url):
+    """(전송, 콜백 이름 {출력: 함수 이름})"""
+    if url:
+        return HttpTransport(url), {}
+    with quiet():
+        import wsgi
+
+    names = {}
+    for key, cb in wsgi.app.callback_map.items():
+        fn = cb.get("callback")
+        if fn is not None:
+            names[key] = getattr(fn, "__wrapped__", fn).__name__
+    return TestClientTransport(wsgi.app), names
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="대시보드 부하 테스트 (브라우저 세션 재현)")
+    parser.add_argument("--url", help="실행 중인 서버 (기본: 이 프로세스의 앱)")
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=30.0)
+    parser.add_argument("--interval", type=float, default=1.0, help="tick 간격(초), 0 이면 쉬지 않고 요청")
+    parser.add_argument("--night", type=float, default=0.0, help="Night 모드 세션 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    random.seed(args.seed)
+
+    transport, names = load_target(args.url)
+    request = transport.session()
+    layout = json.loads(request("GET", "/_dash-layout").body)
+    callbacks = server_callbacks(json.loads(request("GET", "/_dash-dependencies").body), names)
+
+    stats, startup_stats = Stats(), Stats()
+    nights = round(args.sessions * min(max(args.night, 0.0), 1.0))
+    threads = [
+        threading.Thread(
+            target=run_session,
+            args=(
+                transport,
+                layout,
+                callbacks,
+                stats,
+                i < nights,
+                args.seconds,
+                args.interval,
+                startup_stats,
+            ),
+            daemon=True,
+        )
+        for i in range(args.sessions)
+    ]
+    with quiet():
+        started = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - started
+
+    header = (
+        f"대상 {transport.label}, 세션 {args.sessions} (Night {nights}), {args.seconds:.0f}초, "
+        f"tick {args.interval:g}초"
+    )
+    report(startup_stats, elapsed, f"{header}\n\n[세션 시작 (레이아웃/초기 콜백/모드 전환)]")
+    print()
+    report(stats, elapsed, "[실시간 tick]")
+
+
+if __name__ == "__main__":
+    main()
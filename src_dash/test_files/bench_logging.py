@@ -0,0 +1,126 @@
+"""
+시리얼 핫패스 로깅 비용 벤치마크 (하드웨어 불필요)
+
+가짜 시리얼 포트(load_scenarios.FakeSerialPort)에 JSON 센서 라인을 한 번에 넣고 실제 ArduinoSerial
+읽기 루프가 모두 저장할 때까지의 처리율(라인/초)과 읽기 스레드 CPU 시간을 로깅 설정별로 비교합니다.
+로그는 임시 파일로 출력합니다 (--console 이면 stderr, 터미널 출력 비용 포함).
+
+- 이전 방식   : 동기 출력 + 핫패스 로그 모두 출력 (라인마다 수신/저장 로그)
+- 동기, 핫패스 꺼짐
+- 비동기, 핫패스 전체 (QueueListener 로 출력만 분리)
+- 비동기, 핫패스 속도 제한 (RateLimitFilter)
+- 비동기, 핫패스 꺼짐 (기본값)
+
+실행:
+    python src_dash/test_files/bench_logging.py [라인수] [--console]
+"""
+
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from bench_common import SENSORS
+from core.log_config import HOTPATH_LOGGER, RateLimitFilter, configure_logging, shutdown_logging
+from core.serial_json_communication import ArduinoSerial
+from load_scenarios import SCENARIOS, FakeSerialPort, sensor_lines
+
+DEFAULT_LINES = 20000
+TIMEOUT_SECONDS = 120.0
+CONFIGS = (
+    ("이전 방식 (동기, 핫패스 전체)", False, logging.DEBUG, False),
+    ("동기, 핫패스 꺼짐", False, logging.INFO, True),
+    ("비동기, 핫패스 전체", True, logging.DEBUG, False),
+    ("비동기, 핫패스 속도 제한", True, logging.DEBUG, True),
+    ("비동기, 핫패스 꺼짐 (기본)", True, logging.INFO, True),
+)
+
+
+def make_payload(count):
+    spec = dict(SCENARIOS["day_compressed"], sensors=SENSORS)
+    rng = random.Random(0)
+    lines = []
+    step = 0
+    while len(lines) < count:
+        lines.extend(sensor_lines(spec, step, rng))
+        step += 1
+    return ("\n".join(lines[:count]) + "\n").encode()
+
+
+def set_rate_limit(enabled):
+    hotpath = logging.getLogger(HOTPATH_LOGGER)
+    for f in [f for f in hotpath.filters if isinstance(f, RateLimitFilter)]:
+        hotpath.removeFilter(f)
+    limiter = RateLimitFilter() if enabled else None
+    if limiter:
+        hotpath.addFilter(limiter)
+    return limiter
+
+
+def run(payload, count, async_, hot_level, rate_limited, stream):
+    configure_logging(async_=async_, levels={"hotpath": hot_level}, stream=stream, force=True)
+    limiter = set_rate_limit(rate_limited)
+    port = FakeSerialPort(SENSORS)
+    arduino = ArduinoSerial(port="BENCH")
+    arduino.serial_connection = port
+    arduino.is_connected = True
+    arduino.connection_time = datetime.now()
+    port.feed(payload)
+
+    start = time.perf_counter()
+    arduino.is_running = True
+    cpu = {}
+
+    def loop():
+        cpu0 = time.thread_time()
+        arduino._read_loop()
+        cpu["s"] = time.thread_time() - cpu0
+
+    reader = threading.Thread(target=loop, daemon=True)
+    reader.start()
+    while arduino.sensor_data.seq < count and time.perf_counter() - start < TIMEOUT_SECONDS:
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+    arduino.is_running = False
+    reader.join()
+    flush_start = time.perf_counter()
+    shutdown_logging()  # 큐에 남은 로그 출력 대기
+    flush = time.perf_counter() - flush_start
+    return {
+        "stored": arduino.sensor_data.seq,
+        "lines_per_s": arduino.sensor_data.seq / elapsed,
+        "reader_cpu_s": cpu.get("s", 0.0),
+        "flush_s": flush if async_ else 0.0,
+        "suppressed": limiter.suppressed if limiter else 0,
+    }
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    console = "--console" in sys.argv
+    count = int(args[0]) if args else DEFAULT_LINES
+    payload = make_payload(count)
+    print(f"🧪 핫패스 로깅 벤치마크: JSON 센서 라인 {count}개 ({len(payload) / 1024:.0f} KB)")
+    print(f"  {'설정':<30} | {'라인/초':>9} | {'읽기 CPU(s)':>11} | {'큐 비우기(s)':>12} | {'생략':>7}")
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, async_, hot_level, rate_limited in CONFIGS:
+            with open(os.path.join(tmp, "bench.log"), "w", encoding="utf-8") as log_file:
+                r = run(payload, count, async_, hot_level, rate_limited, sys.stderr if console else log_file)
+            results.append((label, r))
+            print(
+                f"  {label:<30} | {r['lines_per_s']:9.0f} | {r['reader_cpu_s']:11.3f} | "
+                f"{r['flush_s']:12.3f} | {r['suppressed']:7d}"
+            )
+    base = results[0][1]["lines_per_s"]
+    best_label, best = max(results, key=lambda item: item[1]["lines_per_s"])
+    print(f"\n최고 처리율: {best_label} ({best['lines_per_s'] / base:.1f}배, 이전 방식 대비)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Day/Night 모드 전환 콜백(update_main_layout) 벤치마크 (하드웨어 불필요)
+
+app.py 를 그대로 import 한 뒤 버튼 클릭 컨텍스트로 레이아웃 전환 콜백을 직접 호출해
+서버 시간 / 응답 크기 / 같은 모드로 다시 전환했을 때 응답이 동일한지를 측정합니다.
+
+    python src_dash/test_files/bench_mode_switch.py
+"""
+
+import hashlib
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_common import quiet  # noqa: E402
+from dash._callback_context import context_value  # noqa: E402
+from dash._utils import AttributeDict  # noqa: E402
+from plotly.io.json import to_json_plotly  # noqa: E402
+
+REPEAT = 20
+
+
+def main():
+    with quiet():
+        import app as dash_app
+
+    fn = next(
+        cb["callback"]
+        for cb in dash_app.app.callback_map.values()
+        if "callback" in cb and cb["callback"].__name__ == "update_main_layout"
+    )
+    switch = getattr(fn, "__wrapped__", fn)
+
+    print(f"반복 {REPEAT}회 중앙값")
+    print(f"{'전환':<8} | {'서버 시간(ms)':>13} | {'직렬화(ms)':>10} | {'응답(B)':>9} | {'응답 동일':>8}")
+    for label, button, clicks in (("→ Night", "btn-ver-2", (0, 1)), ("→ Day", "btn-ver-1", (1, 0))):
+        context_value.set(AttributeDict(triggered_inputs=[{"prop_id": f"{button}.n_clicks", "value": 1}]))
+        server, encode, sizes, digests = [], [], [], set()
+        for _ in range(REPEAT):
+            with quiet():
+                t0 = time.perf_counter()
+                result = switch(*clicks, "v1")
+                t1 = time.perf_counter()
+                body = to_json_plotly({"multi": True, "response": {"main-content": {"children": result[0]}}})
+                t2 = time.perf_counter()
+            server.append((t1 - t0) * 1000)
+            encode.append((t2 - t1) * 1000)
+            sizes.append(len(body.encode("utf-8")))
+            digests.add(hashlib.sha1(body.encode("utf-8")).hexdigest())
+        print(
+            f"{label:<8} | {statistics.median(server):13.2f} | {statistics.median(encode):10.2f} | "
+            f"{int(statistics.median(sizes)):>9} | {'예' if len(digests) == 1 else '아니오':>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+수집 레코드 메모리 사용량 비교 (dict vs __slots__ 레코드)
+
+실행:
+    python src_dash/test_files/bench_record_footprint.py [센서수] [센서당 레코드수]
+"""
+
+import os
+import sys
+import tracemalloc
+from datetime import datetime
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from core.records import RecordSource, SensorReading, SensorStatus  # noqa: E402
+
+
+def build_dicts(sensors, per_sensor):
+    return [
+        {
+            "timestamp": datetime.now(),
+            "sensor_id": sid,
+            "temperature": 20.0 + i * 0.01,
+            "status": "ok",
+            "source": "json",
+        }
+        for i in range(per_sensor)
+        for sid in range(1, sensors + 1)
+    ]
+
+
+def build_records(sensors, per_sensor):
+    return [
+        SensorReading(datetime.now(), sid, 20.0 + i * 0.01, SensorStatus.OK, RecordSource.JSON)
+        for i in range(per_sensor)
+        for sid in range(1, sensors + 1)
+    ]
+
+
+def measure(builder, sensors, per_sensor):
+    tracemalloc.start()
+    data = builder(sensors, per_sensor)
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, len(data)
+
+
+def main():
+    sensors = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    per_sensor = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    dict_bytes, n = measure(build_dicts, sensors, per_sensor)
+    slot_bytes, _ = measure(build_records, sensors, per_sensor)
+
+    print(f"📊 레코드 {n}개 ({sensors}센서 x {per_sensor}개)")
+    print(f"  dict        : {dict_bytes / 1024:8.1f} KiB ({dict_bytes / n:6.1f} B/레코드)")
+    print(f"  SensorReading: {slot_bytes / 1024:8.1f} KiB ({slot_bytes / n:6.1f} B/레코드)")
+    print(f"  절감률      : {(1 - slot_bytes / dict_bytes) * 100:5.1f}%")
+
+
+if __name__ == "__main__":
+    main()
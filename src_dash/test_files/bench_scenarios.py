@@ -0,0 +1,296 @@
+"""
+부하 시나리오 성능 기준선 (하드웨어 불필요)
+
+load_scenarios.py 의 시나리오를 하나씩 새 프로세스에서 재생합니다. 가짜 시리얼 포트로 실제
+ArduinoSerial 읽기 루프를 구동하고, 그동안 1초마다 Day/Night 모드의 interval tick 콜백
+(bench_common.tick_callbacks)을 직접 실행하여 다음을 기록합니다.
+
+- 콜백별 / tick 전체 지연시간 (p50 / p95 / 최대)
+- 수집: 보낸 라인 수, 저장된 레코드 수, 포트 최대 적체량, 종료 후 적체 해소 시간
+- CPU 사용률 (라인 생성 스레드 제외), 최대 RSS
+- 포트 분리 시나리오: 분리 후 연결 불량으로 판정되기까지의 시간
+- 수집 지표 (ArduinoSerial.get_ingest_metrics: 파싱 실패, 잠금 대기, 읽기 루프 반복 시간)
+- 측정값 지연시간 (ArduinoSerial.get_latency_summary): 수신 → 파싱(parse), 파싱 → 콜백 응답(serve).
+  브라우저가 없으므로 tick 직후 렌더링된 것으로 기록하며, 압축 재생의 펌웨어 millis 는 실제 시간이 아니므로
+  transport/total 단계는 보고하지 않습니다.
+
+결과를 JSON 으로 저장(--save)해 기준선으로 쓰고, 이후 실행을 기준선과 비교(--compare)하면
+REGRESSION_RATIO 배를 넘는 항목을 회귀로 표시하고 종료 코드 1 을 반환합니다.
+
+    python src_dash/test_files/bench_scenarios.py                       # 전체 시나리오
+    python src_dash/test_files/bench_scenarios.py burst_64 unplug --time-scale 0.5
+    python src_dash/test_files/bench_scenarios.py --save baseline.json
+    python src_dash/test_files/bench_scenarios.py --compare baseline.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from bench_common import build_app, default_args, quiet, tick_callbacks
+from core.serial_json_communication import ArduinoSerial
+from dash.exceptions import PreventUpdate
+from load_scenarios import SCENARIOS, FakeSerialPort, ScenarioFeeder
+
+TICK_SECONDS = 1.0
+DRAIN_TIMEOUT_SECONDS = 10.0
+# 포트 분리 후 피더가 끝나도 분리 감지까지 tick 을 계속 도는 최대 시간
+UNPLUG_DETECT_TIMEOUT_SECONDS = 5.0
+DELTA_OUTPUT = "sensor-delta-store.data"
+# 기준선 대비 배수 / 노이즈로 보지 않을 최소 차이
+REGRESSION_RATIO = 1.5
+COMPARE_KEYS = {"tick_p95_ms": 2.0, "cpu_percent": 5.0, "peak_rss_mb": 10.0, "drain_s": 0.5}
+MODES = (("v1", "Day"), ("v2", "Night"))
+
+
+def percentile(values, q):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def summarize(values):
+    return {
+        "n": len(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "max": max(values) if values else None,
+    }
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def _backlog(port):
+    try:
+        return port.in_waiting
+    except Exception:  # 분리된 포트
+        return 0
+
+
+def run_scenario(name, seed=0, time_scale=1.0):
+    """시나리오 1개 재생 → 결과 dict (현재 프로세스에서 실행)"""
+    spec = SCENARIOS[name]
+    port = FakeSerialPort(spec["sensors"])
+    with quiet():
+        arduino = ArduinoSerial(port=f"SCENARIO:{name}")
+        arduino.serial_connection = port
+        arduino.is_connected = True
+        arduino.connection_time = datetime.now()
+        arduino.start_reading()
+        app = build_app(arduino)
+    callbacks = {mode: tick_callbacks(app, mode) for mode, _label in MODES}
+    cursors = {mode: None for mode, _label in MODES}
+    latencies = {}
+    ticks = []
+    unplug_detect = None
+
+    feeder = ScenarioFeeder(spec, port, seed=seed, time_scale=time_scale)
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    feeder.start()
+    n = 0
+
+    def waiting_unplug():
+        unplugged_at = feeder.unplugged_at
+        return (
+            unplugged_at is not None
+            and unplug_detect is None
+            and time.perf_counter() - unplugged_at < UNPLUG_DETECT_TIMEOUT_SECONDS
+        )
+
+    while feeder.is_alive() or waiting_unplug():
+        n += 1
+        tick_start = time.perf_counter()
+        with quiet():
+            for mode, label in MODES:
+                for cb_name, fn, arg_spec, outputs in callbacks[mode]:
+                    t0 = time.perf_counter()
+                    try:
+                        result = fn(*default_args(arg_spec, mode, n, cursors[mode]))
+                    except PreventUpdate:
+                        result = None
+                    latencies.setdefault(f"{label}:{cb_name}", []).append((time.perf_counter() - t0) * 1000)
+                    if result is not None and DELTA_OUTPUT in outputs:
+                        payload = result[outputs.index(DELTA_OUTPUT)]
+                        cursors[mode] = {"epoch": payload["epoch"], "seq": payload["cursor"]}
+                        arduino.tracer.rendered(payload["epoch"], payload["cursor"])
+        ticks.append((time.perf_counter() - tick_start) * 1000)
+        if feeder.unplugged_at is not None and unplug_detect is None and not arduino.is_healthy():
+            unplug_detect = time.perf_counter() - feeder.unplugged_at
+        time.sleep(max(0.0, TICK_SECONDS - (time.perf_counter() - tick_start)))
+
+    drained_at = time.perf_counter()
+    while _backlog(port) and time.perf_counter() - drained_at < DRAIN_TIMEOUT_SECONDS:
+        time.sleep(0.01)
+    time.sleep(0.05)  # 마지막 읽기 조각 처리 대기
+    drain = time.perf_counter() - drained_at
+    wall = time.perf_counter() - wall0
+    cpu = time.process_time() - cpu0 - feeder.cpu_seconds
+    with quiet():
+        arduino.disconnect()
+    ingest = arduino.get_ingest_metrics()
+    loop, lock = ingest["loop_iteration_seconds"], ingest["lock_wait_seconds"]
+    latency = arduino.get_latency_summary()["all"]
+
+    return {
+        "scenario": name,
+        "desc": spec["desc"],
+        "seed": seed,
+        "time_scale": time_scale,
+        "wall_s": round(wall, 2),
+        "ticks": len(ticks),
+        "lines_sent": feeder.lines_sent,
+        "records_stored": arduino.sensor_data.seq,
+        "max_backlog_kb": round(port.max_backlog / 1024, 1),
+        "drain_s": round(drain, 3),
+        "cpu_percent": round(cpu / wall * 100, 1),
+        "peak_rss_mb": None if peak_rss_mb() is None else round(peak_rss_mb(), 1),
+        "tick_p50_ms": round(percentile(ticks, 50), 2),
+        "tick_p95_ms": round(percentile(ticks, 95), 2),
+        "tick_max_ms": round(max(ticks), 2),
+        "unplug_detect_s": None if unplug_detect is None else round(unplug_detect, 2),
+        "ingest": {
+            "parse_errors": sum(ingest["parse_errors"].values()),
+            "serial_errors": ingest["serial_errors"],
+            "records_evicted": ingest["records_evicted"],
+            "loop_mean_ms": round(loop["sum"] / loop["count"] * 1000, 3) if loop["count"] else None,
+            "lock_wait_total_ms": round(lock["sum"] * 1000, 2),
+        },
+        "latency_ms": {
+            stage: {
+                q: None if latency[stage][q] is None else round(latency[stage][q] * 1000, 2)
+                for q in ("p50", "p95", "p99")
+            }
+            for stage in ("parse", "serve")
+        },
+        "callbacks": {
+            key: {m: v if m == "n" else round(v, 2) for m, v in summarize(values).items()}
+            for key, values in sorted(latencies.items())
+        },
+    }
+
+
+def run_in_child(name, seed, time_scale):
+    """새 프로세스에서 시나리오를 실행 (RSS/CPU/모듈 캐시가 시나리오 간에 섞이지 않도록)"""
+    cmd = [
+        sys.executable,
+        os.path.abspath(__file__),
+        "--child",
+        name,
+        "--seed",
+        str(seed),
+        "--time-scale",
+        str(time_scale),
+    ]
+    proc = subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8", errors="replace")
+    if proc.returncode != 0:
+        raise RuntimeError(f"{name} 실행 실패:\n{proc.stderr[-2000:]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def print_result(r):
+    print(f"\n▶ {r['scenario']} - {r['desc']} (시드 {r['seed']}, 재생 {r['wall_s']}초, tick {r['ticks']}회)")
+    print(
+        f"  수집: 라인 {r['lines_sent']} → 저장 {r['records_stored']}, 최대 적체 {r['max_backlog_kb']} KB, "
+        f"적체 해소 {r['drain_s']}초"
+    )
+    rss = "-" if r["peak_rss_mb"] is None else f"{r['peak_rss_mb']} MB"
+    print(
+        f"  CPU {r['cpu_percent']}%, 최대 RSS {rss}, tick p50/p95/최대 "
+        f"{r['tick_p50_ms']}/{r['tick_p95_ms']}/{r['tick_max_ms']} ms"
+    )
+    ing = r["ingest"]
+    print(
+        f"  수집 지표: 파싱 실패 {ing['parse_errors']}, 시리얼 오류 {ing['serial_errors']}, "
+        f"보관 한도 제거 {ing['records_evicted']}, 읽기 루프 평균 {ing['loop_mean_ms']} ms, "
+        f"잠금 대기 합계 {ing['lock_wait_total_ms']} ms"
+    )
+    lat = r.get("latency_ms")
+    if lat:
+        print(
+            "  측정값 지연 p50/p95/p99: "
+            + ", ".join(f"{stage} {s['p50']}/{s['p95']}/{s['p99']} ms" for stage, s in lat.items())
+        )
+    if r["unplug_detect_s"] is not None or "unplug" in r["scenario"]:
+        print(f"  포트 분리 감지: {r['unplug_detect_s'] if r['unplug_detect_s'] is not None else '미감지'}초")
+    print(f"  {'콜백':<38} | {'p50(ms)':>8} | {'p95(ms)':>8} | {'최대(ms)':>8}")
+    for cb_name, s in r["callbacks"].items():
+        print(f"  {cb_name:<38} | {s['p50']:8.2f} | {s['p95']:8.2f} | {s['max']:8.2f}")
+
+
+def compare(results, baseline):
+    """기준선 대비 회귀 항목 목록"""
+    regressions = []
+    for r in results:
+        base = baseline.get(r["scenario"])
+        if base is None:
+            continue
+        pairs = [(key, r.get(key), base.get(key), floor) for key, floor in COMPARE_KEYS.items()]
+        for cb_name, s in r["callbacks"].items():
+            if cb_name in base.get("callbacks", {}):
+                pairs.append((f"{cb_name} p95", s["p95"], base["callbacks"][cb_name]["p95"], 2.0))
+        for key, now, before, floor in pairs:
+            if now is None or before is None:
+                continue
+            if now > before * REGRESSION_RATIO and now - before > floor:
+                regressions.append(f"{r['scenario']}: {key} {before} → {now}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="부하 시나리오 성능 기준선")
+    parser.add_argument("scenarios", nargs="*", help=f"시나리오 이름 (기본: 전체 - {', '.join(SCENARIOS)})")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--time-scale", type=float, default=1.0, help="재생 시간 배율 (0.5 = 절반 시간에 같은 데이터)"
+    )
+    parser.add_argument("--save", help="결과를 기준선 JSON 으로 저장")
+    parser.add_argument("--compare", help="기준선 JSON 과 비교")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_scenario(args.child, args.seed, args.time_scale), ensure_ascii=False))
+        return 0
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(unknown)}")
+
+    results = []
+    for name in names:
+        result = run_in_child(name, args.seed, args.time_scale)
+        print_result(result)
+        results.append(result)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({r["scenario"]: r for r in results}, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 기준선 저장: {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f))
+        if regressions:
+            print(f"\n⚠️ 기준선 대비 회귀 ({REGRESSION_RATIO}배 초과):")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print("\n✅ 기준선 대비 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
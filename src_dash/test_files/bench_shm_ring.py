@@ -0,0 +1,111 @@
+"""웹 워커 여러 개의 센서 창 조회 벤치마크: 수집기 소켓 vs 공유 메모리 링 (하드웨어 불필요, POSIX)
+
+수집기(CollectorServer)를 이 프로세스에서 실행하고, 수집 스레드가 센서 8개 × 10 Hz 로 측정값을
+계속 추가하는 동안 워커 프로세스 N 개가 최근 300초 창(get_sensor_delta 전체 재전송)을 반복해서 읽습니다.
+
+- socket: CollectorClient 요청 (수집기 data_lock 안에서 복사 → 프레임 직렬화 → 워커에서 복원)
+- shm   : ShmRingReader.delta (잠금 없는 seqlock 읽기, zero-copy view)
+
+출력: 방식별 전체 조회/초, 조회 1건 p50 / p99 (ms), 수집기 프로세스 CPU (초당 CPU 초, 수집 스레드 포함)
+
+실행:
+    python src_dash/test_files/bench_shm_ring.py [워커수] [초] [센서당 점 수]
+"""
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+from bench_common import build_arduino, quiet
+from core.collector_client import CollectorClient
+from core.collector_service import CollectorServer
+from core.shm_ring import ShmRingReader
+
+SENSORS = 8
+
+
+def worker(mode, address, ring_name, seconds, queue):
+    quiet().__enter__()
+    if mode == "shm":
+        reader = ShmRingReader(ring_name)
+        read = reader.delta
+    else:
+        client = CollectorClient(address)
+
+        def read(epoch, since, seconds):  # 공유 메모리 링을 알려도 소켓 요청만 사용
+            return client.request("delta", epoch=epoch, since=since, seconds=seconds)
+
+    samples = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        _, _, _, arrays = read(None, None, 300)
+        samples.append(time.perf_counter() - start)
+        assert len(arrays) == SENSORS
+    queue.put(samples)
+
+
+def ingest(arduino, stop):
+    sid = 0
+    while not stop.is_set():
+        for _ in range(SENSORS):
+            sid = sid % SENSORS + 1
+            arduino._process_line(f"SENSOR_DATA,{sid},{20 + sid / 10:.2f},{int(time.time() * 1000)}")
+        stop.wait(0.1)
+
+
+def run(mode, workers, seconds, address, ring_name):
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    procs = [
+        ctx.Process(target=worker, args=(mode, address, ring_name, seconds, queue)) for _ in range(workers)
+    ]
+    for p in procs:
+        p.start()
+    cpu = time.process_time()
+    samples = np.concatenate([queue.get(timeout=seconds + 60) for _ in procs]) * 1000
+    cpu = time.process_time() - cpu
+    for p in procs:
+        p.join()
+    print(
+        f"{mode:>6}: {len(samples) / seconds:10.0f} 조회/초  "
+        f"p50 {np.percentile(samples, 50):7.3f} ms  p99 {np.percentile(samples, 99):7.3f} ms  "
+        f"수집기 CPU {cpu / seconds:5.2f}"
+    )
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+    points = int(sys.argv[3]) if len(sys.argv) > 3 else 300
+
+    with quiet():
+        arduino = build_arduino(points * SENSORS, sensors=SENSORS)
+        arduino.connection_time = datetime.now()
+        ring_name = arduino.enable_shared_ring()
+        address = os.path.join(tempfile.mkdtemp(), "bench.sock")
+        server = CollectorServer(arduino, address)
+        server.start()
+    stop = threading.Event()
+    threading.Thread(target=ingest, args=(arduino, stop), daemon=True).start()
+
+    print(
+        f"워커 {workers}개, {seconds:.0f}초, 센서 {SENSORS}개 × {points}점 창 "
+        f"(수집 {SENSORS * 10} 건/초 진행 중)"
+    )
+    try:
+        for mode in ("socket", "shm"):
+            run(mode, workers, seconds, address, ring_name)
+    finally:
+        stop.set()
+        server.shutdown()
+        arduino.close_shared_ring()
+
+
+if __name__ == "__main__":
+    main()
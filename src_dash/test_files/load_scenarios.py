@@ -0,0 +1,211 @@
+"""
+부하 시나리오 정의 + 가짜 시리얼 포트 (하드웨어 불필요)
+
+FakeSerialPort 는 pySerial 의 Serial 중 ArduinoSerial 이 사용하는 부분(is_open / in_waiting / read /
+write / close / reset_*_buffer)만 흉내 냅니다. ArduinoSerial.serial_connection 에 넣고 start_reading()
+을 호출하면 실제 읽기 루프(바이트 디코딩 → 라인 분리 → JSON/CSV 파싱 → 수집 저장소)가 그대로 동작합니다.
+
+ScenarioFeeder 는 시나리오의 가상 시간축을 따라 펌웨어와 같은 형식의 라인을 만들어 벽시계 기준으로
+포트에 밀어 넣습니다. 라인 내용은 시드로 고정되므로 같은 시나리오는 항상 같은 입력을 만듭니다
+(도착 시각 타임스탬프는 수신 측이 찍으므로 실행마다 다름).
+
+시나리오 항목:
+    sensors / rate_hz / virtual_seconds / wall_seconds : 센서 수, 센서당 측정 빈도, 가상 구간, 재생 시간
+    format       : "json" 또는 "csv" (펌웨어 통신 모드)
+    flapping     : 연결이 끊겼다 붙었다 하는 센서 ID 목록 (flap_period 초 간격, -127 / disconnected)
+    glitch_85    : 측정마다 85.0°C (DS18B20 전원 리셋 값) 가 섞일 확률
+    unplug_at    : 재생 진행률(0~1) 이 이 값에 도달하면 포트 분리 (이후 read 시 SerialException)
+"""
+
+import json
+import math
+import random
+import threading
+import time
+
+import serial
+
+SCENARIOS = {
+    "day_compressed": {
+        "desc": "센서 8개 1 Hz, 24시간 → 60초 압축 재생",
+        "sensors": 8,
+        "rate_hz": 1.0,
+        "virtual_seconds": 24 * 3600,
+        "wall_seconds": 60.0,
+    },
+    "burst_64": {
+        "desc": "센서 64개 10 Hz 버스트 (CSV 모드)",
+        "sensors": 64,
+        "rate_hz": 10.0,
+        "virtual_seconds": 15,
+        "wall_seconds": 15.0,
+        "format": "csv",
+    },
+    "flapping_glitch": {
+        "desc": "센서 2개 연결 끊김 반복 + 85°C 리셋 글리치",
+        "sensors": 8,
+        "rate_hz": 1.0,
+        "virtual_seconds": 600,
+        "wall_seconds": 20.0,
+        "flapping": (3, 6),
+        "flap_period": 7,
+        "glitch_85": 0.02,
+    },
+    "unplug": {
+        "desc": "스트리밍 중 포트 분리 (중간 지점)",
+        "sensors": 8,
+        "rate_hz": 1.0,
+        "virtual_seconds": 120,
+        "wall_seconds": 20.0,
+        "unplug_at": 0.5,
+    },
+}
+
+# 포트 공급 주기(초): 이 간격마다 그때까지 밀린 가상 step 을 한 번에 공급
+FEED_INTERVAL_SECONDS = 0.02
+DISCONNECTED_C = -127.0
+POWER_ON_RESET_C = 85.0
+
+
+def sensor_rom(sensor_id):
+    b = sensor_id & 0xFF
+    return f"28:FF:{b:02X}:1E:{b:02X}:16:{b:02X}:3C"
+
+
+class FakeSerialPort:
+    """pySerial Serial 대용 메모리 포트 (스레드 안전)"""
+
+    def __init__(self, sensors=8):
+        self.sensors = sensors
+        self.is_open = True
+        self.unplugged = False
+        self.bytes_in = 0
+        self.max_backlog = 0
+        self.written = []
+        self._buf = bytearray()
+        self._lock = threading.Lock()
+
+    def feed(self, data):
+        with self._lock:
+            if self.unplugged:
+                return
+            self._buf += data
+            self.bytes_in += len(data)
+            self.max_backlog = max(self.max_backlog, len(self._buf))
+
+    def _check(self):
+        if self.unplugged:
+            # 장치가 사라지면 핸들도 닫힌 상태가 됨
+            self.is_open = False
+            raise serial.SerialException("device disconnected")
+
+    @property
+    def in_waiting(self):
+        self._check()
+        with self._lock:
+            return len(self._buf)
+
+    def read(self, size=1):
+        self._check()
+        with self._lock:
+            data = bytes(self._buf[:size])
+            del self._buf[:size]
+            return data
+
+    def write(self, data):
+        self._check()
+        line = data.decode("utf-8", errors="ignore").strip()
+        self.written.append(line)
+        if line == "SCAN_SENSORS":
+            # 펌웨어의 주소 스캔 응답 형식
+            self.feed(
+                "".join(
+                    f"SYSTEM,SENSOR_{i}_ADDRESS_{sensor_rom(i)}\n" for i in range(1, self.sensors + 1)
+                ).encode()
+            )
+        return len(data)
+
+    def unplug(self):
+        with self._lock:
+            self.unplugged = True
+            self._buf.clear()
+
+    def close(self):
+        self.is_open = False
+
+    def reset_input_buffer(self):
+        with self._lock:
+            self._buf.clear()
+
+    def reset_output_buffer(self):
+        pass
+
+
+def sensor_lines(spec, step, rng):
+    """가상 step 의 센서별 측정 라인 (펌웨어 출력 형식)"""
+    sensors, rate = spec["sensors"], spec["rate_hz"]
+    t = step / rate
+    flapping = set(spec.get("flapping", ()))
+    period = spec.get("flap_period", 10)
+    glitch = spec.get("glitch_85", 0.0)
+    csv = spec.get("format", "json") == "csv"
+    lines = []
+    for sid in range(1, sensors + 1):
+        # 일교차(24시간 주기) + 센서별 오프셋 + 노이즈
+        temp = 22.0 + sid * 0.5 + 4.0 * math.sin(2 * math.pi * t / 86400 + sid) + rng.gauss(0.0, 0.05)
+        status = "ok"
+        if sid in flapping and int(t // period) % 2:
+            temp, status = DISCONNECTED_C, "disconnected"
+        elif glitch and rng.random() < glitch:
+            temp = POWER_ON_RESET_C
+        ms = int(t * 1000)
+        if csv:
+            lines.append(f"SENSOR_DATA,{sid},{temp:.2f},{ms}")
+        else:
+            record = {"type": "sensor", "timestamp": ms, "id": sid, "temp": round(temp, 2), "status": status}
+            lines.append(json.dumps(record))
+    return lines
+
+
+class ScenarioFeeder(threading.Thread):
+    """시나리오 라인을 벽시계 속도에 맞춰 포트에 공급하는 스레드"""
+
+    def __init__(self, spec, port, seed=0, time_scale=1.0):
+        super().__init__(daemon=True)
+        self.spec = spec
+        self.port = port
+        self.seed = seed
+        # time_scale: 재생 시간 배율 (0.5 = 같은 데이터를 절반 시간에, 2 = 두 배 시간에)
+        self.wall_seconds = spec["wall_seconds"] * time_scale
+        self.total_steps = int(spec["virtual_seconds"] * spec["rate_hz"])
+        self.lines_sent = 0
+        self.unplugged_at = None
+        # 라인 생성에 쓴 CPU 시간 (앱 CPU 사용률에서 제외)
+        self.cpu_seconds = 0.0
+        self.stop_event = threading.Event()
+
+    def run(self):
+        cpu0 = time.thread_time()
+        rng = random.Random(self.seed)
+        unplug_step = int(self.total_steps * self.spec["unplug_at"]) if "unplug_at" in self.spec else None
+        start = time.perf_counter()
+        per_step = self.wall_seconds / max(1, self.total_steps)
+        step = 0
+        while step < self.total_steps and not self.stop_event.is_set():
+            due = min(self.total_steps, int((time.perf_counter() - start) / per_step) + 1)
+            chunk = []
+            while step < due:
+                if step == unplug_step:
+                    break
+                chunk.extend(sensor_lines(self.spec, step, rng))
+                step += 1
+            if chunk and not self.port.unplugged:
+                self.port.feed(("\n".join(chunk) + "\n").encode())
+                self.lines_sent += len(chunk)
+            self.cpu_seconds = time.thread_time() - cpu0
+            if step == unplug_step:
+                # 분리 후에는 보낼 곳이 없으므로 남은 단계를 만들지 않고 종료
+                self.port.unplug()
+                self.unplugged_at = time.perf_counter()
+                return
+            time.sleep(FEED_INTERVAL_SECONDS)
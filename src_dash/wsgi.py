@@ -0,0 +1,53 @@
+"""DS18B20 대시보드 운영 서빙 진입점 (WSGI)
+
+debug 를 끄고 응답 압축을 켠 app.server 를 `server` 로 제공합니다 (설정: core/serving.py).
+
+    python -m src_dash.wsgi                      # waitress, 127.0.0.1:8050, 스레드 DASHBOARD_THREADS
+    python -m src_dash.wsgi --host 0.0.0.0 --threads 8
+    waitress-serve --threads=8 --port=8050 src_dash.wsgi:server
+    gunicorn -w 1 --threads 8 -b 127.0.0.1:8050 src_dash.wsgi:server     # POSIX
+
+워커 프로세스를 여러 개 띄우면 프로세스마다 시리얼 포트를 열려고 하므로, -w 2 이상은 수집기를 분리하고
+(DASHBOARD_COLLECTOR, `python -m src_dash.collector --shm`) 실행합니다.
+"""
+
+import argparse
+import atexit
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from app import app, arduino, fleet  # noqa: E402
+from core import cleanup_arduino_resources  # noqa: E402
+from core.serving import DEFAULT_HOST, DEFAULT_PORT, prepare_production, serve, server_threads  # noqa: E402
+
+COMPRESSION = prepare_production(app)
+server = app.server
+
+
+@atexit.register
+def _cleanup():
+    if fleet is not None:
+        fleet.stop()
+    cleanup_arduino_resources(arduino)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="DS18B20 대시보드 운영 서버")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--threads", type=int, default=server_threads(), help="요청 처리 스레드 수")
+    args = parser.parse_args(argv)
+    print(f"🗜️ 응답 압축: {COMPRESSION}")
+    try:
+        serve(app, args.host, args.port, args.threads)
+    except KeyboardInterrupt:
+        print("\n🛑 사용자가 애플리케이션을 종료했습니다")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())